@@ -2,7 +2,7 @@ __version__ = "0.1.0"
 
 __banner__ = r"""
 ___________________________________________
-|   cli is not supported in this version  |
+|   run `amojowrapper --help` for usage   |
 | src: github.com/tmedvedevv/amojowrapper |
 ===========================================
                              \
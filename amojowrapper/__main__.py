@@ -1,9 +1,268 @@
+import argparse
+import contextlib
+import importlib
+import os
+import sys
+from typing import Optional
+
 from amojowrapper import __banner__
 
+# Requests per second per scope of export-history, well under amojo throttling
+EXPORT_RATE = 5.0
+# Requests per second per scope of import-chats, for the same reason
+IMPORT_RATE = 5.0
+
+
+def load_handler(spec: str):
+    """
+    Imports a handler given as "[event_type=]module:function".
+
+    :param spec: The handler specification, e.g. "message=myapp.hooks:on_message".
+    :return: A tuple of the event type ("*" if omitted) and the handler.
+    """
+    event_type, _, target = spec.rpartition("=")
+    module_name, _, attribute = target.partition(":")
+    if not module_name or not attribute:
+        raise argparse.ArgumentTypeError(
+            f"invalid handler {spec!r}, expected [event_type=]module:function"
+        )
+    return event_type or "*", getattr(importlib.import_module(module_name), attribute)
+
+
+def serve_webhooks(args: argparse.Namespace) -> None:
+    """Runs the embedded webhook receiver."""
+    from amojowrapper.webhook import WebhookDispatcher, WebhookServer
+
+    if not args.secret:
+        raise SystemExit("channel secret is required: --secret or AMOJO_CHANNEL_SECRET")
+
+    dispatcher = WebhookDispatcher(workers=args.workers, queue_size=args.queue_size)
+    for event_type, handler in args.handler:
+        dispatcher.add_handler(event_type, handler)
+
+    server = WebhookServer(
+        channel_secret=args.secret,
+        dispatcher=dispatcher,
+        host=args.host,
+        port=args.port,
+        path=args.path,
+    )
+    print(
+        f"amojowrapper: receiving webhooks on http://{args.host}:{args.port}{args.path}"
+    )
+    server.run()
+
+
+def add_client_arguments(
+    parser: argparse.ArgumentParser, default_rate: Optional[float] = None
+) -> None:
+    """Adds the channel credentials options, read from the environment by default."""
+    for option, variable, help_text in (
+        ("--secret", "AMOJO_CHANNEL_SECRET", "channel secret"),
+        ("--channel-id", "AMOJO_CHANNEL_ID", "channel id"),
+        ("--account-token", "AMOJO_ACCOUNT_TOKEN", "amojo account token"),
+        ("--referer", "AMOJO_REFERER", "account domain, e.g. example.amocrm.ru"),
+    ):
+        parser.add_argument(
+            option,
+            default=os.environ.get(variable),
+            help=f"{help_text} (defaults to ${variable})",
+        )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=default_rate,
+        help="maximum requests per second, 0 for no limit"
+        + (f" (defaults to {default_rate:g})" if default_rate else ""),
+    )
+
+
+def create_client(args: argparse.Namespace):
+    """Creates an AmojoClient from the credentials options."""
+    from amojowrapper.client import AmojoClient
+    from amojowrapper.request import RateLimiter, RetryPolicy
+
+    missing = [
+        option
+        for option, value in (
+            ("--secret", args.secret),
+            ("--channel-id", args.channel_id),
+            ("--account-token", args.account_token),
+            ("--referer", args.referer),
+        )
+        if not value
+    ]
+    if missing:
+        raise SystemExit(f"missing credentials: {', '.join(missing)}")
+
+    return AmojoClient(
+        channel_secret=args.secret,
+        channel_id=args.channel_id,
+        referer=args.referer,
+        amojo_account_token=args.account_token,
+        retry_policy=RetryPolicy(),
+        rate_limiter=RateLimiter(rate=args.rate) if args.rate else None,
+    )
+
+
+def open_input(path: str, newline: Optional[str] = None):
+    """Opens a text file for reading, or returns stdin for "-" (left open)."""
+    if path == "-":
+        return contextlib.nullcontext(sys.stdin)
+    return open(path, encoding="utf-8", newline=newline)
+
+
+def read_lines(path: str):
+    """Yields the non-empty stripped lines of a file, or of stdin for "-"."""
+    with open_input(path) as source:
+        for line in source:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def export_history(args: argparse.Namespace) -> None:
+    """Exports the history of the listed conversations."""
+    from amojowrapper.bulk import HistoryExporter
+
+    def on_progress(stats):
+        done = stats.skipped + stats.completed + stats.failed
+        print(
+            f"\r{done}/{stats.conversations} conversations, "
+            f"{stats.messages} messages, {stats.messages_per_second:.0f} msg/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    with create_client(args) as client:
+        exporter = HistoryExporter(
+            client,
+            output_dir=args.output,
+            record_format=args.format,
+            concurrency=args.concurrency,
+            page_size=args.page_size,
+            on_progress=on_progress,
+        )
+        stats = exporter.export(read_lines(args.ids))
+
+    print(file=sys.stderr)
+    print(
+        f"exported {stats.completed} conversations ({stats.messages} messages) "
+        f"in {stats.elapsed:.1f}s, {stats.messages_per_second:.0f} msg/s; "
+        f"skipped {stats.skipped}, failed {stats.failed}"
+    )
+    if stats.failed:
+        raise SystemExit(1)
+
+
+def import_chats(args: argparse.Namespace) -> None:
+    """Creates the chats listed in a CSV or JSONL file."""
+    from amojowrapper.bulk import ChatImporter, read_chat_records
+
+    record_format = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+
+    def on_progress(stats):
+        print(
+            f"\r{stats.rows} rows, {stats.completed} created, "
+            f"{stats.failed} failed, {stats.rows_per_second:.0f} rows/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    # The csv module reads the raw lines itself, so quoted cells may span lines
+    with create_client(args) as client, open_input(args.input, newline="") as source:
+        importer = ChatImporter(
+            client,
+            checkpoint_path=args.checkpoint,
+            concurrency=args.concurrency,
+            on_progress=on_progress,
+        )
+        stats = importer.run(read_chat_records(source, record_format))
+
+    print(file=sys.stderr)
+    print(
+        f"created {stats.completed} chats in {stats.elapsed:.1f}s, "
+        f"{stats.rows_per_second:.0f} rows/s; "
+        f"skipped {stats.skipped}, failed {stats.failed}"
+    )
+    if stats.failed:
+        raise SystemExit(1)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Creates the command line parser."""
+    parser = argparse.ArgumentParser(prog="amojowrapper")
+    commands = parser.add_subparsers(dest="command")
+
+    webhooks = commands.add_parser(
+        "serve-webhooks", help="receive amojo webhooks and dispatch them to handlers"
+    )
+    webhooks.add_argument(
+        "--secret",
+        default=os.environ.get("AMOJO_CHANNEL_SECRET"),
+        help="channel secret (defaults to $AMOJO_CHANNEL_SECRET)",
+    )
+    webhooks.add_argument("--host", default="0.0.0.0")
+    webhooks.add_argument("--port", type=int, default=8080)
+    webhooks.add_argument("--path", default="/")
+    webhooks.add_argument("--workers", type=int, default=8)
+    webhooks.add_argument("--queue-size", type=int, default=1000)
+    webhooks.add_argument(
+        "--handler",
+        type=load_handler,
+        action="append",
+        default=[],
+        help="handler as [event_type=]module:function, may be repeated",
+    )
+    webhooks.set_defaults(func=serve_webhooks)
+
+    export = commands.add_parser(
+        "export-history", help="export the history of conversations to files"
+    )
+    add_client_arguments(export, default_rate=EXPORT_RATE)
+    export.add_argument(
+        "--ids",
+        required=True,
+        help="file with one conversation ref id per line, - for stdin",
+    )
+    export.add_argument("--output", required=True, help="output directory")
+    export.add_argument("--format", choices=("jsonl", "parquet"), default="jsonl")
+    export.add_argument("--concurrency", type=int, default=8)
+    export.add_argument("--page-size", type=int, default=50)
+    export.set_defaults(func=export_history)
+
+    chats = commands.add_parser(
+        "import-chats", help="create chats from a CSV or JSONL file"
+    )
+    add_client_arguments(chats, default_rate=IMPORT_RATE)
+    chats.add_argument(
+        "--input",
+        required=True,
+        help="file with one chat per row (conversation_id, user_id, user_name, "
+        "...), - for stdin",
+    )
+    chats.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        default=None,
+        help="input format (defaults to csv for .csv files, jsonl otherwise)",
+    )
+    chats.add_argument(
+        "--checkpoint", required=True, help="JSONL file recording the created chats"
+    )
+    chats.add_argument("--concurrency", type=int, default=8)
+    chats.set_defaults(func=import_chats)
+
+    return parser
+
 
-def main():
-    """Main function to print the banner."""
-    print(__banner__)
+def main(argv=None):
+    """Main function: runs a subcommand, or prints the banner without one."""
+    args = create_parser().parse_args(argv)
+    if args.command is None:
+        print(__banner__)
+        return
+    args.func(args)
 
 
 if __name__ == "__main__":
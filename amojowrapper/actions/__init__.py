@@ -1,7 +1,25 @@
-from amojowrapper.actions.channel.action import ChannelAction
-from amojowrapper.actions.chat.action import ChatAction
-from amojowrapper.actions.delivery.action import DeliveryStatusAction
-from amojowrapper.actions.history.action import HistoryAction
-from amojowrapper.actions.message.action import MessageAction
-from amojowrapper.actions.react.action import ReactAction
-from amojowrapper.actions.typing.action import TypingAction
+from amojowrapper.actions.channel.action import ChannelAction, AsyncChannelAction
+from amojowrapper.actions.chat.action import ChatAction, AsyncChatAction
+from amojowrapper.actions.delivery.action import (
+    DeliveryStatusAction,
+    AsyncDeliveryStatusAction,
+)
+from amojowrapper.actions.delivery.pipeline import (
+    DeliveryStatusPipeline,
+    DeliveryPipelineStats,
+)
+from amojowrapper.actions.history.action import HistoryAction, AsyncHistoryAction
+from amojowrapper.actions.message.action import MessageAction, AsyncMessageAction
+from amojowrapper.actions.message.coalescer import EditCoalescer, EditStats
+from amojowrapper.actions.react.action import ReactAction, AsyncReactAction
+from amojowrapper.actions.react.pipeline import (
+    ReactPipeline,
+    ReactResult,
+    ReactStats,
+)
+from amojowrapper.actions.typing.action import TypingAction, AsyncTypingAction
+from amojowrapper.actions.typing.dispatcher import (
+    TypingDispatcher,
+    AsyncTypingDispatcher,
+    TypingStats,
+)
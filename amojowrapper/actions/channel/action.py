@@ -9,9 +9,9 @@ from requests import Response
 from amojowrapper.actions.channel.schemes import ChannelResponseSchema
 
 
-class ChannelAction:
+class AbstractChannelAction:
     """
-    The ChannelAction class provides methods for connecting and disconnecting a channel.
+    Provides the payloads and endpoints shared by the sync and async channel actions.
 
     Attributes:
         client: An instance of AmojoClient for interacting with the API.
@@ -25,17 +25,16 @@ class ChannelAction:
         """
         self.client = client  # amojo_client, instance of the client for API requests
 
-    def connect(
-        self, hook_api_version: str = "v2", title: Optional[str] = None
-    ) -> ChannelResponseSchema:
+    def _build_connect_payload(
+        self, hook_api_version: str, title: Optional[str]
+    ) -> dict:
         """
-        Establish a connection to the channel.
+        Prepare the payload with the necessary data for the connection.
 
-        :param hook_api_version: The version of the hook API to use. Defaults to "v2".
+        :param hook_api_version: The version of the hook API to use.
         :param title: Optional title for the connection.
-        :return: An instance of ChannelResponseSchema containing the response data.
+        :return: The payload dictionary.
         """
-        # Prepare the payload with the necessary data for the connection
         payload = {
             "hook_api_version": hook_api_version,
             "account_id": self.client.amojo_account_token,
@@ -45,10 +44,50 @@ class ChannelAction:
         if title is not None:
             payload["title"] = title
 
+        return payload
+
+    def _build_disconnect_payload(self) -> dict:
+        """
+        Prepare the payload with the account token for disconnection.
+
+        :return: The payload dictionary.
+        """
+        return {"account_id": self.client.amojo_account_token}
+
+    def _endpoint(self, action: str) -> str:
+        """
+        Build the channel endpoint for the given action.
+
+        :param action: Either "connect" or "disconnect".
+        :return: The endpoint path.
+        """
+        return f"/v2/origin/custom/{self.client.channel_id}/{action}"
+
+
+class ChannelAction(AbstractChannelAction):
+    """
+    The ChannelAction class provides methods for connecting and disconnecting a channel.
+
+    Attributes:
+        client: An instance of AmojoClient for interacting with the API.
+    """
+
+    def connect(
+        self, hook_api_version: str = "v2", title: Optional[str] = None
+    ) -> ChannelResponseSchema:
+        """
+        Establish a connection to the channel.
+
+        :param hook_api_version: The version of the hook API to use. Defaults to "v2".
+        :param title: Optional title for the connection.
+        :return: An instance of ChannelResponseSchema containing the response data.
+        """
+        payload = self._build_connect_payload(hook_api_version, title)
+
         # Make a POST request to establish the connection
         response: dict = self.client.custom_request(
             method="POST",
-            endpoint=f"/v2/origin/custom/{self.client.channel_id}/connect",
+            endpoint=self._endpoint("connect"),
             data=payload,
         ).json()
 
@@ -61,15 +100,51 @@ class ChannelAction:
 
         :return: True if the disconnection was successful (status code 200), otherwise False.
         """
-        # Prepare the payload with the account token for disconnection
-        payload = {"account_id": self.client.amojo_account_token}
-
         # Make a DELETE request to disconnect the channel
         response: Response = self.client.custom_request(
             method="DELETE",
-            endpoint=f"/v2/origin/custom/{self.client.channel_id}/disconnect",
-            data=payload,
+            endpoint=self._endpoint("disconnect"),
+            data=self._build_disconnect_payload(),
         )
 
         # Return True if the status code is 200 (successful disconnection)
         return response.status_code == 200
+
+
+class AsyncChannelAction(AbstractChannelAction):
+    """
+    Asynchronous counterpart of ChannelAction for use with AsyncAmojoClient.
+
+    Attributes:
+        client: An instance of AsyncAmojoClient for interacting with the API.
+    """
+
+    async def connect(
+        self, hook_api_version: str = "v2", title: Optional[str] = None
+    ) -> ChannelResponseSchema:
+        """
+        Establish a connection to the channel.
+
+        :param hook_api_version: The version of the hook API to use. Defaults to "v2".
+        :param title: Optional title for the connection.
+        :return: An instance of ChannelResponseSchema containing the response data.
+        """
+        response = await self.client.custom_request(
+            method="POST",
+            endpoint=self._endpoint("connect"),
+            data=self._build_connect_payload(hook_api_version, title),
+        )
+        return ChannelResponseSchema(**response.json())
+
+    async def disconnect(self) -> bool:
+        """
+        Disconnect the channel.
+
+        :return: True if the disconnection was successful (status code 200), otherwise False.
+        """
+        response: Response = await self.client.custom_request(
+            method="DELETE",
+            endpoint=self._endpoint("disconnect"),
+            data=self._build_disconnect_payload(),
+        )
+        return response.status_code == 200
@@ -1,15 +1,20 @@
 import json
+from typing import Optional
+
+from loguru import logger
 
 from amojowrapper.actions.chat.schemes import Source, User, Profile
 from amojowrapper.actions.chat.schemes import ChatRequest, ChatResponse
+from amojowrapper.mapping import ConversationMapping
 
 
-class ChatAction:
+class AbstractChatAction:
     """
     A class to handle chat-related actions such as creating a new chat conversation.
 
     This class provides methods to interact with the Amojo API for chat operations.
-    It initializes with a client and scope_id, and offers a method to create a chat.
+    It initializes with a client and scope_id, and builds the chat creation payload
+    shared by ChatAction and AsyncChatAction.
 
     Attributes:
         client (AmojoClient): The Amojo client instance for interacting with the API.
@@ -26,27 +31,15 @@ class ChatAction:
         # Scope ID is a combination of channel ID and account token
         self.scope_id = f"{self.client.channel_id}_{self.client.amojo_account_token}"
 
-    def create(self, **kwargs) -> ChatResponse:
+    def _build_payload(self, kwargs) -> dict:
         """
-        Creates a new chat conversation with the provided details.
+        Builds the request payload for creating a chat.
 
-        This method takes various optional parameters to create a chat conversation.
         It handles the creation of a `Source` and `Profile` object if certain
-        parameters are provided, and then sends a request to create the chat.
-
-        :param kwargs: Contains optional parameters for creating a chat.
-            Possible parameters include:
-            - conversation_id (str): The ID of the conversation.
-            - source_external_id (str): The external ID for the source of the chat.
-            - user_id (str): The ID of the user participating in the chat.
-            - user_name (str): The name of the user.
-            - user_avatar (str): The URL of the user's avatar.
-            - user_profile_link (str): The link to the user's profile.
-            - user_profile_phone (str): The phone number of the user.
-            - user_profile_email (str): The email of the user.
+        parameters are provided.
 
-        :return: A `ChatResponse` object containing the server's response data,
-            including information about the chat and user.
+        :param kwargs: The same parameters as ChatAction.create.
+        :return: The serialized payload without None values.
         """
         # Handling the source (if external_id is provided, create a Source object)
         external_id = kwargs.get("source_external_id")
@@ -75,14 +68,139 @@ class ChatAction:
         )
 
         # Serialize the payload while excluding None values
-        json_payload = json.loads(payload.model_dump_json(exclude_none=True))
+        return json.loads(payload.model_dump_json(exclude_none=True))
+
+    def _get_known_chat(self, kwargs) -> Optional[ChatResponse]:
+        """
+        Returns the chat from the client's mapping store if it is already known.
+
+        The chat is known when the store holds its ref_id and the client's user
+        ids for the same user_id and user_name. The store keeps only ids and the
+        name, so a changed avatar, profile or source is not detected: pass
+        `refresh=True` to send those to the API.
+
+        :param kwargs: The same parameters as ChatAction.create.
+        :return: A ChatResponse built from the store, or None.
+        """
+        store = getattr(self.client, "mapping_store", None)
+        conversation_id = kwargs.get("conversation_id")
+        if store is None or kwargs.get("refresh") or not conversation_id:
+            return None
+
+        mapping = store.get(self.scope_id, conversation_id)
+        if (
+            mapping is None
+            or not (mapping.ref_id and mapping.user_ref_id and mapping.user_name)
+            or kwargs.get("user_id") not in (None, mapping.user_id)
+            or kwargs.get("user_name") not in (None, mapping.user_name)
+        ):
+            return None
+
+        return ChatResponse(
+            id=mapping.ref_id,
+            user=User(
+                id=mapping.user_ref_id,
+                client_id=mapping.user_id,
+                name=mapping.user_name,
+            ),
+        )
+
+    def _remember_chat(self, kwargs, chat: ChatResponse) -> None:
+        """
+        Stores the ids of a created chat in the client's mapping store.
+
+        The chat already exists at this point, so a failing store is logged
+        instead of failing the call.
+
+        :param kwargs: The same parameters as ChatAction.create.
+        :param chat: The response of the chat API.
+        """
+        store = getattr(self.client, "mapping_store", None)
+        if store is None or not kwargs.get("conversation_id"):
+            return
+        try:
+            store.put(
+                self.scope_id,
+                ConversationMapping(
+                    conversation_id=kwargs["conversation_id"],
+                    ref_id=chat.id,
+                    user_id=chat.user.client_id or kwargs.get("user_id"),
+                    user_ref_id=chat.user.id,
+                    user_name=chat.user.name,
+                ),
+            )
+        except Exception:
+            logger.exception(
+                f"Could not remember the chat of conversation "
+                f"{kwargs['conversation_id']!r}"
+            )
+
+
+class ChatAction(AbstractChatAction):
+    """
+    Creates chat conversations through a blocking AmojoClient.
+    """
+
+    def create(self, **kwargs) -> ChatResponse:
+        """
+        Creates a new chat conversation with the provided details.
+
+        This method takes various optional parameters to create a chat conversation
+        and sends a request to create the chat.
+
+        :param kwargs: Contains optional parameters for creating a chat.
+            Possible parameters include:
+            - conversation_id (str): The ID of the conversation.
+            - source_external_id (str): The external ID for the source of the chat.
+            - user_id (str): The ID of the user participating in the chat.
+            - user_name (str): The name of the user.
+            - user_avatar (str): The URL of the user's avatar.
+            - user_profile_link (str): The link to the user's profile.
+            - user_profile_phone (str): The phone number of the user.
+            - user_profile_email (str): The email of the user.
+            - refresh (bool): Ask the API even if the chat is in the client's
+              mapping store.
+
+        :return: A `ChatResponse` object containing the server's response data,
+            including information about the chat and user.
+        """
+        # Chats already known to the client's mapping store need no request
+        if (chat := self._get_known_chat(kwargs)) is not None:
+            return chat
 
         # Making the POST request to create the chat
         response: dict = self.client.custom_request(
             method="POST",
             endpoint=f"/v2/origin/custom/{self.scope_id}/chats",
-            data=json_payload,
+            data=self._build_payload(kwargs),
         ).json()
 
         # Returning the response as a ChatResponse object
-        return ChatResponse(**response)
+        chat = ChatResponse(**response)
+        self._remember_chat(kwargs, chat)
+        return chat
+
+
+class AsyncChatAction(AbstractChatAction):
+    """
+    Asynchronous counterpart of ChatAction for use with AsyncAmojoClient.
+    """
+
+    async def create(self, **kwargs) -> ChatResponse:
+        """
+        Creates a new chat conversation with the provided details.
+
+        :param kwargs: The same parameters as ChatAction.create.
+        :return: A `ChatResponse` object containing the server's response data.
+        """
+        if (chat := self._get_known_chat(kwargs)) is not None:
+            return chat
+
+        response = await self.client.custom_request(
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self.scope_id}/chats",
+            data=self._build_payload(kwargs),
+        )
+        chat = ChatResponse(**response.json())
+        self._remember_chat(kwargs, chat)
+        return chat
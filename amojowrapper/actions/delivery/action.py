@@ -25,6 +25,9 @@ class AbstractDeliveryStatusAction(DeliveryStatusActionInterface):
     """
     Abstract class that provides common functionality for managing
     delivery status actions.
+
+    Actions keep no per-request state, so one instance can be shared between
+    threads.
     """
 
     def __init__(self, client: Any) -> None:
@@ -35,7 +38,6 @@ class AbstractDeliveryStatusAction(DeliveryStatusActionInterface):
         """
         self.client = client
         self.scope_id = f"{self.client.channel_id}_{self.client.amojo_account_token}"
-        self.msgid = None  # Message ID will be set later
         self._required_fields = {"msgid", "delivery_status", "error_code", "error"}
 
     def _filter_none(self, data: Dict) -> Dict:
@@ -79,6 +81,16 @@ class AbstractDeliveryStatusAction(DeliveryStatusActionInterface):
             exclude_none=True
         )
 
+    def build_body(self, **kwargs) -> Dict:
+        """
+        Builds the request body of a delivery status update without sending it.
+
+        :param kwargs: The same parameters as `set`.
+        :return: The request body.
+        :raises ValueError: If none of the status parameters is provided.
+        """
+        return self._build_payload(kwargs)
+
 
 class DeliveryStatusAction(AbstractDeliveryStatusAction):
     """
@@ -96,12 +108,20 @@ class DeliveryStatusAction(AbstractDeliveryStatusAction):
         # Build the payload using the provided arguments
         payload: dict = self._build_payload(kwargs)
 
-        # Check if msgid is provided, and set it before sending
+        # The msgid is part of the endpoint, so it is required
         if kwargs.get("msgid"):
-            self.msgid = kwargs.get("msgid")
             return self._send(body=payload)
         raise ValueError("msgid not found")
 
+    def send_body(self, body: Dict) -> int:
+        """
+        Sends a request body built by `build_body`.
+
+        :param body: The request body, with a msgid.
+        :return: The HTTP status code from the response.
+        """
+        return self._send(body=body)
+
     def _send(self, body: Dict) -> int:
         """
         Sends the delivery status request to the server.
@@ -114,7 +134,7 @@ class DeliveryStatusAction(AbstractDeliveryStatusAction):
             # Perform the API request to update delivery status
             response = self.client.custom_request(
                 method="POST",
-                endpoint=f"/v2/origin/custom/{self.scope_id}/{self.msgid}/delivery_status",
+                endpoint=f"/v2/origin/custom/{self.scope_id}/{body['msgid']}/delivery_status",
                 data=body,
             )
             # Return True if the status code is 200, indicating success
@@ -127,3 +147,46 @@ class DeliveryStatusAction(AbstractDeliveryStatusAction):
         except Exception:
             # Catch and re-raise any other exceptions
             raise
+
+
+class AsyncDeliveryStatusAction(AbstractDeliveryStatusAction):
+    """
+    Asynchronous counterpart of DeliveryStatusAction for use with AsyncAmojoClient.
+    """
+
+    async def set(self, **kwargs) -> int:
+        """
+        Sets the delivery status for a message, and sends the request to the server.
+
+        :param kwargs: Parameters required to set the delivery status (e.g., msgid, delivery_status).
+        :return: The HTTP status code from the response.
+        :raises ValueError: If the 'msgid' is not provided.
+        """
+        payload: dict = self._build_payload(kwargs)
+
+        if kwargs.get("msgid"):
+            return await self._send(body=payload)
+        raise ValueError("msgid not found")
+
+    async def send_body(self, body: Dict) -> int:
+        """
+        Sends a request body built by `build_body`.
+
+        :param body: The request body, with a msgid.
+        :return: The HTTP status code from the response.
+        """
+        return await self._send(body=body)
+
+    async def _send(self, body: Dict) -> int:
+        """
+        Sends the delivery status request to the server.
+
+        :param body: The payload to send in the request.
+        :return: The HTTP status code from the response (200 if successful).
+        """
+        response = await self.client.custom_request(
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self.scope_id}/{body['msgid']}/delivery_status",
+            data=body,
+        )
+        return response.status_code
@@ -0,0 +1,234 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Any, Dict, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from amojowrapper.actions.delivery.action import DeliveryStatusAction
+
+
+class DeliveryPipelineStats(BaseModel):
+    """
+    Counters of a DeliveryStatusPipeline.
+
+    Attributes:
+        requested (int): Status updates passed to `set`.
+        collapsed (int): Status updates replaced by a later one for the same msgid
+            before being sent.
+        sent (int): Status requests acknowledged by the server.
+        failed (int): Status requests that raised an error.
+        pending (int): Status requests waiting to be sent.
+    """
+
+    requested: int = 0
+    collapsed: int = 0
+    sent: int = 0
+    failed: int = 0
+    pending: int = 0
+
+
+class DeliveryStatusPipeline:
+    """
+    Sends delivery status updates from a background thread, collapsed per msgid.
+
+    `set` validates the update, queues it and returns a Future immediately. Every
+    `flush_interval` seconds, and whenever a request completes, the queued updates
+    are sent through the client (so its rate limiter and retry policy apply), up
+    to `concurrency` requests at a time. A slow request only holds back the later
+    updates of its own msgid: an update is not sent while a request for the same
+    msgid is in flight, so the updates of a msgid are never sent out of order.
+    An update queued while an earlier one for the same msgid is still waiting
+    replaces it: only the latest status is sent and both callers receive the
+    same Future.
+
+    The Futures resolve to the HTTP status code, or raise the request error. With
+    asyncio, await them through `asyncio.wrap_future`.
+
+    Attributes:
+        client: The AmojoClient used to send the status requests.
+        concurrency (int): Maximum number of status requests sent at once.
+        flush_interval (float): Seconds between two flushes of the queue.
+    """
+
+    def __init__(self, client: Any, concurrency: int = 8, flush_interval: float = 0.1):
+        """
+        Initializes the DeliveryStatusPipeline and starts its background thread.
+
+        :param client: The AmojoClient used to send the status requests.
+        :param concurrency: Maximum status requests sent at once. Defaults to 8.
+        :param flush_interval: Seconds between two flushes. Defaults to 0.1.
+        """
+        self.client = client
+        self.concurrency = concurrency
+        self.flush_interval = flush_interval
+
+        self._action = DeliveryStatusAction(client)
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="amojowrapper-delivery"
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[Dict, Future]] = {}
+        self._in_flight: Set[str] = set()
+        self._outstanding: Set[Future] = set()
+        self._stats = DeliveryPipelineStats()
+        self._wake = threading.Event()
+        self._closed = False
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="amojowrapper-delivery-pipeline", daemon=True
+        )
+        self._thread.start()
+
+    def set(self, **kwargs) -> Future:
+        """
+        Queues a delivery status update.
+
+        :param kwargs: The same parameters as DeliveryStatusAction.set.
+        :return: A Future resolving to the HTTP status code of the request.
+        :raises ValueError: If the 'msgid' is not provided.
+        :raises RuntimeError: If the pipeline is closed.
+        """
+        body = self._action.build_body(**kwargs)
+        msgid = body.get("msgid")
+        if not msgid:
+            raise ValueError("msgid not found")
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("the delivery status pipeline is closed")
+            self._stats.requested += 1
+            queued = self._pending.get(msgid)
+            if queued is not None:
+                self._stats.collapsed += 1
+                future = queued[1]
+            else:
+                future = Future()
+                self._outstanding.add(future)
+                self._stats.pending += 1
+            self._pending[msgid] = (body, future)
+        return future
+
+    def _finish(self, msgid: str, future: Future, failed: bool) -> None:
+        """
+        Updates the counters once a request completed. Must be called under the lock.
+        """
+        if failed:
+            self._stats.failed += 1
+        else:
+            self._stats.sent += 1
+        self._stats.pending -= 1
+        self._outstanding.discard(future)
+        self._in_flight.discard(msgid)
+        # The queue may hold a later update of this msgid, or wait for a free slot
+        if self._pending or self._closed:
+            self._wake.set()
+
+    def _send(self, msgid: str, body: Dict, future: Future) -> None:
+        """
+        Sends one status request and resolves its Future.
+        """
+        try:
+            status_code = self._action.send_body(body)
+        except Exception as e:
+            with self._lock:
+                self._finish(msgid, future, failed=True)
+            future.set_exception(e)
+        else:
+            with self._lock:
+                self._finish(msgid, future, failed=False)
+            future.set_result(status_code)
+
+    def _flush_once(self) -> None:
+        """
+        Sends the queued updates whose msgid has no request in flight, up to the
+        free request slots.
+        """
+        ready = []
+        with self._lock:
+            if self._stopped:
+                return
+            slots = self.concurrency - len(self._in_flight)
+            for msgid in list(self._pending):
+                if slots <= 0:
+                    break
+                if msgid in self._in_flight:
+                    continue
+                body, future = self._pending.pop(msgid)
+                self._in_flight.add(msgid)
+                ready.append((msgid, body, future))
+                slots -= 1
+            for msgid, body, future in ready:
+                self._executor.submit(self._send, msgid, body, future)
+
+    def _run(self) -> None:
+        """
+        The background loop flushing the queue.
+        """
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._flush_once()
+            with self._lock:
+                if self._stopped or (
+                    self._closed and not self._pending and not self._in_flight
+                ):
+                    return
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sends the queued updates now and waits for the outcome of every update
+        queued or in flight.
+
+        :param timeout: Seconds to wait (optional).
+        :return: True if every queued update completed within the timeout.
+        """
+        with self._lock:
+            futures = list(self._outstanding)
+        self._wake.set()
+        _, not_done = wait_futures(futures, timeout)
+        return not not_done
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Sends the queued updates and stops the background thread.
+
+        If the timeout expires first, the updates still queued are not sent and
+        their Futures raise RuntimeError. Requests already in flight are not
+        interrupted: they complete in the background and resolve their Futures.
+
+        :param timeout: Seconds to wait for the queued updates to be sent.
+        """
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+        # Stopping under the lock guarantees that nothing is submitted anymore
+        with self._lock:
+            self._stopped = True
+            unsent, self._pending = self._pending, {}
+            self._stats.failed += len(unsent)
+            self._stats.pending -= len(unsent)
+            for _, future in unsent.values():
+                self._outstanding.discard(future)
+        for _, future in unsent.values():
+            future.set_exception(
+                RuntimeError("the delivery status pipeline closed before sending")
+            )
+        self._executor.shutdown(wait=timeout is None)
+
+    def stats(self) -> DeliveryPipelineStats:
+        """
+        Returns a snapshot of the pipeline counters.
+
+        :return: An instance of DeliveryPipelineStats.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
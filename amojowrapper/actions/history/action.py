@@ -1,8 +1,8 @@
 import json
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
 
-from amojowrapper.actions.history.schemes import HistoryResponse
+from amojowrapper.actions.history.schemes import HistoryResponse, MessageItem
 
 
 class HistoryActionInterface(ABC):
@@ -46,6 +46,61 @@ class AbstractHistoryAction(HistoryActionInterface):
         self.client = client
         self.scope_id = f"{self.client.channel_id}_{self.client.amojo_account_token}"
 
+    def _endpoint(
+        self,
+        conversation_ref_id: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> str:
+        """
+        Builds the history endpoint, with paging parameters if given.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :param offset: The number of the newest messages to skip.
+        :param limit: The maximum number of messages to return.
+        :return: The endpoint path.
+        """
+        endpoint = (
+            f"/v2/origin/custom/{self.scope_id}/chats/{conversation_ref_id}/history"
+        )
+        if limit is not None:
+            endpoint += f"?offset={offset or 0}&limit={limit}"
+        return endpoint
+
+    @staticmethod
+    def _check_page_size(page_size: int) -> None:
+        """
+        Validates the page size of a paginated read.
+
+        :param page_size: The requested page size.
+        :raises ValueError: If the page size is less than 1.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+    @staticmethod
+    def _parse_page(
+        content: bytes, page_size: int, since: Optional[int]
+    ) -> Tuple[List[MessageItem], bool]:
+        """
+        Parses one page of history and tells whether more pages may follow.
+
+        The chat API returns the newest messages first, so once a message older
+        than `since` is seen the following pages are not needed.
+
+        :param content: The raw response body.
+        :param page_size: The requested page size.
+        :param since: The oldest timestamp to return, if any.
+        :return: The messages to yield and whether to fetch the next page.
+        """
+        messages = HistoryResponse.model_validate_json(content).messages
+        has_more = len(messages) >= page_size
+        if since is not None:
+            recent = [item for item in messages if item.timestamp >= since]
+            if len(recent) < len(messages):
+                return recent, False
+        return messages, has_more
+
 
 class HistoryAction(AbstractHistoryAction):
     """
@@ -79,3 +134,114 @@ class HistoryAction(AbstractHistoryAction):
 
         except (json.JSONDecodeError, Exception) as e:
             raise RuntimeError(f"Failed to retrieve chat history: {e}") from e
+
+    def iter_messages(
+        self,
+        conversation_ref_id: str,
+        page_size: int = 50,
+        since: Optional[int] = None,
+    ) -> Iterator[MessageItem]:
+        """
+        Lazily pages through the chat history, newest messages first.
+
+        Each page is requested only when the previous one has been consumed, so
+        breaking out of the loop stops the download.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :param page_size: Number of messages requested per page. Defaults to 50.
+        :param since: Stop at messages older than this Unix timestamp (optional).
+        :return: An iterator of MessageItem.
+        :raises ValueError: If page_size is less than 1.
+        :raises RuntimeError: If a request fails or a page is invalid.
+        """
+        self._check_page_size(page_size)
+        offset = 0
+        while True:
+            try:
+                response = self.client.custom_request(
+                    method="GET",
+                    endpoint=self._endpoint(conversation_ref_id, offset, page_size),
+                )
+                messages, has_more = self._parse_page(
+                    response.content, page_size, since
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to retrieve chat history: {e}") from e
+
+            yield from messages
+            if not has_more:
+                return
+            offset += page_size
+
+
+class AsyncHistoryAction(AbstractHistoryAction):
+    """
+    Asynchronous counterpart of HistoryAction for use with AsyncAmojoClient.
+    """
+
+    async def get(self, **kwargs) -> HistoryResponse:
+        """
+        Retrieves the chat history for a given conversation.
+
+        :param kwargs: Additional parameters for the request.
+        :return: The response from the server.
+        """
+        conversation_ref_id: str = kwargs.get("conversation_ref_id")
+        return await self._send(conversation_ref_id=conversation_ref_id)
+
+    async def _send(self, conversation_ref_id: str) -> HistoryResponse:
+        """
+        Sends the request to retrieve chat history.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :return: The response from the server.
+        :raises RuntimeError: If the request fails or response is invalid.
+        """
+        try:
+            response = await self.client.custom_request(
+                method="GET",
+                endpoint=f"/v2/origin/custom/{self.scope_id}/chats/{conversation_ref_id}/history",
+            )
+            return HistoryResponse(**response.json())
+
+        except (json.JSONDecodeError, Exception) as e:
+            raise RuntimeError(f"Failed to retrieve chat history: {e}") from e
+
+    async def iter_messages(
+        self,
+        conversation_ref_id: str,
+        page_size: int = 50,
+        since: Optional[int] = None,
+    ) -> AsyncIterator[MessageItem]:
+        """
+        Lazily pages through the chat history, newest messages first.
+
+        Each page is requested only when the previous one has been consumed, so
+        breaking out of the loop stops the download.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :param page_size: Number of messages requested per page. Defaults to 50.
+        :param since: Stop at messages older than this Unix timestamp (optional).
+        :return: An async iterator of MessageItem.
+        :raises ValueError: If page_size is less than 1.
+        :raises RuntimeError: If a request fails or a page is invalid.
+        """
+        self._check_page_size(page_size)
+        offset = 0
+        while True:
+            try:
+                response = await self.client.custom_request(
+                    method="GET",
+                    endpoint=self._endpoint(conversation_ref_id, offset, page_size),
+                )
+                messages, has_more = self._parse_page(
+                    response.content, page_size, since
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to retrieve chat history: {e}") from e
+
+            for item in messages:
+                yield item
+            if not has_more:
+                return
+            offset += page_size
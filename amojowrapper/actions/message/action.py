@@ -1,18 +1,21 @@
+import asyncio
 import json
 import uuid
 import datetime
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+
+from loguru import logger
 
 from amojowrapper.actions.message.schemes import (
-    Payload,
-    Message,
-    Source,
-    SenderReceiver,
     MessageResponse,
     RequestModel,
-    ReplyTo,
+    SendResult,
 )
+from amojowrapper.mapping import ConversationMapping
+
+ValidationLevel = Literal["strict", "trusted"]
 
 
 class MessageActionInterface(ABC):
@@ -34,16 +37,28 @@ class MessageActionInterface(ABC):
 class AbstractMessageAction(MessageActionInterface):
     """
     Abstract class providing common functionality for message actions.
+
+    The components of a message are built as plain dictionaries and the request
+    body is validated at most once, right before it is sent:
+        - "strict" validates the whole body against RequestModel in one pass;
+        - "trusted" skips Pydantic entirely for callers that already pass
+          well-formed data and need the cheapest possible build.
     """
 
-    def __init__(self, client: Any):
+    def __init__(self, client: Any, validation: ValidationLevel = "strict"):
         """
         Initializes the instance with a client and scope_id.
 
         :param client: The client used to interact with the API.
+        :param validation: The validation level, "strict" or "trusted". Defaults to "strict".
+        :raises ValueError: If the validation level is unknown.
         """
+        if validation not in ("strict", "trusted"):
+            raise ValueError(f"Unknown validation level: {validation}")
+
         self.client = client
         self.scope_id = f"{self.client.channel_id}_{self.client.amojo_account_token}"
+        self.validation = validation
         self._required_fields = {"conversation_id", "conversation_ref_id"}
 
     def _filter_none(self, data: Dict) -> Dict:
@@ -112,9 +127,7 @@ class AbstractMessageAction(MessageActionInterface):
         if payload["location"]["lon"] is None and payload["location"]["lat"] is None:
             payload.pop("location")
 
-        message_data = self._filter_none(payload)
-
-        return Message(**message_data).model_dump(exclude_none=True)
+        return self._filter_none(payload)
 
     def _create_source(self, kwargs: Dict) -> Optional[Dict]:
         """
@@ -124,7 +137,7 @@ class AbstractMessageAction(MessageActionInterface):
         :return: Dictionary representing the source, or None if no external_id is provided.
         """
         if external_id := kwargs.get("source_external_id"):
-            return Source(external_id=external_id).model_dump(exclude_none=True)
+            return {"external_id": external_id}
         return None
 
     def _create_sender(self, kwargs: Dict) -> Dict:
@@ -146,7 +159,7 @@ class AbstractMessageAction(MessageActionInterface):
         if bool(profile) is False:
             profile = None
 
-        sender_data = self._filter_none(
+        return self._filter_none(
             {
                 "id": kwargs.get("sender_id"),
                 "ref_id": kwargs.get("sender_ref_id"),
@@ -156,7 +169,6 @@ class AbstractMessageAction(MessageActionInterface):
                 "profile_link": kwargs.get("sender_profile_link"),
             }
         )
-        return SenderReceiver(**sender_data).model_dump(exclude_none=True)
 
     def _create_receiver(self, kwargs: Dict) -> Optional[Dict]:
         """
@@ -175,7 +187,7 @@ class AbstractMessageAction(MessageActionInterface):
         if not receiver_data.get("ref_id") and not receiver_data.get("id"):
             return None
 
-        return SenderReceiver(**receiver_data).model_dump(exclude_none=True)
+        return receiver_data
 
     def _create_reply_to(self, kwargs: Dict) -> Optional[Dict]:
         """
@@ -188,10 +200,10 @@ class AbstractMessageAction(MessageActionInterface):
         :return: Optional[Dict]: A dictionary representing the reply_to message, or None if neither key is provided.
         """
         if msg_id := kwargs.get("reply_to_ref_msgid"):
-            return ReplyTo(message={"id": msg_id}).model_dump(exclude_none=True)
+            return {"message": {"id": msg_id}}
 
         if msg_id := kwargs.get("reply_to_msgid"):
-            return ReplyTo(message={"msgid": msg_id}).model_dump(exclude_none=True)
+            return {"message": {"msgid": msg_id}}
 
         return None
 
@@ -217,13 +229,17 @@ class AbstractMessageAction(MessageActionInterface):
         """
         self._validate_conversation_params(kwargs)
 
+        conversation_ref_id = kwargs.get("conversation_ref_id")
+        if not conversation_ref_id and kwargs.get("conversation_id"):
+            conversation_ref_id = self._resolve_ref_id(kwargs["conversation_id"])
+
         payload_data = {
             "timestamp": kwargs.get("timestamp") or self._get_timestamp(),
             "msec_timestamp": kwargs.get("msec_timestamp")
             or self._get_msec_timestamp(),
             "msgid": kwargs.get("msgid") or self._generate_uid("amojowrapper_msgid_"),
             "conversation_id": kwargs.get("conversation_id"),
-            "conversation_ref_id": kwargs.get("conversation_ref_id"),
+            "conversation_ref_id": conversation_ref_id,
             "silent": kwargs.get("silent", False),
             "message": components.get("message"),
             "sender": components.get("sender"),
@@ -232,7 +248,174 @@ class AbstractMessageAction(MessageActionInterface):
             "reply_to": components.get("reply_to"),
         }
 
-        return Payload(**self._filter_none(payload_data)).model_dump(exclude_none=True)
+        return self._filter_none(payload_data)
+
+    def _resolve_ref_id(self, conversation_id: str) -> Optional[str]:
+        """
+        Looks up the chat API id of a conversation in the client's mapping store.
+
+        :param conversation_id: The conversation id on the integration side.
+        :return: The conversation ref_id, or None if unknown.
+        """
+        store = getattr(self.client, "mapping_store", None)
+        if store is None:
+            return None
+        mapping = store.get(self.scope_id, conversation_id)
+        return mapping.ref_id if mapping is not None else None
+
+    def _remember_conversation(self, body: Dict, response: MessageResponse) -> None:
+        """
+        Stores the chat API id of the conversation returned for a new message.
+
+        The message is already delivered at this point, so a failing store is
+        logged instead of failing the send.
+
+        :param body: The sent request body.
+        :param response: The response of the chat API.
+        """
+        store = getattr(self.client, "mapping_store", None)
+        conversation_id = body["payload"].get("conversation_id")
+        ref_id = response.new_message.conversation_id
+        if store is None or not conversation_id or not ref_id:
+            return
+        try:
+            store.put(
+                self.scope_id,
+                ConversationMapping(conversation_id=conversation_id, ref_id=ref_id),
+            )
+        except Exception:
+            logger.exception(
+                f"Could not remember the ref_id of conversation {conversation_id!r}"
+            )
+
+    def _create_send_components(self, kwargs: Dict) -> Dict:
+        """
+        Creates all the components of a new message.
+
+        :param kwargs: Arguments for sending the message.
+        :return: Dictionary with message, source, sender, receiver and reply_to.
+        """
+        return {
+            "message": self._create_message(kwargs),
+            "source": self._create_source(kwargs),
+            "sender": self._create_sender(kwargs),
+            "receiver": self._create_receiver(kwargs),
+            "reply_to": self._create_reply_to(kwargs),
+        }
+
+    def _create_edit_components(self, kwargs: Dict) -> Dict:
+        """
+        Creates the components of an edited message.
+
+        :param kwargs: Arguments for editing the message.
+        :return: Dictionary with the message component.
+        """
+        return {"message": self._create_message(kwargs)}
+
+    def _build_request_body(self, event_type: str, kwargs: Dict, **components) -> Dict:
+        """
+        Builds the request body for the given event type.
+
+        With the "strict" validation level the body is validated against
+        RequestModel once and dumped once; with "trusted" it is returned as is.
+
+        :param event_type: Either "new_message" or "edit_message".
+        :param kwargs: Arguments for building the payload.
+        :param components: Pre-built components (message, source, sender, receiver, reply_to).
+        :return: Dictionary representing the request body.
+        """
+        body = {
+            "event_type": event_type,
+            "payload": self._build_payload(kwargs, **components),
+        }
+
+        if self.validation == "trusted":
+            return body
+
+        return RequestModel.model_validate(body).model_dump(exclude_none=True)
+
+    def build_send_body(self, **kwargs) -> Dict:
+        """
+        Builds the request body of a new message without sending it.
+
+        :param kwargs: The same arguments as `send`.
+        :return: The request body, with a msgid generated if not given.
+        """
+        components = self._create_send_components(kwargs)
+        return self._build_request_body("new_message", kwargs, **components)
+
+    def build_edit_body(self, **kwargs) -> Dict:
+        """
+        Builds the request body of a message edit without sending it.
+
+        :param kwargs: The same arguments as `edit`.
+        :return: The request body.
+        """
+        components = self._create_edit_components(kwargs)
+        return self._build_request_body("edit_message", kwargs, **components)
+
+    def _prepare_batch(
+        self, messages: Iterable[Dict]
+    ) -> Tuple[List[SendResult], List[List[Tuple[SendResult, Dict]]]]:
+        """
+        Builds the request bodies of a batch up front and groups them by conversation.
+
+        Messages whose body cannot be built get their error recorded right away and
+        are not sent. The order of messages within each group is preserved.
+
+        Messages sharing a conversation_id or a conversation_ref_id belong to the
+        same conversation; the ref_id of a message given only a conversation_id is
+        resolved from the client's mapping store. A conversation referred to by
+        its conversation_id alone in some messages and by its conversation_ref_id
+        alone in others, with no mapping known and no message giving both, cannot
+        be recognized and is sent as two conversations, without ordering between
+        them. Refer to a conversation by the same id for its messages to be
+        ordered.
+
+        :param messages: An iterable of keyword argument dictionaries for send().
+        :return: The results in input order and the per-conversation send queues.
+        """
+        results: List[SendResult] = []
+        prepared: List[Tuple[SendResult, Dict, str]] = []
+        # The ids known to name the same conversation, linked to one root id
+        parents: Dict[str, str] = {}
+
+        def find(key: str) -> str:
+            parents.setdefault(key, key)
+            while parents[key] != key:
+                parents[key] = parents[parents[key]]
+                key = parents[key]
+            return key
+
+        for index, kwargs in enumerate(messages):
+            result = SendResult(index=index)
+            results.append(result)
+            try:
+                components = self._create_send_components(kwargs)
+                body = self._build_request_body("new_message", kwargs, **components)
+            except Exception as e:
+                result.error = e
+                continue
+
+            payload = body["payload"]
+            result.msgid = payload.get("msgid")
+            keys = [
+                f"{prefix}:{payload[field]}"
+                for prefix, field in (
+                    ("ref", "conversation_ref_id"),
+                    ("id", "conversation_id"),
+                )
+                if payload.get(field)
+            ]
+            root = find(keys[0])
+            for key in keys[1:]:
+                parents[find(key)] = root
+            prepared.append((result, body, keys[0]))
+
+        groups: Dict[str, List[Tuple[SendResult, Dict]]] = {}
+        for result, body, key in prepared:
+            groups.setdefault(find(key), []).append((result, body))
+        return results, list(groups.values())
 
     @abstractmethod
     def _send(self, body: Dict) -> MessageResponse:
@@ -273,18 +456,8 @@ class MessageAction(AbstractMessageAction):
         :return: Response from the server.
         """
         try:
-            components = {
-                "message": self._create_message(kwargs),
-                "source": self._create_source(kwargs),
-                "sender": self._create_sender(kwargs),
-                "receiver": self._create_receiver(kwargs),
-                "reply_to": self._create_reply_to(kwargs),
-            }
-
-            payload = self._build_payload(kwargs, **components)
-            request_body = RequestModel(
-                event_type="new_message", payload=Payload(**payload)
-            ).model_dump(exclude_none=True)
+            components = self._create_send_components(kwargs)
+            request_body = self._build_request_body("new_message", kwargs, **components)
 
             return self._send(request_body)
 
@@ -293,6 +466,38 @@ class MessageAction(AbstractMessageAction):
         except Exception as e:
             raise RuntimeError(f"Failed to send message: {e}")
 
+    def send_many(
+        self, messages: Iterable[Dict], concurrency: int = 10
+    ) -> List[SendResult]:
+        """
+        Sends many messages in parallel over the client's connection pool.
+
+        Messages of the same conversation are sent one after another in the given
+        order, different conversations are sent concurrently. A failed message
+        does not stop the batch: its error is stored in the returned result.
+        Messages sharing a conversation_id or a conversation_ref_id are one
+        conversation; refer to a conversation by the same id throughout the batch
+        unless the client's mapping store knows both.
+
+        :param messages: An iterable of keyword argument dictionaries for send().
+        :param concurrency: Maximum number of requests in flight. Keep it at or below
+            the client's pool_maxsize to reuse connections. Defaults to 10.
+        :return: A SendResult per message, in input order.
+        """
+        results, groups = self._prepare_batch(messages)
+
+        def send_group(group: List[Tuple[SendResult, Dict]]) -> None:
+            for result, body in group:
+                try:
+                    result.response = self._send(body)
+                except Exception as e:
+                    result.error = e
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(send_group, groups))
+
+        return results
+
     def edit(self, **kwargs) -> MessageResponse:
         """
         Edits a message using the provided arguments.
@@ -301,13 +506,10 @@ class MessageAction(AbstractMessageAction):
         :return: Response from the server.
         """
         try:
-            components = {"message": self._create_message(kwargs)}
-
-            payload = self._build_payload(kwargs, **components)
-
-            request_body = RequestModel(
-                event_type="edit_message", payload=Payload(**payload)
-            ).model_dump(exclude_none=True)
+            components = self._create_edit_components(kwargs)
+            request_body = self._build_request_body(
+                "edit_message", kwargs, **components
+            )
 
             return self._send(request_body)
 
@@ -327,9 +529,113 @@ class MessageAction(AbstractMessageAction):
             response = self.client.custom_request(
                 method="POST", endpoint=f"/v2/origin/custom/{self.scope_id}", data=body
             )
-            return MessageResponse(**response.json())
+            message_response = MessageResponse(**response.json())
+            self._remember_conversation(body, message_response)
+            return message_response
 
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to decode JSON response: {e}")
         except Exception as e:
             raise RuntimeError(f"Failed to send request: {e}")
+
+    def send_body(self, body: Dict) -> MessageResponse:
+        """
+        Sends a request body built by `build_send_body` or `build_edit_body`.
+
+        :param body: The request body.
+        :return: Response from the server.
+        """
+        return self._send(body)
+
+
+class AsyncMessageAction(AbstractMessageAction):
+    """
+    Asynchronous counterpart of MessageAction for use with AsyncAmojoClient.
+    """
+
+    async def send(self, **kwargs) -> MessageResponse:
+        """
+        Sends a message using the provided arguments.
+
+        :param kwargs: The same arguments as MessageAction.send.
+        :return: Response from the server.
+        """
+        try:
+            components = self._create_send_components(kwargs)
+            request_body = self._build_request_body("new_message", kwargs, **components)
+
+            return await self._send(request_body)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to send message: {e}")
+
+    async def send_many(
+        self, messages: Iterable[Dict], concurrency: int = 10
+    ) -> List[SendResult]:
+        """
+        Sends many messages concurrently on the running event loop, in order
+        within each conversation (see MessageAction.send_many).
+
+        :param messages: An iterable of keyword argument dictionaries for send().
+        :param concurrency: Maximum number of requests in flight. Defaults to 10.
+        :return: A SendResult per message, in input order.
+        """
+        results, groups = self._prepare_batch(messages)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send_group(group: List[Tuple[SendResult, Dict]]) -> None:
+            async with semaphore:
+                for result, body in group:
+                    try:
+                        result.response = await self._send(body)
+                    except Exception as e:
+                        result.error = e
+
+        await asyncio.gather(*(send_group(group) for group in groups))
+
+        return results
+
+    async def edit(self, **kwargs) -> MessageResponse:
+        """
+        Edits a message using the provided arguments.
+
+        :param kwargs: The same arguments as MessageAction.edit.
+        :return: Response from the server.
+        """
+        try:
+            components = self._create_edit_components(kwargs)
+            request_body = self._build_request_body(
+                "edit_message", kwargs, **components
+            )
+
+            return await self._send(request_body)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to edit message: {e}")
+
+    async def _send(self, body: Dict) -> MessageResponse:
+        """
+        Sends the request to the server.
+
+        :param body: The payload to send.
+        :return: Response from the server.
+        """
+        try:
+            response = await self.client.custom_request(
+                method="POST", endpoint=f"/v2/origin/custom/{self.scope_id}", data=body
+            )
+            message_response = MessageResponse(**response.json())
+            self._remember_conversation(body, message_response)
+            return message_response
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to send request: {e}")
+
+    async def send_body(self, body: Dict) -> MessageResponse:
+        """
+        Sends a request body built by `build_send_body` or `build_edit_body`.
+
+        :param body: The request body.
+        :return: Response from the server.
+        """
+        return await self._send(body)
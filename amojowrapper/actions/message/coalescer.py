@@ -0,0 +1,302 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Any, Dict, Optional, Set
+
+from pydantic import BaseModel
+
+from amojowrapper.actions.message.action import MessageAction, ValidationLevel
+
+
+class EditStats(BaseModel):
+    """
+    Counters of an EditCoalescer.
+
+    Attributes:
+        requested (int): Edits passed to `edit`.
+        sent (int): Edit requests acknowledged by the server.
+        skipped (int): Intermediate edits replaced by a later one before being sent.
+        failed (int): Edit requests that raised an error.
+        pending (int): Edit requests waiting to be sent.
+    """
+
+    requested: int = 0
+    sent: int = 0
+    skipped: int = 0
+    failed: int = 0
+    pending: int = 0
+
+
+class _PendingEdit:
+    """
+    The latest edit of a msgid waiting to be sent.
+    """
+
+    __slots__ = ("body", "future")
+
+    def __init__(self, body: Dict, future: Future):
+        self.body = body
+        self.future = future
+
+
+class EditCoalescer:
+    """
+    Sends rapid edits of the same message at a bounded cadence, keeping only the
+    latest text.
+
+    Streaming an answer by editing a message on every token creates one request
+    per token. With the coalescer, the first edit of a msgid is sent right away
+    and the following ones at most once per `interval` seconds: edits queued in
+    between replace each other, so only the latest is sent and their callers
+    share one Future. The last edit is never dropped: `flush` and `close` send
+    every queued edit without waiting for the cadence.
+
+    Edits of a msgid are sent one at a time and in order; edits of different
+    messages are sent concurrently from background threads.
+
+    Attributes:
+        client: The AmojoClient used to send the edits.
+        interval (float): Minimum seconds between two edits of a message.
+        concurrency (int): Maximum number of edit requests sent at once.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        interval: float = 1.0,
+        concurrency: int = 4,
+        validation: ValidationLevel = "strict",
+    ):
+        """
+        Initializes the EditCoalescer and starts its background thread.
+
+        :param client: The AmojoClient used to send the edits.
+        :param interval: Minimum seconds between two edits of a message.
+            Defaults to 1.
+        :param concurrency: Maximum edit requests sent at once. Defaults to 4.
+        :param validation: The validation level of the MessageAction building the
+            edits. Defaults to "strict".
+        """
+        self.client = client
+        self.interval = interval
+        self.concurrency = concurrency
+
+        self._action = MessageAction(client, validation=validation)
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="amojowrapper-edit"
+        )
+        self._condition = threading.Condition()
+        self._pending: Dict[str, _PendingEdit] = {}
+        self._in_flight: Set[str] = set()
+        self._last_sent: Dict[str, float] = {}
+        self._outstanding: Set[Future] = set()
+        self._flush_all = False
+        self._closed = False
+        self._stopped = False
+        self._stats = EditStats()
+        self._thread = threading.Thread(
+            target=self._run, name="amojowrapper-edit-coalescer", daemon=True
+        )
+        self._thread.start()
+
+    def edit(self, **kwargs) -> Future:
+        """
+        Queues an edit, replacing the queued edit of the same message if any.
+
+        :param kwargs: The same arguments as MessageAction.edit, with a msgid.
+        :return: A Future resolving to the MessageResponse of the sent edit.
+        :raises ValueError: If the msgid is missing.
+        :raises RuntimeError: If the coalescer is closed.
+        """
+        if not kwargs.get("msgid"):
+            raise ValueError("msgid not found")
+        body = self._action.build_edit_body(**kwargs)
+        msgid = body["payload"]["msgid"]
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("the edit coalescer is closed")
+            self._stats.requested += 1
+            queued = self._pending.get(msgid)
+            if queued is not None:
+                self._stats.skipped += 1
+                queued.body = body
+                return queued.future
+
+            future = Future()
+            self._pending[msgid] = _PendingEdit(body, future)
+            self._outstanding.add(future)
+            self._stats.pending += 1
+            self._condition.notify()
+        return future
+
+    def _send(self, msgid: str, edit: _PendingEdit) -> None:
+        """
+        Sends one edit and resolves its Future.
+        """
+        with self._condition:
+            if self._stopped:
+                self._in_flight.discard(msgid)
+                self._outstanding.discard(edit.future)
+                self._stats.pending -= 1
+                self._stats.failed += 1
+                stopped = True
+            else:
+                stopped = False
+        if stopped:
+            edit.future.set_exception(
+                RuntimeError("the edit coalescer closed before sending")
+            )
+            return
+
+        try:
+            response = self._action.send_body(edit.body)
+        except Exception as e:
+            error, response = e, None
+        else:
+            error = None
+
+        with self._condition:
+            self._in_flight.discard(msgid)
+            self._last_sent[msgid] = time.monotonic()
+            self._outstanding.discard(edit.future)
+            self._stats.pending -= 1
+            if error is None:
+                self._stats.sent += 1
+            else:
+                self._stats.failed += 1
+            self._condition.notify()
+
+        if error is None:
+            edit.future.set_result(response)
+        else:
+            edit.future.set_exception(error)
+
+    def _due(self, msgid: str) -> float:
+        """
+        Returns when the next edit of a message may be sent. Must be called under
+        the lock.
+        """
+        return self._last_sent.get(msgid, float("-inf")) + self.interval
+
+    def _take_due(self, now: float) -> Dict[str, _PendingEdit]:
+        """
+        Removes the edits that can be sent now. Must be called under the lock.
+        """
+        due = {
+            msgid: edit
+            for msgid, edit in self._pending.items()
+            if msgid not in self._in_flight
+            and (self._flush_all or self._closed or self._due(msgid) <= now)
+        }
+        for msgid in due:
+            del self._pending[msgid]
+            self._in_flight.add(msgid)
+        if not self._pending:
+            self._flush_all = False
+        return due
+
+    def _forget_idle(self, now: float) -> None:
+        """
+        Drops the send times of messages whose cadence elapsed. Must be called
+        under the lock.
+        """
+        if len(self._last_sent) > 10_000:
+            self._last_sent = {
+                msgid: sent_at
+                for msgid, sent_at in self._last_sent.items()
+                if now - sent_at < self.interval or msgid in self._pending
+            }
+
+    def _run(self) -> None:
+        """
+        The background loop sending the edits when they are due.
+        """
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                due = self._take_due(now)
+                if not due:
+                    if self._closed and not self._pending and not self._in_flight:
+                        return
+                    waiting = [
+                        self._due(msgid)
+                        for msgid in self._pending
+                        if msgid not in self._in_flight
+                    ]
+                    timeout = max(0.0, min(waiting) - now) if waiting else None
+                    self._forget_idle(now)
+                    self._condition.wait(timeout)
+                    continue
+
+            for msgid, edit in due.items():
+                try:
+                    self._executor.submit(self._send, msgid, edit)
+                except RuntimeError:
+                    # close() timed out and shut the executor down, so _send
+                    # fails the edit without sending it
+                    self._send(msgid, edit)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sends every queued edit now and waits for the outcome of every edit
+        queued or in flight.
+
+        :param timeout: Seconds to wait (optional).
+        :return: True if every edit completed within the timeout.
+        """
+        with self._condition:
+            self._flush_all = True
+            futures = list(self._outstanding)
+            self._condition.notify()
+        _, not_done = wait_futures(futures, timeout)
+        return not not_done
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Sends every queued edit and stops the background thread.
+
+        If the timeout expires first, the edits not sent yet are dropped and
+        their Futures raise RuntimeError. Requests already in flight are not
+        interrupted: they complete in the background and resolve their Futures.
+
+        :param timeout: Seconds to wait for the queued edits to be sent.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout)
+
+        if timeout is not None:
+            # Edits still queued, here or in the executor, are not sent
+            with self._condition:
+                self._stopped = True
+                unsent, self._pending = list(self._pending.values()), {}
+                self._stats.failed += len(unsent)
+                self._stats.pending -= len(unsent)
+                for edit in unsent:
+                    self._outstanding.discard(edit.future)
+                self._condition.notify()
+            for edit in unsent:
+                edit.future.set_exception(
+                    RuntimeError("the edit coalescer closed before sending")
+                )
+        self._executor.shutdown(wait=timeout is None)
+
+    def stats(self) -> EditStats:
+        """
+        Returns a snapshot of the coalescer counters.
+
+        :return: An instance of EditStats.
+        """
+        with self._condition:
+            return self._stats.model_copy()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
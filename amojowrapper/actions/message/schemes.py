@@ -1,5 +1,5 @@
 from typing import Literal, Optional, List
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 
 class Profile(BaseModel):
@@ -225,3 +225,19 @@ class MessageResponse(BaseModel):
     """Represents a message response containing new message details."""
 
     new_message: NewMessageResponse
+
+
+class SendResult(BaseModel):
+    """Represents the outcome of one message of a batch send."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    msgid: Optional[str] = None
+    response: Optional[MessageResponse] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the message was accepted by the server."""
+        return self.error is None
@@ -2,6 +2,8 @@ import json
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
+from requests import Response
+
 from amojowrapper.actions.react.schemes import ReactScheme, User
 
 
@@ -9,12 +11,12 @@ class ReactActionInterface(ABC):
     """Interface for React action classes."""
 
     @abstractmethod
-    def set(self) -> int:
+    def set(self) -> Response:
         """Sets the react action, to be implemented by subclasses."""
         pass
 
     @abstractmethod
-    def _send(self, body: Dict) -> int:
+    def _send(self, body: Dict) -> Response:
         """Sends the react action payload, to be implemented by subclasses."""
         pass
 
@@ -74,11 +76,22 @@ class AbstractReactAction(ReactActionInterface):
             exclude_none=True
         )
 
+    def build_body(self, **kwargs) -> Dict:
+        """
+        Builds the request body of a reaction without sending it.
+
+        :param kwargs: The same parameters as `set`.
+        :return: The request body, to be sent with `send_body`.
+        :raises ValueError: If neither conversation_id nor conversation_ref_id
+            is provided.
+        """
+        return self._build_payload(kwargs, user=self._create_user(kwargs))
+
 
 class ReactAction(AbstractReactAction):
     """Class for handling React actions."""
 
-    def set(self, **kwargs) -> int:
+    def set(self, **kwargs) -> Response:
         """Sets the react action by building and sending the payload."""
         try:
             components = {
@@ -91,18 +104,8 @@ class ReactAction(AbstractReactAction):
             print(f"ValueError: {e}")
             return -1  # Returning a failure code, for example
 
-        return self._send(body=payload)
-
-    def _send(self, body: Dict) -> int:
-        """Sends the payload to the API and returns the response code."""
         try:
-            response = self.client.custom_request(
-                method="POST",
-                endpoint=f"/v2/origin/custom/{self.scope_id}/react",
-                data=body,
-            )
-            return response
-
+            return self._send(body=payload)
         except json.JSONDecodeError as e:
             print(f"JSON Decode Error: {e}")
             raise
@@ -110,3 +113,58 @@ class ReactAction(AbstractReactAction):
             # Catching more general exceptions
             print(f"Exception occurred: {e}")
             raise
+
+    def send_body(self, body: Dict) -> Response:
+        """
+        Sends a request body built by `build_body`.
+
+        Errors are raised as they are, without the print-outs of `set`.
+
+        :param body: The request body.
+        :return: The response from the server.
+        """
+        return self._send(body=body)
+
+    def _send(self, body: Dict) -> Response:
+        """Sends the payload to the API and returns the response."""
+        return self.client.custom_request(
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self.scope_id}/react",
+            data=body,
+        )
+
+
+class AsyncReactAction(AbstractReactAction):
+    """Asynchronous counterpart of ReactAction for use with AsyncAmojoClient."""
+
+    async def set(self, **kwargs):
+        """
+        Sets the react action by building and sending the payload.
+
+        :raises ValueError: If neither conversation_id nor conversation_ref_id
+            is provided.
+        """
+        components = {
+            "user": self._create_user(kwargs),
+        }
+
+        payload = self._build_payload(kwargs, **components)
+
+        return await self._send(body=payload)
+
+    async def send_body(self, body: Dict) -> Response:
+        """
+        Sends a request body built by `build_body`.
+
+        :param body: The request body.
+        :return: The response from the server.
+        """
+        return await self._send(body=body)
+
+    async def _send(self, body: Dict) -> Response:
+        """Sends the payload to the API and returns the response."""
+        return await self.client.custom_request(
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self.scope_id}/react",
+            data=body,
+        )
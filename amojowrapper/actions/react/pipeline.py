@@ -0,0 +1,375 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Any, Dict, Literal, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from amojowrapper.actions.react.action import ReactAction
+
+ReactStatus = Literal["sent", "deduplicated", "cancelled", "failed"]
+
+_CLOSED_BEFORE_SENDING = "the react pipeline closed before sending"
+
+
+class ReactResult(BaseModel):
+    """
+    The outcome of a reaction queued in a ReactPipeline.
+
+    Attributes:
+        id (Optional[str]): The id of the reacted message.
+        type (str): "react" or "unreact".
+        emoji (Optional[str]): The emoji.
+        status (ReactStatus): "sent" if the request succeeded, "deduplicated" if
+            an identical reaction was sent within the window, "cancelled" if a
+            react/unreact pair cancelled out or a later opposite reaction
+            replaced it before it was sent, "failed" if the request raised an
+            error or the pipeline closed before sending it.
+        status_code (Optional[int]): The HTTP status code of the sent request.
+        error (Optional[str]): The error of a failed request.
+    """
+
+    id: Optional[str] = None
+    type: str
+    emoji: Optional[str] = None
+    status: ReactStatus
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ReactStats(BaseModel):
+    """
+    Counters of a ReactPipeline.
+
+    Attributes:
+        requested (int): Reactions passed to `set`.
+        sent (int): Reaction requests acknowledged by the server.
+        deduplicated (int): Reactions identical to one queued or sent within the
+            window.
+        cancelled (int): Reactions cancelled or replaced by their opposite within
+            the window.
+        failed (int): Reaction requests that raised an error.
+        pending (int): Reaction requests waiting to be sent.
+    """
+
+    requested: int = 0
+    sent: int = 0
+    deduplicated: int = 0
+    cancelled: int = 0
+    failed: int = 0
+    pending: int = 0
+
+
+class _PendingReact:
+    """
+    A reaction waiting for its window to elapse.
+    """
+
+    __slots__ = ("body", "future", "due")
+
+    def __init__(self, body: Dict, future: Future, due: float):
+        self.body = body
+        self.future = future
+        self.due = due
+
+
+class ReactPipeline:
+    """
+    Deduplicates, cancels and batches reactions before sending them.
+
+    Reactions are held for `window` seconds, keyed by conversation, message,
+    user and emoji. Within the window, a reaction identical to one queued or
+    already sent is deduplicated. A "react" followed by an "unreact" of the same
+    emoji (or the reverse) cancels out so neither is sent if the first one is
+    known to change the state last sent by the pipeline; otherwise only the
+    latest one is sent. The reactions surviving the window are sent concurrently
+    from background threads.
+
+    `set` returns a Future resolving to a ReactResult, including for failed
+    requests, so callers never get print-outs or magic return codes.
+
+    Attributes:
+        client: The AmojoClient used to send the reactions.
+        window (float): Seconds a reaction is held before being sent.
+        concurrency (int): Maximum number of reaction requests sent at once.
+    """
+
+    def __init__(self, client: Any, window: float = 0.5, concurrency: int = 8):
+        """
+        Initializes the ReactPipeline and starts its background thread.
+
+        :param client: The AmojoClient used to send the reactions.
+        :param window: Seconds a reaction is held before being sent.
+            Defaults to 0.5.
+        :param concurrency: Maximum reaction requests sent at once. Defaults to 8.
+        """
+        self.client = client
+        self.window = window
+        self.concurrency = concurrency
+
+        self._action = ReactAction(client)
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="amojowrapper-react"
+        )
+        self._condition = threading.Condition()
+        self._pending: Dict[Tuple, _PendingReact] = {}
+        self._last_sent: Dict[Tuple, Tuple[str, float]] = {}
+        self._outstanding: Set[Future] = set()
+        self._flush_all = False
+        self._closed = False
+        self._stopped = False
+        self._stats = ReactStats()
+        self._thread = threading.Thread(
+            target=self._run, name="amojowrapper-react-pipeline", daemon=True
+        )
+        self._thread.start()
+
+    @staticmethod
+    def _key(body: Dict) -> Tuple:
+        """
+        Returns the key of a reaction, without its type.
+        """
+        user = body.get("user") or {}
+        return (
+            body.get("conversation_id"),
+            body.get("conversation_ref_id"),
+            body.get("id"),
+            user.get("id"),
+            user.get("ref_id"),
+            body.get("emoji"),
+        )
+
+    @staticmethod
+    def _result(body: Dict, status: ReactStatus, **fields) -> ReactResult:
+        return ReactResult(
+            id=body.get("id"),
+            type=body.get("type", "react"),
+            emoji=body.get("emoji"),
+            status=status,
+            **fields,
+        )
+
+    @staticmethod
+    def _resolved(result: ReactResult) -> Future:
+        future = Future()
+        future.set_result(result)
+        return future
+
+    def set(self, **kwargs) -> Future:
+        """
+        Queues a reaction.
+
+        :param kwargs: The same parameters as ReactAction.set; type is "react"
+            (the default) or "unreact".
+        :return: A Future resolving to a ReactResult.
+        :raises ValueError: If the message id or the conversation is missing.
+        :raises RuntimeError: If the pipeline is closed.
+        """
+        kwargs.setdefault("type", "react")
+        body = self._action.build_body(**kwargs)
+        if not body.get("id"):
+            raise ValueError("id of the reacted message must be provided")
+        if not (body.get("conversation_id") or body.get("conversation_ref_id")):
+            raise ValueError(
+                "Either conversation_id or conversation_ref_id must be provided"
+            )
+        key = self._key(body)
+        now = time.monotonic()
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("the react pipeline is closed")
+            self._stats.requested += 1
+
+            queued = self._pending.get(key)
+            if queued is not None:
+                if queued.body["type"] == body["type"]:
+                    self._stats.deduplicated += 1
+                    return queued.future
+                last = self._last_sent.get(key)
+                if last is not None and last[0] != queued.body["type"]:
+                    # The queued reaction flips the state last sent, so it and
+                    # its opposite cancel out
+                    del self._pending[key]
+                    self._outstanding.discard(queued.future)
+                    self._stats.pending -= 1
+                    self._stats.cancelled += 2
+                    queued.future.set_result(self._result(queued.body, "cancelled"))
+                    return self._resolved(self._result(body, "cancelled"))
+
+                # The queued reaction may not change the state, so only the
+                # latest one is sent
+                future = Future()
+                self._pending[key] = _PendingReact(body, future, queued.due)
+                self._outstanding.discard(queued.future)
+                self._outstanding.add(future)
+                self._stats.cancelled += 1
+                queued.future.set_result(self._result(queued.body, "cancelled"))
+                return future
+
+            last = self._last_sent.get(key)
+            if (
+                last is not None
+                and last[0] == body["type"]
+                and now - last[1] < self.window
+            ):
+                self._stats.deduplicated += 1
+                return self._resolved(self._result(body, "deduplicated"))
+
+            future = Future()
+            self._pending[key] = _PendingReact(body, future, now + self.window)
+            self._outstanding.add(future)
+            self._stats.pending += 1
+            self._condition.notify()
+        return future
+
+    def _send(self, key: Tuple, react: _PendingReact) -> None:
+        """
+        Sends one reaction and resolves its Future.
+        """
+        with self._condition:
+            if self._stopped:
+                self._outstanding.discard(react.future)
+                self._stats.pending -= 1
+                self._stats.failed += 1
+                stopped = True
+            else:
+                stopped = False
+        if stopped:
+            react.future.set_result(
+                self._result(react.body, "failed", error=_CLOSED_BEFORE_SENDING)
+            )
+            return
+
+        try:
+            response = self._action.send_body(react.body)
+        except Exception as e:
+            result = self._result(react.body, "failed", error=str(e))
+        else:
+            result = self._result(react.body, "sent", status_code=response.status_code)
+
+        with self._condition:
+            self._outstanding.discard(react.future)
+            self._stats.pending -= 1
+            if result.status == "sent":
+                self._stats.sent += 1
+                self._last_sent[key] = (react.body["type"], time.monotonic())
+            else:
+                self._stats.failed += 1
+            self._condition.notify()
+        react.future.set_result(result)
+
+    def _take_due(self, now: float) -> Dict[Tuple, _PendingReact]:
+        """
+        Removes the reactions whose window elapsed. Must be called under the lock.
+        """
+        due = {
+            key: react
+            for key, react in self._pending.items()
+            if self._flush_all or self._closed or react.due <= now
+        }
+        for key in due:
+            del self._pending[key]
+        self._flush_all = False
+
+        # Forget the sent reactions whose window elapsed once the map grows large
+        if len(self._last_sent) > 10_000:
+            self._last_sent = {
+                key: last
+                for key, last in self._last_sent.items()
+                if now - last[1] < self.window
+            }
+        return due
+
+    def _run(self) -> None:
+        """
+        The background loop sending the reactions when their window elapses.
+        """
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                due = self._take_due(now)
+                if not due:
+                    if self._closed:
+                        return
+                    waiting = [react.due for react in self._pending.values()]
+                    self._condition.wait(
+                        max(0.0, min(waiting) - now) if waiting else None
+                    )
+                    continue
+
+            for key, react in due.items():
+                try:
+                    self._executor.submit(self._send, key, react)
+                except RuntimeError:
+                    # close() timed out and shut the executor down, so _send
+                    # fails the reaction without sending it
+                    self._send(key, react)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sends every queued reaction now and waits for the outcome of every
+        reaction queued or in flight.
+
+        :param timeout: Seconds to wait (optional).
+        :return: True if every reaction completed within the timeout.
+        """
+        with self._condition:
+            self._flush_all = True
+            futures = list(self._outstanding)
+            self._condition.notify()
+        _, not_done = wait_futures(futures, timeout)
+        return not not_done
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Sends every queued reaction and stops the background thread.
+
+        If the timeout expires first, the reactions not sent yet are dropped and
+        their Futures resolve to a "failed" ReactResult. Requests already in flight are not
+        interrupted: they complete in the background and resolve their Futures.
+
+        :param timeout: Seconds to wait for the queued reactions to be sent.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout)
+
+        if deadline is not None:
+            with self._condition:
+                futures = list(self._outstanding)
+            wait_futures(futures, max(0.0, deadline - time.monotonic()))
+            # Reactions still queued, here or in the executor, are not sent
+            with self._condition:
+                self._stopped = True
+                unsent, self._pending = list(self._pending.values()), {}
+                self._stats.failed += len(unsent)
+                self._stats.pending -= len(unsent)
+                for react in unsent:
+                    self._outstanding.discard(react.future)
+                self._condition.notify()
+            for react in unsent:
+                react.future.set_result(
+                    self._result(react.body, "failed", error=_CLOSED_BEFORE_SENDING)
+                )
+        self._executor.shutdown(wait=timeout is None)
+
+    def stats(self) -> ReactStats:
+        """
+        Returns a snapshot of the pipeline counters.
+
+        :return: An instance of ReactStats.
+        """
+        with self._condition:
+            return self._stats.model_copy()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
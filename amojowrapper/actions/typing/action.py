@@ -89,6 +89,18 @@ class AbstractTypingAction(TypingActionInterface):
             exclude_none=True
         )
 
+    def build_body(self, **kwargs) -> Dict:
+        """
+        Builds the request body of a typing event without sending it.
+
+        Args:
+            kwargs: The same parameters as `send`.
+
+        Returns:
+            Dict: The request body, to be sent with `send_body`.
+        """
+        return self._build_payload(kwargs, sender=self._create_sender(kwargs))
+
 
 class TypingAction(AbstractTypingAction):
     """
@@ -117,6 +129,18 @@ class TypingAction(AbstractTypingAction):
 
         return self._send(body=payload)
 
+    def send_body(self, body: Dict) -> bool:
+        """
+        Sends a request body built by `build_body`.
+
+        Args:
+            body: The request body.
+
+        Returns:
+            bool: True if the server responded with 204.
+        """
+        return self._send(body=body)
+
     def _send(self, body: Dict) -> int:
         """
         Sends the actual request to the server.
@@ -140,3 +164,53 @@ class TypingAction(AbstractTypingAction):
         except Exception as e:
             print(f"Error in sending request: {e}")
             raise
+
+
+class AsyncTypingAction(AbstractTypingAction):
+    """
+    Asynchronous counterpart of TypingAction for use with AsyncAmojoClient.
+    """
+
+    async def send(self, **kwargs) -> bool:
+        """
+        Sends a typing action request.
+
+        Args:
+            kwargs: Parameters for the typing action, including sender, conversation ID, etc.
+        """
+        components = {
+            "sender": self._create_sender(kwargs),
+        }
+
+        payload = self._build_payload(kwargs, **components)
+
+        return await self._send(body=payload)
+
+    async def send_body(self, body: Dict) -> bool:
+        """
+        Sends a request body built by `build_body`.
+
+        Args:
+            body: The request body.
+
+        Returns:
+            bool: True if the server responded with 204.
+        """
+        return await self._send(body=body)
+
+    async def _send(self, body: Dict) -> bool:
+        """
+        Sends the actual request to the server.
+
+        Args:
+            body: The payload to be sent to the server.
+
+        Returns:
+            bool: True if the server responded with 204.
+        """
+        response = await self.client.custom_request(
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self.scope_id}/typing",
+            data=body,
+        )
+        return response.status_code == 204
@@ -0,0 +1,301 @@
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from amojowrapper.actions.typing.action import AsyncTypingAction, TypingAction
+
+
+class TypingStats(BaseModel):
+    """
+    Counters of a typing dispatcher.
+
+    Attributes:
+        requested (int): Typing events passed to `send`.
+        sent (int): Typing requests sent to the server.
+        suppressed (int): Typing events dropped because an identical one was sent
+            within the window or is still waiting to be sent.
+        dropped (int): Typing events dropped because the queue was full.
+        failed (int): Typing requests that raised an error.
+        pending (int): Typing requests waiting to be sent.
+    """
+
+    requested: int = 0
+    sent: int = 0
+    suppressed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    pending: int = 0
+
+
+class AbstractTypingDispatcher:
+    """
+    Coalesces typing events per (conversation, sender) for the typing dispatchers.
+
+    The typing indicator lasts a few seconds in amoCRM, so repeating it on every
+    keystroke or streamed token only floods `/typing` with identical requests. At
+    most one event per conversation and sender is sent per `window` seconds; the
+    others are dropped in-process and counted as suppressed.
+
+    Attributes:
+        window (float): Seconds during which identical typing events are dropped.
+        max_pending (int): Maximum number of typing requests waiting to be sent.
+    """
+
+    def __init__(self, window: float = 3.0, max_pending: int = 10_000):
+        """
+        Initializes the dispatcher state.
+
+        :param window: Seconds between two typing events of a conversation and
+            sender. Defaults to 3.
+        :param max_pending: Maximum typing requests waiting to be sent.
+            Defaults to 10000.
+        """
+        self.window = window
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._last_sent: Dict[Tuple, float] = {}
+        self._stats = TypingStats()
+
+    @staticmethod
+    def _key(payload: Dict) -> Tuple:
+        """
+        Returns the coalescing key of a typing payload.
+        """
+        sender = payload.get("sender") or {}
+        return (
+            payload.get("conversation_id"),
+            payload.get("conversation_ref_id"),
+            sender.get("id"),
+            sender.get("ref_id"),
+        )
+
+    def _admit(self, key: Tuple) -> bool:
+        """
+        Decides whether a typing event is sent, and records it if so.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._stats.requested += 1
+            last = self._last_sent.get(key)
+            if last is not None and now - last < self.window:
+                self._stats.suppressed += 1
+                return False
+            if self._stats.pending >= self.max_pending:
+                self._stats.dropped += 1
+                return False
+
+            # Forget the keys whose window elapsed once the map grows large
+            if len(self._last_sent) >= self.max_pending:
+                self._last_sent = {
+                    k: t for k, t in self._last_sent.items() if now - t < self.window
+                }
+            self._last_sent[key] = now
+            self._stats.pending += 1
+        return True
+
+    def _done(self, key: Tuple, success: bool) -> None:
+        """
+        Records the outcome of a sent typing request.
+        """
+        with self._lock:
+            self._stats.pending -= 1
+            if success:
+                self._stats.sent += 1
+            else:
+                self._stats.failed += 1
+                # Let the next typing event of the key be sent again
+                self._last_sent.pop(key, None)
+
+    def stats(self) -> TypingStats:
+        """
+        Returns a snapshot of the dispatcher counters.
+
+        :return: An instance of TypingStats.
+        """
+        with self._lock:
+            return self._stats.model_copy()
+
+
+class TypingDispatcher(AbstractTypingDispatcher):
+    """
+    Sends typing events from a background thread, coalesced per conversation and
+    sender (see AbstractTypingDispatcher).
+
+    `send` only validates the event and queues it, so it never blocks on the
+    network. The worker thread starts on the first event.
+
+    Attributes:
+        client: The AmojoClient used to send the typing requests.
+    """
+
+    def __init__(self, client: Any, window: float = 3.0, max_pending: int = 10_000):
+        """
+        Initializes the TypingDispatcher.
+
+        :param client: The AmojoClient used to send the typing requests.
+        :param window: Seconds between two typing events of a conversation and
+            sender. Defaults to 3.
+        :param max_pending: Maximum typing requests waiting to be sent.
+            Defaults to 10000.
+        """
+        super().__init__(window=window, max_pending=max_pending)
+        self.client = client
+        self._action = TypingAction(client)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def send(self, **kwargs) -> bool:
+        """
+        Queues a typing event unless an identical one was sent within the window.
+
+        :param kwargs: The same parameters as TypingAction.send.
+        :return: True if the event was queued, False if it was dropped.
+        :raises ValueError: If neither conversation_id nor conversation_ref_id
+            is provided.
+        """
+        payload = self._action.build_body(**kwargs)
+        key = self._key(payload)
+        if not self._admit(key):
+            return False
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="amojowrapper-typing", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((key, payload))
+        return True
+
+    def _run(self) -> None:
+        """
+        The worker loop sending the queued typing requests.
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                key, payload = item
+                try:
+                    self._action.send_body(payload)
+                except Exception:
+                    self._done(key, success=False)
+                else:
+                    self._done(key, success=True)
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued typing request has been sent.
+        """
+        self._queue.join()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Sends the queued typing requests and stops the worker thread.
+
+        :param timeout: Seconds to wait for the worker thread to finish.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncTypingDispatcher(AbstractTypingDispatcher):
+    """
+    Asynchronous counterpart of TypingDispatcher for use with AsyncAmojoClient.
+
+    The typing requests are sent by a worker task started on the first event.
+    """
+
+    def __init__(self, client: Any, window: float = 3.0, max_pending: int = 10_000):
+        """
+        Initializes the AsyncTypingDispatcher.
+
+        :param client: The AsyncAmojoClient used to send the typing requests.
+        :param window: Seconds between two typing events of a conversation and
+            sender. Defaults to 3.
+        :param max_pending: Maximum typing requests waiting to be sent.
+            Defaults to 10000.
+        """
+        super().__init__(window=window, max_pending=max_pending)
+        self.client = client
+        self._action = AsyncTypingAction(client)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def send(self, **kwargs) -> bool:
+        """
+        Queues a typing event unless an identical one was sent within the window.
+        Must be called from the event loop.
+
+        :param kwargs: The same parameters as AsyncTypingAction.send.
+        :return: True if the event was queued, False if it was dropped.
+        :raises ValueError: If neither conversation_id nor conversation_ref_id
+            is provided.
+        """
+        payload = self._action.build_body(**kwargs)
+        key = self._key(payload)
+        if not self._admit(key):
+            return False
+
+        if self._task is None or self._task.done():
+            self._queue = self._queue or asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._queue.put_nowait((key, payload))
+        return True
+
+    async def _run(self) -> None:
+        """
+        The worker task sending the queued typing requests.
+        """
+        while True:
+            item = await self._queue.get()
+            try:
+                if item is None:
+                    return
+                key, payload = item
+                try:
+                    await self._action.send_body(payload)
+                except Exception:
+                    self._done(key, success=False)
+                else:
+                    self._done(key, success=True)
+            finally:
+                self._queue.task_done()
+
+    async def flush(self) -> None:
+        """
+        Waits until every queued typing request has been sent.
+        """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """
+        Sends the queued typing requests and stops the worker task.
+        """
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            self._queue.put_nowait(None)
+            await task
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
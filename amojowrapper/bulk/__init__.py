@@ -0,0 +1,12 @@
+from amojowrapper.bulk.base import AbstractBulkJob, BulkStats
+from amojowrapper.bulk.chat_import import (
+    ChatImporter,
+    ImportStats,
+    read_chat_records,
+)
+from amojowrapper.bulk.history_export import (
+    ExportStats,
+    HistoryExporter,
+    JsonlHistoryWriter,
+    ParquetHistoryWriter,
+)
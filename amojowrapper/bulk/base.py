@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from pydantic import BaseModel
+
+from amojowrapper.helpers.serializer import get_default_json_encoder
+
+
+class BulkStats(BaseModel):
+    """
+    Progress of a bulk job, shared by ImportStats and ExportStats.
+
+    Attributes:
+        skipped (int): Items already done by a previous run.
+        completed (int): Items done by this run.
+        failed (int): Items that failed and will be retried on resume.
+        failed_ids (List[str]): The ids of the failed items.
+        errors (Dict[str, str]): The error message of each failed item.
+        elapsed (float): Seconds since the job started.
+    """
+
+    skipped: int = 0
+    completed: int = 0
+    failed: int = 0
+    failed_ids: List[str] = []
+    errors: Dict[str, str] = {}
+    elapsed: float = 0.0
+
+
+class AbstractBulkJob:
+    """
+    Journaling and progress reporting shared by ChatImporter and HistoryExporter.
+
+    Every finished item is appended to a JSONL journal, keyed by `key_field`,
+    with a "status" of "completed" (the default when absent) or "failed" along
+    with its error. A job started again with the same journal skips the
+    completed items and retries the failed ones.
+
+    Subclasses set `key_field` and `stats_model` and implement `journal_path`.
+
+    Attributes:
+        client: The AmojoClient used by the job.
+        on_progress (Optional[Callable]): Called with the stats after each item.
+    """
+
+    key_field = "conversation_id"
+    stats_model = BulkStats
+
+    def __init__(
+        self, client: Any, on_progress: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Initializes the job state.
+
+        :param client: The AmojoClient used by the job.
+        :param on_progress: Called with the stats after each item (optional).
+        """
+        self.client = client
+        self.on_progress = on_progress
+
+        self._encoder = getattr(client, "json_encoder", None) or (
+            get_default_json_encoder()
+        )
+        self._lock = threading.Lock()
+        self._stats = self.stats_model()
+        self._started = 0.0
+
+    @property
+    def journal_path(self) -> str:
+        """The path of the JSONL journal recording the finished items."""
+        raise NotImplementedError
+
+    def _read_journal(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the complete records of the journal.
+        """
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "rb") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # A line cut short by an interruption
+                if isinstance(record, dict) and self.key_field in record:
+                    yield record
+
+    def completed_ids(self) -> Set[str]:
+        """
+        Returns the items recorded as completed in the journal.
+
+        :return: A set of item ids.
+        """
+        return {
+            record[self.key_field]
+            for record in self._read_journal()
+            if record.get("status", "completed") == "completed"
+        }
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        """
+        Appends a record to the journal. Must be called under the lock.
+        """
+        with open(self.journal_path, "ab") as journal:
+            journal.write(self._encoder(record) + b"\n")
+
+    def _fail(self, item_id: str, error: str, journal: bool = True) -> None:
+        """
+        Counts a failed item, keeps its error and records it in the journal.
+
+        :param item_id: The id of the item.
+        :param error: The error message.
+        :param journal: False for items that cannot be recorded, e.g. a record
+            without an id.
+        """
+        with self._lock:
+            if journal:
+                self._record(
+                    {self.key_field: item_id, "status": "failed", "error": error}
+                )
+            self._stats.failed += 1
+            self._stats.failed_ids.append(item_id)
+            self._stats.errors[item_id] = error
+        self._report()
+
+    def _start(self) -> None:
+        """
+        Resets the stats at the beginning of a run.
+        """
+        self._stats = self.stats_model()
+        self._started = time.monotonic()
+
+    def _report(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.stats())
+
+    def stats(self) -> Any:
+        """
+        Returns a snapshot of the progress.
+
+        :return: An instance of the job's stats model.
+        """
+        with self._lock:
+            stats = self._stats.model_copy(deep=True)
+        if self._started:
+            stats.elapsed = time.monotonic() - self._started
+        return stats
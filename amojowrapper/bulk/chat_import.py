@@ -0,0 +1,187 @@
+import csv
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Literal, Optional
+
+from amojowrapper.actions.chat.action import ChatAction
+from amojowrapper.bulk.base import AbstractBulkJob, BulkStats
+
+RecordFormat = Literal["csv", "jsonl"]
+
+# The ChatAction.create parameters read from the records
+CHAT_FIELDS = (
+    "conversation_id",
+    "source_external_id",
+    "user_id",
+    "user_name",
+    "user_avatar",
+    "user_profile_link",
+    "user_profile_phone",
+    "user_profile_email",
+)
+
+
+class ImportStats(BulkStats):
+    """
+    Progress and throughput of a chat import.
+
+    The failed ids are the conversation ids of the failed records, or "row N"
+    for a record without a conversation id.
+
+    Attributes:
+        rows (int): Records read.
+    """
+
+    rows: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Chats created per second."""
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+
+def read_chat_records(
+    lines: Iterable[str], record_format: RecordFormat = "jsonl"
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parses chat records from CSV (with a header row) or JSON lines.
+
+    Only the ChatAction.create parameters are kept and empty CSV cells are
+    dropped, so the records can be passed to the create method as they are.
+
+    :param lines: The lines of the CSV or JSONL input, e.g. a file object. CSV
+        lines must be passed unstripped, from a file opened with newline="", so
+        that quoted cells spanning several lines are kept whole.
+    :param record_format: "csv" or "jsonl". Defaults to "jsonl".
+    :return: An iterator of records.
+    """
+    if record_format == "csv":
+        rows = csv.DictReader(lines)
+    elif record_format == "jsonl":
+        rows = (json.loads(line) for line in lines if line.strip())
+    else:
+        raise ValueError(f"unsupported format {record_format!r}")
+
+    for row in rows:
+        yield {
+            field: row[field]
+            for field in CHAT_FIELDS
+            if row.get(field) not in (None, "")
+        }
+
+
+class ChatImporter(AbstractBulkJob):
+    """
+    Creates many chats concurrently, e.g. when migrating conversations from
+    another CRM.
+
+    Records are streamed with at most a few batches in flight, so the input may
+    be larger than memory. Requests go through the client, so its rate limiter
+    and retry policy apply to every chat, and its mapping store (if any) learns
+    the created chats.
+
+    Every created chat is appended to a JSONL checkpoint with the ids returned
+    by the API, and every failed one with its error. An interrupted import
+    started again with the same checkpoint skips the created conversations and
+    creates only the remaining ones.
+
+    Attributes:
+        client: The AmojoClient used to create the chats.
+        checkpoint_path (str): The JSONL file recording the created chats.
+        concurrency (int): Maximum number of chats created at once.
+    """
+
+    stats_model = ImportStats
+
+    def __init__(
+        self,
+        client: Any,
+        checkpoint_path: str,
+        concurrency: int = 8,
+        on_progress: Optional[Callable[[ImportStats], None]] = None,
+    ):
+        """
+        Initializes the ChatImporter.
+
+        :param client: The AmojoClient used to create the chats.
+        :param checkpoint_path: The checkpoint file, created if missing.
+        :param concurrency: Maximum chats created at once. Defaults to 8.
+        :param on_progress: Called with the stats after each record (optional).
+        """
+        super().__init__(client, on_progress=on_progress)
+        self.checkpoint_path = checkpoint_path
+        self.concurrency = concurrency
+
+        self._chat = ChatAction(client)
+
+    @property
+    def journal_path(self) -> str:
+        """The checkpoint recording the imported chats."""
+        return self.checkpoint_path
+
+    def _import_one(self, record: Dict[str, Any]) -> None:
+        """
+        Creates one chat and records it in the checkpoint.
+        """
+        conversation_id = record["conversation_id"]
+        try:
+            chat = self._chat.create(refresh=True, **record)
+        except Exception as e:
+            self._fail(conversation_id, str(e))
+            return
+
+        entry = {
+            "conversation_id": conversation_id,
+            "ref_id": chat.id,
+            "user_id": record.get("user_id"),
+            "user_ref_id": chat.user.id,
+        }
+        with self._lock:
+            self._record(entry)
+            self._stats.completed += 1
+        self._report()
+
+    def run(self, records: Iterable[Dict[str, Any]]) -> ImportStats:
+        """
+        Creates the chats of the records, skipping those already imported.
+
+        :param records: ChatAction.create parameters, see `read_chat_records`.
+        :return: The final ImportStats of the run.
+        """
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        completed = self.completed_ids()
+        self._start()
+
+        # Bounds the records read ahead of the workers
+        in_flight = threading.BoundedSemaphore(self.concurrency * 4)
+
+        def submit(record: Dict[str, Any]) -> None:
+            try:
+                self._import_one(record)
+            finally:
+                in_flight.release()
+
+        seen = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for record in records:
+                conversation_id = record.get("conversation_id")
+                with self._lock:
+                    self._stats.rows += 1
+                    row = self._stats.rows
+                if not conversation_id:
+                    self._fail(
+                        f"row {row}", "conversation_id is missing", journal=False
+                    )
+                    continue
+                with self._lock:
+                    if conversation_id in seen or conversation_id in completed:
+                        self._stats.skipped += 1
+                        continue
+                seen.add(conversation_id)
+                in_flight.acquire()
+                executor.submit(submit, record)
+        return self.stats()
@@ -0,0 +1,303 @@
+import os
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
+
+from amojowrapper.actions.history.action import HistoryAction
+from amojowrapper.actions.history.schemes import MessageItem
+from amojowrapper.bulk.base import AbstractBulkJob, BulkStats
+from amojowrapper.helpers.serializer import JSONEncoder
+
+ExportFormat = Literal["jsonl", "parquet"]
+
+MANIFEST_NAME = "manifest.jsonl"
+
+
+class ExportStats(BulkStats):
+    """
+    Progress and throughput of a history export, counting conversations. The
+    failed ids are conversation ref ids.
+
+    Attributes:
+        conversations (int): Conversations requested.
+        messages (int): Messages written by this run.
+    """
+
+    conversations: int = 0
+    messages: int = 0
+
+    @property
+    def messages_per_second(self) -> float:
+        """Messages written per second."""
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def conversations_per_second(self) -> float:
+        """Conversations exported per second."""
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+
+class JsonlHistoryWriter:
+    """
+    Writes messages of one conversation as JSON lines.
+    """
+
+    extension = "jsonl"
+
+    def __init__(self, path: str, conversation_ref_id: str, encoder: JSONEncoder):
+        self.conversation_ref_id = conversation_ref_id
+        self.encoder = encoder
+        self._file = open(path, "wb")
+
+    def write(self, item: MessageItem) -> None:
+        row = item.model_dump()
+        row["conversation_ref_id"] = self.conversation_ref_id
+        self._file.write(self.encoder(row))
+        self._file.write(b"\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetHistoryWriter:
+    """
+    Writes messages of one conversation to a Parquet file as flat columns, one
+    row group per `batch_size` messages.
+    """
+
+    extension = "parquet"
+
+    COLUMNS = (
+        "conversation_ref_id",
+        "timestamp",
+        "message_id",
+        "message_client_id",
+        "type",
+        "text",
+        "media",
+        "thumbnail",
+        "file_name",
+        "file_size",
+        "media_group_id",
+        "sender_id",
+        "sender_client_id",
+        "sender_name",
+        "receiver_id",
+        "receiver_client_id",
+        "receiver_name",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        conversation_ref_id: str,
+        encoder: JSONEncoder,
+        batch_size: int = 1000,
+    ):
+        try:
+            import pyarrow  # Optional dependency, required only for Parquet
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow: pip install amojowrapper[parquet]"
+            ) from e
+
+        self._pyarrow = pyarrow
+        self.conversation_ref_id = conversation_ref_id
+        self.batch_size = batch_size
+        self._schema = pyarrow.schema(
+            [
+                (
+                    name,
+                    (
+                        pyarrow.int64()
+                        if name in ("timestamp", "file_size")
+                        else pyarrow.string()
+                    ),
+                )
+                for name in self.COLUMNS
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, item: MessageItem) -> None:
+        message, sender, receiver = item.message, item.sender, item.receiver
+        self._rows.append(
+            {
+                "conversation_ref_id": self.conversation_ref_id,
+                "timestamp": item.timestamp,
+                "message_id": message.id,
+                "message_client_id": message.client_id,
+                "type": message.type,
+                "text": message.text,
+                "media": message.media,
+                "thumbnail": message.thumbnail,
+                "file_name": message.file_name,
+                "file_size": message.file_size,
+                "media_group_id": message.media_group_id,
+                "sender_id": sender.id,
+                "sender_client_id": sender.client_id,
+                "sender_name": sender.name,
+                "receiver_id": receiver.id if receiver else None,
+                "receiver_client_id": receiver.client_id if receiver else None,
+                "receiver_name": receiver.name if receiver else None,
+            }
+        )
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._rows:
+            self._writer.write_table(
+                self._pyarrow.Table.from_pylist(self._rows, schema=self._schema)
+            )
+            self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+WRITERS = {"jsonl": JsonlHistoryWriter, "parquet": ParquetHistoryWriter}
+
+
+class HistoryExporter(AbstractBulkJob):
+    """
+    Exports the history of many conversations concurrently to one file each.
+
+    Messages are streamed from HistoryAction.iter_messages straight to the file,
+    so a conversation is never held in memory. Requests go through the client, so
+    its rate limiter and retry policy apply to every page.
+
+    Each conversation is written to a temporary ".part" file which is renamed
+    once complete and recorded in `manifest.jsonl`. Failed conversations are
+    recorded there too, with their error, and are retried by the next run. An
+    interrupted export started again with the same output directory skips the
+    completed conversations and redoes only the unfinished ones.
+
+    A file is named after its percent-encoded ref id, so a ref id holding path
+    separators or ".." cannot write outside `output_dir`.
+
+    Attributes:
+        client: The AmojoClient used to fetch the history.
+        output_dir (str): The directory receiving the files and the manifest.
+        record_format (ExportFormat): "jsonl" or "parquet" (requires pyarrow).
+        concurrency (int): Maximum number of conversations fetched at once.
+        page_size (int): Number of messages requested per page.
+    """
+
+    key_field = "conversation_ref_id"
+    stats_model = ExportStats
+
+    def __init__(
+        self,
+        client: Any,
+        output_dir: str,
+        record_format: ExportFormat = "jsonl",
+        concurrency: int = 8,
+        page_size: int = 50,
+        on_progress: Optional[Callable[[ExportStats], None]] = None,
+    ):
+        """
+        Initializes the HistoryExporter.
+
+        :param client: The AmojoClient used to fetch the history.
+        :param output_dir: The output directory, created if missing.
+        :param record_format: "jsonl" or "parquet". Defaults to "jsonl".
+        :param concurrency: Maximum conversations fetched at once. Defaults to 8.
+        :param page_size: Number of messages requested per page. Defaults to 50.
+        :param on_progress: Called with the stats after each conversation (optional).
+        """
+        if record_format not in WRITERS:
+            raise ValueError(f"unsupported format {record_format!r}")
+
+        super().__init__(client, on_progress=on_progress)
+        self.output_dir = output_dir
+        self.record_format = record_format
+        self.concurrency = concurrency
+        self.page_size = page_size
+
+        self._history = HistoryAction(client)
+
+    @property
+    def manifest_path(self) -> str:
+        """The path of the manifest recording the exported conversations."""
+        return os.path.join(self.output_dir, MANIFEST_NAME)
+
+    @property
+    def journal_path(self) -> str:
+        """The manifest, see `manifest_path`."""
+        return self.manifest_path
+
+    def _file_path(self, conversation_ref_id: str) -> str:
+        # Percent-encoding escapes "/", backslashes and ":", and ".." cannot stand
+        # alone once the extension is appended
+        name = urllib.parse.quote(conversation_ref_id, safe="")
+        extension = WRITERS[self.record_format].extension
+        return os.path.join(self.output_dir, f"{name}.{extension}")
+
+    def _export_one(self, conversation_ref_id: str) -> None:
+        """
+        Exports one conversation and records it in the manifest.
+        """
+        path = self._file_path(conversation_ref_id)
+        part_path = path + ".part"
+        count = 0
+        try:
+            writer = WRITERS[self.record_format](
+                part_path, conversation_ref_id, self._encoder
+            )
+            try:
+                for item in self._history.iter_messages(
+                    conversation_ref_id, self.page_size
+                ):
+                    writer.write(item)
+                    count += 1
+            finally:
+                writer.close()
+            os.replace(part_path, path)
+        except Exception as e:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            self._fail(conversation_ref_id, str(e))
+            return
+
+        with self._lock:
+            self._record(
+                {
+                    "conversation_ref_id": conversation_ref_id,
+                    "status": "completed",
+                    "messages": count,
+                }
+            )
+            self._stats.completed += 1
+            self._stats.messages += count
+        self._report()
+
+    def export(self, conversation_ref_ids: Iterable[str]) -> ExportStats:
+        """
+        Exports the given conversations, skipping those already exported.
+
+        :param conversation_ref_ids: The conversation ref ids to export.
+        :return: The final ExportStats of the run.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        completed = self.completed_ids()
+        self._start()
+
+        pending = []
+        seen = set()
+        for conversation_ref_id in conversation_ref_ids:
+            if conversation_ref_id in seen:
+                continue
+            seen.add(conversation_ref_id)
+            if conversation_ref_id in completed:
+                self._stats.skipped += 1
+            else:
+                pending.append(conversation_ref_id)
+        self._stats.conversations = len(seen)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(self._export_one, pending))
+        return self.stats()
@@ -1,6 +1,9 @@
 from requests import Response
-from amojowrapper.core.client import AbstractAmojoClient
+from amojowrapper.core.client import AbstractAmojoClient, AbstractAsyncAmojoClient
 from typing import Optional
+from amojowrapper.helpers.serializer import JSONEncoder
+from amojowrapper.mapping import MappingStoreInterface
+from amojowrapper.request import AmojoSession, RateLimiter, ResponseCache, RetryPolicy
 
 
 class AmojoClient(AbstractAmojoClient):
@@ -19,6 +22,16 @@ class AmojoClient(AbstractAmojoClient):
         referer: str,
         amojo_account_token: str,
         debug: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keepalive_timeout: Optional[float] = 30.0,
+        json_encoder: Optional[JSONEncoder] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[AmojoSession] = None,
+        response_cache: Optional[ResponseCache] = None,
+        mapping_store: Optional[MappingStoreInterface] = None,
+        base_url: Optional[str] = None,
     ):
         """
         Initializes the AmojoClient with the given credentials.
@@ -29,6 +42,28 @@ class AmojoClient(AbstractAmojoClient):
             referer (str): The referer URL for the AmoCRM API.
             amojo_account_token (str): The token for the AmoCRM account.
             debug (bool, optional): Whether to enable debugging. Defaults to False.
+            pool_connections (int, optional): Number of per-host connection pools.
+                Defaults to 10.
+            pool_maxsize (int, optional): Maximum kept-alive connections per host.
+                Defaults to 10.
+            keepalive_timeout (Optional[float], optional): Seconds after which idle
+                connections are dropped. Defaults to 30.
+            json_encoder (Optional[JSONEncoder], optional): A callable encoding the
+                payload to JSON bytes. Defaults to orjson when installed.
+            retry_policy (Optional[RetryPolicy], optional): The policy retrying
+                throttled and failed requests. Defaults to no retries.
+            rate_limiter (Optional[RateLimiter], optional): The limiter throttling
+                requests per scope. Defaults to no limit.
+            session (Optional[AmojoSession], optional): A connection pool shared
+                with other clients, not closed by this client. Defaults to a pool
+                owned by the client.
+            response_cache (Optional[ResponseCache], optional): The cache of GET
+                responses. Defaults to no caching.
+            mapping_store (Optional[MappingStoreInterface], optional): Remembers
+                conversation and user ids for the actions. Defaults to None.
+            base_url (Optional[str], optional): The base URL of the chat API, e.g.
+                a proxy or a test server. Defaults to the URL derived from the
+                referer.
         """
         super().__init__(
             channel_secret=channel_secret,
@@ -36,6 +71,16 @@ class AmojoClient(AbstractAmojoClient):
             referer=referer,
             amojo_account_token=amojo_account_token,
             debug=debug,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keepalive_timeout=keepalive_timeout,
+            json_encoder=json_encoder,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            session=session,
+            response_cache=response_cache,
+            mapping_store=mapping_store,
+            base_url=base_url,
         )
 
     def custom_request(
@@ -61,3 +106,38 @@ class AmojoClient(AbstractAmojoClient):
         return self._request(
             method=method, endpoint=endpoint, data=data, debug=self.debug
         )
+
+
+class AsyncAmojoClient(AbstractAsyncAmojoClient):
+    """
+    An asyncio counterpart of AmojoClient.
+
+    It accepts the same arguments as AmojoClient, but `custom_request` is a
+    coroutine and requests are sent through an aiohttp connection pool, so many
+    requests can run concurrently on one event loop. Use it with the Async*
+    actions from `amojowrapper.actions`.
+    """
+
+    async def custom_request(
+        self,
+        method: str = "GET",
+        endpoint: Optional[str] = None,
+        data: Optional[list] = None,
+    ) -> Response:
+        """
+        Sends a custom HTTP request to the specified endpoint.
+
+        Args:
+            method (str): The HTTP method (GET, POST, etc.). Defaults to "GET".
+            endpoint (Optional[str]): The API endpoint to request. Defaults to None.
+            data (Optional[list]): The data to send with the request. Defaults to None.
+
+        Returns:
+            Response: The response object from the HTTP request.
+        """
+        if data is None:
+            data = []
+
+        return await self._request(
+            method=method, endpoint=endpoint, data=data, debug=self.debug
+        )
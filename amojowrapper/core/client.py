@@ -1,10 +1,20 @@
-import json
-from typing import Dict
+from typing import Dict, Optional
 from requests import Response
-from amojowrapper.request import CustomRequest
+from amojowrapper.request import (
+    CustomRequest,
+    AmojoSession,
+    PoolStats,
+    AsyncCustomRequest,
+    AsyncAmojoSession,
+    RetryPolicy,
+    RateLimiter,
+    ResponseCache,
+)
 
-from amojowrapper.helpers.endpoint import AmojoEndpoint
-from amojowrapper.helpers.headers import AmojoHeaderBuilder
+from amojowrapper.helpers.endpoint import AmojoEndpoint, get_endpoint_family
+from amojowrapper.helpers.headers import AmojoSigner
+from amojowrapper.helpers.serializer import JSONEncoder, get_default_json_encoder
+from amojowrapper.mapping import MappingStoreInterface
 
 
 class AbstractAmojoClient:
@@ -20,6 +30,13 @@ class AbstractAmojoClient:
         amojo_base_url: The base URL for AmoCRM API.
         amojo_account_token: The account token for the AmoCRM API.
         debug: A flag to enable or disable debugging output.
+        session: The keep-alive connection pool shared by all actions of the client.
+        json_encoder: The callable encoding request payloads to JSON bytes.
+        retry_policy: The policy retrying throttled and failed requests, if any.
+        rate_limiter: The limiter throttling requests per scope, if any.
+        response_cache: The cache of GET responses, if any.
+        mapping_store: The store of conversation ids used by the actions, if any.
+        signer: The signer producing the request headers.
     """
 
     def __init__(
@@ -29,6 +46,16 @@ class AbstractAmojoClient:
         referer: str,
         amojo_account_token: str,
         debug: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keepalive_timeout: Optional[float] = 30.0,
+        json_encoder: Optional[JSONEncoder] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[AmojoSession] = None,
+        response_cache: Optional[ResponseCache] = None,
+        mapping_store: Optional[MappingStoreInterface] = None,
+        base_url: Optional[str] = None,
     ):
         """
         Initializes the AbstractAmojoClient with the necessary credentials and configurations.
@@ -39,12 +66,132 @@ class AbstractAmojoClient:
             referer (str): The referer to get the base URL.
             amojo_account_token (str): The account token for the AmoCRM API.
             debug (bool): A flag to enable or disable debugging output. Default is False.
+            pool_connections (int): Number of per-host connection pools. Default is 10.
+            pool_maxsize (int): Maximum kept-alive connections per host. Default is 10.
+            keepalive_timeout (Optional[float]): Seconds after which idle connections
+                are dropped. None keeps them open forever. Default is 30.
+            json_encoder (Optional[JSONEncoder]): A callable encoding the payload to
+                JSON bytes. Defaults to orjson when installed, json otherwise.
+            retry_policy (Optional[RetryPolicy]): The policy retrying throttled and
+                failed requests. Requests are not retried by default.
+            rate_limiter (Optional[RateLimiter]): The limiter throttling requests of
+                the client's scope. It may be shared between clients. Defaults to None.
+            session (Optional[AmojoSession]): A connection pool shared with other
+                clients. It is not closed by the client and the pool options are
+                ignored. Defaults to a pool owned by the client.
+            response_cache (Optional[ResponseCache]): The cache of GET responses,
+                coalescing identical concurrent reads. It may be shared between
+                clients. Responses are not cached by default.
+            mapping_store (Optional[MappingStoreInterface]): Remembers conversation
+                and user ids so that ChatAction and MessageAction can resolve them
+                locally. It may be shared between clients. Defaults to None.
+            base_url (Optional[str]): The base URL of the chat API, e.g. a proxy or a
+                test server. Defaults to the URL derived from the referer.
         """
         self.channel_secret = channel_secret
         self.channel_id = channel_id
-        self.amojo_base_url = AmojoEndpoint(referer=referer).get_base_url()
+        self.amojo_base_url = (
+            base_url.rstrip("/")
+            if base_url
+            else AmojoEndpoint(referer=referer).get_base_url()
+        )
         self.amojo_account_token = amojo_account_token
         self.debug = debug
+        self.json_encoder = json_encoder or get_default_json_encoder()
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.mapping_store = mapping_store
+        self.signer = AmojoSigner(channel_secret)
+        # Scope ID is a combination of channel ID and account token
+        self.scope_id = f"{channel_id}_{amojo_account_token}"
+        self._owns_session = session is None
+        self.session = session or self._create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keepalive_timeout=keepalive_timeout,
+        )
+
+    def _create_session(self, **pool_config) -> AmojoSession:
+        """
+        Creates the connection pool owned by the client.
+
+        Args:
+            pool_config: pool_connections, pool_maxsize and keepalive_timeout.
+
+        Returns:
+            AmojoSession: The pooled session shared by all actions.
+        """
+        return AmojoSession(**pool_config)
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Returns the connection reuse counters of the client's pool.
+
+        Returns:
+            PoolStats: The number of requests, new and reused connections.
+        """
+        return self.session.stats()
+
+    def close(self) -> None:
+        """
+        Closes the connection pool of the client, unless it is shared.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> "AbstractAmojoClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _sign_request(self, method: str, endpoint: str, body: bytes) -> Dict[str, str]:
+        """
+        Builds the signed headers for an already encoded request body.
+
+        The payload is encoded once per request and the same bytes are sent as the
+        body, so the Content-MD5 and X-Signature headers always match what the
+        server receives. The headers are rebuilt on every retry to refresh the Date.
+
+        Args:
+            method (str): The HTTP method (GET, POST, etc.).
+            endpoint (str): The endpoint of the AmoCRM API.
+            body (bytes): The encoded payload.
+
+        Returns:
+            Dict[str, str]: The Date, Content-Type, Content-MD5 and X-Signature headers.
+        """
+        if self.signer.channel_secret != self.channel_secret:
+            self.signer = AmojoSigner(self.channel_secret)
+        return self.signer.sign(method, endpoint, body)
+
+    @staticmethod
+    def _is_idempotent(method: str, family: str, data: Optional[Dict]) -> bool:
+        """
+        Tells whether resending a request cannot duplicate its effect.
+
+        Reads, typing events, delivery statuses and reactions set a state and may
+        be resent. A message is deduplicated by amojo only when it carries a
+        msgid, while connecting a channel and creating a chat are never resent
+        blindly.
+
+        Args:
+            method (str): The HTTP method (GET, POST, etc.).
+            family (str): The endpoint family.
+            data (Optional[Dict]): The payload data of the request.
+
+        Returns:
+            bool: True if the request may be retried after any retryable error.
+        """
+        if method.upper() in ("GET", "HEAD", "PUT", "DELETE"):
+            return True
+        if family in ("typing", "delivery_status", "react"):
+            return True
+        if family == "messages" and isinstance(data, dict):
+            payload = data.get("payload")
+            return isinstance(payload, dict) and bool(payload.get("msgid"))
+        return False
 
     def _request(
         self, method: str, endpoint: str, data: Dict = None, debug: bool = False
@@ -61,19 +208,110 @@ class AbstractAmojoClient:
         Returns:
             Response: The response object from the HTTP request.
         """
-        payload_str = json.dumps(data)
+        body = self.json_encoder(data)
+        url = f"{self.amojo_base_url}{endpoint}"
+        family = get_endpoint_family(endpoint)
+
+        def send() -> Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.scope_id, family)
+
+            return CustomRequest.request(
+                method=method,
+                url=url,
+                headers=self._sign_request(method, endpoint, body),
+                data=body,
+                debug=debug,
+                session=self.session,
+            )
+
+        def execute() -> Response:
+            if self.retry_policy is None:
+                return send()
+            return self.retry_policy.execute(
+                send, family, self._is_idempotent(method, family, data)
+            )
+
+        if self.response_cache is not None and method.upper() == "GET":
+            return self.response_cache.get_or_fetch(url, family, execute)
+        return execute()
+
+
+class AbstractAsyncAmojoClient(AbstractAmojoClient):
+    """
+    Represents an asyncio client to interact with the amoCRM API.
+
+    It shares credentials handling and request signing with AbstractAmojoClient,
+    but sends requests through an aiohttp based AsyncAmojoSession.
+    """
+
+    def _create_session(self, **pool_config) -> AsyncAmojoSession:
+        """
+        Creates the asyncio connection pool owned by the client.
 
-        headers = (
-            AmojoHeaderBuilder()
-            .add_date()
-            .add_content_type()
-            .add_content_md5(payload_str)
-            .add_signature(self.channel_secret, method, endpoint, payload_str)
-            .build()
-        )
+        Args:
+            pool_config: pool_connections, pool_maxsize and keepalive_timeout.
+
+        Returns:
+            AsyncAmojoSession: The pooled session shared by all async actions.
+        """
+        return AsyncAmojoSession(**pool_config)
+
+    async def close(self) -> None:
+        """
+        Closes the connection pool of the client, unless it is shared.
+        """
+        if self._owns_session:
+            await self.session.close()
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncAmojoClient")
 
+    async def __aenter__(self) -> "AbstractAsyncAmojoClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _request(
+        self, method: str, endpoint: str, data: Dict = None, debug: bool = False
+    ) -> Response:
+        """
+        Executes an HTTP request to the AmoCRM API without blocking the event loop.
+
+        Args:
+            method (str): The HTTP method (GET, POST, etc.).
+            endpoint (str): The endpoint of the AmoCRM API.
+            data (Dict, optional): The payload data for the request. Defaults to None.
+            debug (bool, optional): Whether to enable debug output. Defaults to False.
+
+        Returns:
+            Response: The response object from the HTTP request.
+        """
+        body = self.json_encoder(data)
         url = f"{self.amojo_base_url}{endpoint}"
+        family = get_endpoint_family(endpoint)
 
-        return CustomRequest.request(
-            method=method, url=url, headers=headers, data=data, debug=debug
-        )
+        async def send() -> Response:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(self.scope_id, family)
+
+            return await AsyncCustomRequest.request(
+                method=method,
+                url=url,
+                headers=self._sign_request(method, endpoint, body),
+                data=body,
+                debug=debug,
+                session=self.session,
+            )
+
+        async def execute() -> Response:
+            if self.retry_policy is None:
+                return await send()
+            return await self.retry_policy.execute_async(
+                send, family, self._is_idempotent(method, family, data)
+            )
+
+        if self.response_cache is not None and method.upper() == "GET":
+            return await self.response_cache.get_or_fetch_async(url, family, execute)
+        return await execute()
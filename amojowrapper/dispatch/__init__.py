@@ -0,0 +1,6 @@
+from amojowrapper.dispatch.lanes import (
+    AsyncLaneDispatcher,
+    LaneDispatcher,
+    LaneStats,
+    conversation_key,
+)
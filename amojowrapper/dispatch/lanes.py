@@ -0,0 +1,346 @@
+import asyncio
+import inspect
+import queue
+import threading
+import zlib
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class LaneStats(BaseModel):
+    """
+    Counters of a lane dispatcher.
+
+    Attributes:
+        lanes (int): Number of lanes.
+        submitted (int): Calls submitted.
+        completed (int): Calls that returned.
+        failed (int): Calls that raised an exception.
+        depths (List[int]): Calls waiting or running, per lane.
+        max_depth (int): The highest lane depth observed.
+    """
+
+    lanes: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    depths: List[int] = []
+    max_depth: int = 0
+
+
+def conversation_key(kwargs: Dict[str, Any]) -> str:
+    """
+    Returns the lane key of action parameters: their conversation_id, or else
+    their conversation_ref_id.
+
+    :param kwargs: Action parameters, e.g. those of MessageAction.send.
+    :return: The lane key.
+    :raises ValueError: If neither conversation_id nor conversation_ref_id is given.
+    """
+    key = kwargs.get("conversation_id") or kwargs.get("conversation_ref_id")
+    if not key:
+        raise ValueError(
+            "Either conversation_id or conversation_ref_id must be provided"
+        )
+    return key
+
+
+def _cancelling() -> bool:
+    """
+    Returns whether the current task itself is being cancelled. Before Python
+    3.11 this cannot be told apart from a cancelled awaitable, and is False.
+    """
+    cancelling = getattr(asyncio.current_task(), "cancelling", None)
+    return cancelling is not None and cancelling() > 0
+
+
+class AbstractLaneDispatcher:
+    """
+    Shards calls onto ordered lanes by key, for LaneDispatcher and
+    AsyncLaneDispatcher.
+
+    Calls with the same key (e.g. a conversation id) always land on the same lane
+    and run one after another in submission order, while the lanes run in
+    parallel. Keys are spread over the lanes by CRC32, so the mapping is the same
+    in every process. A conversation must always be referred to by the same key
+    (its conversation_id, or its conversation_ref_id) for its calls to be ordered.
+
+    Attributes:
+        lanes (int): Number of lanes, i.e. of calls running at once.
+        max_queue (int): Maximum calls waiting per lane, 0 for unbounded.
+            Submitting to a full lane blocks until it has room.
+    """
+
+    def __init__(self, lanes: int = 16, max_queue: int = 0):
+        """
+        Initializes the dispatcher state.
+
+        :param lanes: Number of lanes. Defaults to 16.
+        :param max_queue: Maximum calls waiting per lane. Defaults to unbounded.
+        """
+        if lanes < 1:
+            raise ValueError("lanes must be at least 1")
+        self.lanes = lanes
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._depths = [0] * lanes
+        self._stats = LaneStats(lanes=lanes)
+
+    def lane_of(self, key: str) -> int:
+        """
+        Returns the lane running the calls of a key.
+
+        :param key: The ordering key, e.g. a conversation id.
+        :return: The lane index.
+        """
+        return zlib.crc32(key.encode()) % self.lanes
+
+    def _enter(self, lane: int) -> None:
+        with self._lock:
+            self._stats.submitted += 1
+            self._depths[lane] += 1
+            self._stats.max_depth = max(self._stats.max_depth, self._depths[lane])
+
+    def _leave(self, lane: int, success: bool) -> None:
+        with self._lock:
+            self._depths[lane] -= 1
+            if success:
+                self._stats.completed += 1
+            else:
+                self._stats.failed += 1
+
+    def stats(self) -> LaneStats:
+        """
+        Returns a snapshot of the dispatcher counters and lane depths.
+
+        :return: An instance of LaneStats.
+        """
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.depths = list(self._depths)
+        return stats
+
+
+class LaneDispatcher(AbstractLaneDispatcher):
+    """
+    Runs calls on ordered lanes of worker threads (see AbstractLaneDispatcher).
+
+    Example:
+        with LaneDispatcher(lanes=16) as lanes:
+            lanes.dispatch(message.send, conversation_id="c1", ...)
+            lanes.dispatch(react.set, conversation_id="c1", ...)  # runs after send
+    """
+
+    def __init__(self, lanes: int = 16, max_queue: int = 0):
+        """
+        Initializes the LaneDispatcher and starts one thread per lane.
+
+        :param lanes: Number of lanes. Defaults to 16.
+        :param max_queue: Maximum calls waiting per lane. Defaults to unbounded.
+        """
+        super().__init__(lanes=lanes, max_queue=max_queue)
+        self._queues: List["queue.Queue"] = [
+            queue.Queue(max_queue) for _ in range(lanes)
+        ]
+        self._closed = False
+        # Submits between their closed check and their put, awaited by close()
+        self._submitting = 0
+        self._submit_cond = threading.Condition()
+        self._threads = [
+            threading.Thread(
+                target=self._run,
+                args=(lane,),
+                name=f"amojowrapper-lane-{lane}",
+                daemon=True,
+            )
+            for lane in range(lanes)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key: str, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queues a call on the lane of a key.
+
+        :param key: The ordering key, e.g. a conversation id.
+        :param fn: The function to call.
+        :return: A Future resolving to the result of the call.
+        :raises RuntimeError: If the dispatcher is closed.
+        """
+        with self._submit_cond:
+            if self._closed:
+                raise RuntimeError("the lane dispatcher is closed")
+            self._submitting += 1
+        try:
+            lane = self.lane_of(key)
+            future = Future()
+            self._enter(lane)
+            self._queues[lane].put((future, fn, args, kwargs))
+        finally:
+            with self._submit_cond:
+                self._submitting -= 1
+                self._submit_cond.notify_all()
+        return future
+
+    def dispatch(self, fn: Callable, **kwargs) -> Future:
+        """
+        Queues an action call on the lane of its conversation.
+
+        :param fn: The action method, e.g. MessageAction.send of an instance.
+        :param kwargs: The action parameters, with conversation_id or
+            conversation_ref_id.
+        :return: A Future resolving to the result of the call.
+        """
+        return self.submit(conversation_key(kwargs), fn, **kwargs)
+
+    def _run(self, lane: int) -> None:
+        """
+        The worker loop of a lane.
+        """
+        lane_queue = self._queues[lane]
+        while True:
+            item = lane_queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                self._leave(lane, success=False)
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                self._leave(lane, success=False)
+                future.set_exception(e)
+            else:
+                self._leave(lane, success=True)
+                future.set_result(result)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Runs the queued calls and stops the lane threads.
+
+        :param timeout: Seconds to wait for each lane thread to finish.
+        """
+        with self._submit_cond:
+            if self._closed:
+                return
+            self._closed = True
+            # The stop sentinels must come after every accepted call
+            self._submit_cond.wait_for(lambda: self._submitting == 0)
+        for lane_queue in self._queues:
+            lane_queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncLaneDispatcher(AbstractLaneDispatcher):
+    """
+    Asynchronous counterpart of LaneDispatcher with one worker task per lane.
+
+    Coroutine functions are awaited on the lane; regular functions are called
+    directly, and awaited if they return an awaitable. The lane tasks start on
+    the first submitted call.
+    """
+
+    def __init__(self, lanes: int = 16, max_queue: int = 0):
+        """
+        Initializes the AsyncLaneDispatcher.
+
+        :param lanes: Number of lanes. Defaults to 16.
+        :param max_queue: Maximum calls waiting per lane. Defaults to unbounded.
+        """
+        super().__init__(lanes=lanes, max_queue=max_queue)
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def _start(self) -> None:
+        """
+        Starts the lane tasks on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        self._queues = [asyncio.Queue(self.max_queue) for _ in range(self.lanes)]
+        self._tasks = [
+            loop.create_task(self._run(lane_queue, lane))
+            for lane, lane_queue in enumerate(self._queues)
+        ]
+
+    async def submit(self, key: str, fn: Callable, *args, **kwargs) -> asyncio.Future:
+        """
+        Queues a call on the lane of a key.
+
+        :param key: The ordering key, e.g. a conversation id.
+        :param fn: The coroutine function or function to call.
+        :return: A Future resolving to the result of the call.
+        """
+        if not self._tasks:
+            self._start()
+        lane = self.lane_of(key)
+        future = asyncio.get_running_loop().create_future()
+        self._enter(lane)
+        await self._queues[lane].put((future, fn, args, kwargs))
+        return future
+
+    async def dispatch(self, fn: Callable, **kwargs) -> asyncio.Future:
+        """
+        Queues an action call on the lane of its conversation.
+
+        :param fn: The action method, e.g. AsyncMessageAction.send of an instance.
+        :param kwargs: The action parameters, with conversation_id or
+            conversation_ref_id.
+        :return: A Future resolving to the result of the call.
+        """
+        return await self.submit(conversation_key(kwargs), fn, **kwargs)
+
+    async def _run(self, lane_queue: asyncio.Queue, lane: int) -> None:
+        """
+        The worker task of a lane.
+        """
+        while True:
+            item = await lane_queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if future.cancelled():
+                self._leave(lane, success=False)
+                continue
+            try:
+                result = fn(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+            except asyncio.CancelledError:
+                # A call cancelling itself must not stop the lane
+                self._leave(lane, success=False)
+                future.cancel()
+                if _cancelling():
+                    raise
+            except Exception as e:
+                self._leave(lane, success=False)
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                self._leave(lane, success=True)
+                if not future.cancelled():
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        """
+        Runs the queued calls and stops the lane tasks.
+        """
+        tasks, self._tasks = self._tasks, []
+        for lane_queue in self._queues:
+            await lane_queue.put(None)
+        await asyncio.gather(*tasks)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
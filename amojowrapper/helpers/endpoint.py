@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 
 class AmojoEndpoint:
@@ -31,5 +32,53 @@ class AmojoEndpoint:
         Returns:
             str: The base URL for the amoCRM API (e.g., https://amojo.amocrm.ru).
         """
-        segment = re.sub(r"^.*?\.", "", self.referer)
-        return f"https://amojo.{segment}"
+        return get_base_url(self.referer)
+
+
+@lru_cache(maxsize=4096)
+def get_base_url(referer: str) -> str:
+    """
+    Returns the base URL of the chat API for a referer, caching the result.
+
+    Args:
+        referer (str): The referer URL (e.g., example.amocrm.ru).
+
+    Returns:
+        str: The base URL for the amoCRM API (e.g., https://amojo.amocrm.ru).
+    """
+    segment = re.sub(r"^.*?\.", "", referer)
+    return f"https://amojo.{segment}"
+
+
+ENDPOINT_FAMILIES = {
+    "connect",
+    "disconnect",
+    "chats",
+    "history",
+    "typing",
+    "react",
+    "delivery_status",
+}
+
+
+def get_endpoint_family(endpoint: str) -> str:
+    """
+    Returns the family of a chat API endpoint, ignoring scope, chat and message ids.
+
+    For example `/v2/origin/custom/{scope_id}/{msgid}/delivery_status` belongs to the
+    "delivery_status" family and `/v2/origin/custom/{scope_id}` to "messages".
+
+    Args:
+        endpoint (str): The endpoint path, optionally with a query string.
+
+    Returns:
+        str: The endpoint family name.
+    """
+    parts = [part for part in endpoint.split("?", 1)[0].split("/") if part]
+    rest = parts[4:]  # Skip "v2", "origin", "custom" and the scope id
+
+    if not rest:
+        return "messages"
+    if rest[-1] in ENDPOINT_FAMILIES:
+        return rest[-1]
+    return rest[0]
@@ -1,6 +1,10 @@
 import hashlib
 import hmac
 import datetime
+import time
+from typing import Union
+
+DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
 
 
 class AmojoHeaderBuilder:
@@ -16,9 +20,7 @@ class AmojoHeaderBuilder:
         Adds the Date header.
         """
         # Используем timezone-aware объект для представления времени в UTC
-        date = datetime.datetime.now(datetime.timezone.utc).strftime(
-            "%a, %d %b %Y %H:%M:%S GMT"
-        )
+        date = datetime.datetime.now(datetime.timezone.utc).strftime(DATE_FORMAT)
         self.headers["Date"] = date
         return self
 
@@ -31,15 +33,21 @@ class AmojoHeaderBuilder:
         self.headers["Content-Type"] = content_type
         return self
 
-    def add_content_md5(self, payload: str) -> "AmojoHeaderBuilder":
+    def add_content_md5(self, payload: Union[str, bytes]) -> "AmojoHeaderBuilder":
         """
         Adds the Content-MD5 header.
         """
-        self.headers["Content-MD5"] = hashlib.md5(payload.encode()).hexdigest()
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self.headers["Content-MD5"] = hashlib.md5(payload).hexdigest()
         return self
 
     def add_signature(
-        self, channel_secret: str, method: str, endpoint: str, payload: str
+        self,
+        channel_secret: str,
+        method: str,
+        endpoint: str,
+        payload: Union[str, bytes],
     ) -> "AmojoHeaderBuilder":
         """
         Adds the X-Signature header.
@@ -64,3 +72,57 @@ class AmojoHeaderBuilder:
         Returns the final dictionary of headers.
         """
         return self.headers
+
+
+class AmojoSigner:
+    """
+    Reusable request signer of a client, producing the same headers as
+    AmojoHeaderBuilder at a fraction of the cost.
+
+    The Date header is formatted once per second, the channel secret is keyed into
+    an HMAC object once and copied for every request, and the headers are
+    returned as a single dictionary.
+
+    Attributes:
+        channel_secret (str): The secret key for the channel.
+        content_type (str): The Content-Type header value.
+    """
+
+    def __init__(self, channel_secret: str, content_type: str = "application/json"):
+        self.channel_secret = channel_secret
+        self.content_type = content_type
+        self._hmac = hmac.new(channel_secret.encode(), digestmod=hashlib.sha1)
+        self._date = (0, "")
+
+    def get_date(self) -> str:
+        """
+        Returns the Date header value, formatted at most once per second.
+        """
+        second = int(time.time())
+        cached_second, date = self._date
+        if second != cached_second:
+            date = time.strftime(DATE_FORMAT, time.gmtime(second))
+            self._date = (second, date)
+        return date
+
+    def sign(
+        self, method: str, endpoint: str, payload: Union[str, bytes]
+    ) -> dict[str, str]:
+        """
+        Returns the Date, Content-Type, Content-MD5 and X-Signature headers.
+        """
+        if isinstance(payload, str):
+            payload = payload.encode()
+        date = self.get_date()
+        content_md5 = hashlib.md5(payload).hexdigest()
+
+        mac = self._hmac.copy()
+        mac.update(
+            f"{method}\n{content_md5}\n{self.content_type}\n{date}\n{endpoint}".encode()
+        )
+        return {
+            "Date": date,
+            "Content-Type": self.content_type,
+            "Content-MD5": content_md5,
+            "X-Signature": mac.hexdigest(),
+        }
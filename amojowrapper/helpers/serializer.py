@@ -0,0 +1,30 @@
+import json
+from typing import Any, Callable
+
+JSONEncoder = Callable[[Any], bytes]
+
+
+def stdlib_json_encoder(data: Any) -> bytes:
+    """
+    Encodes data to JSON bytes with the standard library json module.
+
+    :param data: The data to encode.
+    :return: The encoded JSON document.
+    """
+    return json.dumps(data).encode()
+
+
+def get_default_json_encoder() -> JSONEncoder:
+    """
+    Returns the fastest available JSON encoder.
+
+    orjson is used when it is installed (pip install amojowrapper[fast]),
+    otherwise the standard library json module.
+
+    :return: A callable encoding data to JSON bytes.
+    """
+    try:
+        import orjson  # Optional dependency, used only when installed
+    except ImportError:
+        return stdlib_json_encoder
+    return orjson.dumps
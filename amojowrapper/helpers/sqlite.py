@@ -0,0 +1,22 @@
+import sqlite3
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """
+    Opens a SQLite database shared between threads, in WAL mode.
+
+    WAL lets readers work while a writer appends, and synchronous=NORMAL keeps
+    commits durable across process crashes without an fsync per transaction.
+    Callers are responsible for serializing access with their own lock.
+
+    Args:
+        path (str): The database file path, or ":memory:".
+
+    Returns:
+        sqlite3.Connection: The configured connection.
+    """
+    connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.row_factory = sqlite3.Row
+    return connection
@@ -0,0 +1,6 @@
+from amojowrapper.mapping.store import (
+    ConversationMapping,
+    ConversationMappingStore,
+    MappingStats,
+    MappingStoreInterface,
+)
@@ -0,0 +1,238 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from pydantic import BaseModel
+
+from amojowrapper.helpers.sqlite import connect
+
+
+class ConversationMapping(BaseModel):
+    """
+    The ids of a conversation and of its client on both sides of the chat API.
+
+    Attributes:
+        conversation_id (str): The conversation id on the integration side.
+        ref_id (Optional[str]): The conversation id in the chat API.
+        user_id (Optional[str]): The client's user id on the integration side.
+        user_ref_id (Optional[str]): The client's user id in the chat API.
+        user_name (Optional[str]): The client's name.
+    """
+
+    conversation_id: str
+    ref_id: Optional[str] = None
+    user_id: Optional[str] = None
+    user_ref_id: Optional[str] = None
+    user_name: Optional[str] = None
+
+
+class MappingStats(BaseModel):
+    """
+    Counters of a ConversationMappingStore.
+
+    Attributes:
+        entries (int): Mappings held in memory.
+        hits (int): Lookups served from memory.
+        misses (int): Lookups not found in memory.
+        evictions (int): Mappings dropped from memory to stay under `max_entries`.
+    """
+
+    entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class MappingStoreInterface(ABC):
+    """
+    Interface of the stores remembering conversation ids per scope.
+
+    Implement it to keep the mapping elsewhere, e.g. in a shared cache server.
+    """
+
+    @abstractmethod
+    def get(self, scope_id: str, conversation_id: str) -> Optional[ConversationMapping]:
+        """
+        Returns the mapping of a conversation, or None if unknown.
+
+        :param scope_id: The scope id of the channel.
+        :param conversation_id: The conversation id on the integration side.
+        """
+
+    @abstractmethod
+    def put(self, scope_id: str, mapping: ConversationMapping) -> ConversationMapping:
+        """
+        Merges the known ids of a conversation into the store.
+
+        :param scope_id: The scope id of the channel.
+        :param mapping: The ids to remember; None fields keep the stored value.
+        :return: The merged mapping.
+        """
+
+
+class ConversationMappingStore(MappingStoreInterface):
+    """
+    Remembers conversation and user ids in a bounded in-memory LRU, optionally
+    written through to SQLite (WAL) so the mapping survives restarts.
+
+    The mapping is filled from ChatAction and MessageAction responses and from
+    webhooks (see `remember_webhook`), and lets ChatAction and MessageAction
+    resolve ids locally instead of calling the API.
+
+    Attributes:
+        max_entries (int): Maximum number of mappings held in memory.
+        path (Optional[str]): The SQLite database path, None for memory only.
+    """
+
+    def __init__(self, max_entries: int = 100_000, path: Optional[str] = None):
+        """
+        Initializes the store.
+
+        :param max_entries: Mappings held in memory. Defaults to 100000.
+        :param path: The SQLite database path. Defaults to memory only.
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], ConversationMapping]" = (
+            OrderedDict()
+        )
+        self._stats = MappingStats()
+
+        self._connection = None
+        if path is not None:
+            self._connection = connect(path)
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS conversation_mapping (
+                    scope_id TEXT NOT NULL,
+                    conversation_id TEXT NOT NULL,
+                    ref_id TEXT,
+                    user_id TEXT,
+                    user_ref_id TEXT,
+                    user_name TEXT,
+                    PRIMARY KEY (scope_id, conversation_id)
+                ) WITHOUT ROWID
+                """)
+
+    def _remember(self, key: Tuple[str, str], mapping: ConversationMapping) -> None:
+        """
+        Puts a mapping in memory. Must be called under the lock.
+        """
+        self._entries[key] = mapping
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _load(self, key: Tuple[str, str]) -> Optional[ConversationMapping]:
+        """
+        Reads a mapping from SQLite. Must be called under the lock.
+        """
+        if self._connection is None:
+            return None
+        row = self._connection.execute(
+            "SELECT conversation_id, ref_id, user_id, user_ref_id, user_name "
+            "FROM conversation_mapping WHERE scope_id = ? AND conversation_id = ?",
+            key,
+        ).fetchone()
+        return ConversationMapping(**dict(row)) if row else None
+
+    def get(self, scope_id: str, conversation_id: str) -> Optional[ConversationMapping]:
+        """
+        Returns the mapping of a conversation, or None if unknown.
+
+        :param scope_id: The scope id of the channel.
+        :param conversation_id: The conversation id on the integration side.
+        :return: The ConversationMapping or None.
+        """
+        key = (scope_id, conversation_id)
+        with self._lock:
+            mapping = self._entries.get(key)
+            if mapping is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return mapping
+
+            self._stats.misses += 1
+            mapping = self._load(key)
+            if mapping is not None:
+                self._remember(key, mapping)
+            return mapping
+
+    def put(self, scope_id: str, mapping: ConversationMapping) -> ConversationMapping:
+        """
+        Merges the known ids of a conversation into the store.
+
+        :param scope_id: The scope id of the channel.
+        :param mapping: The ids to remember; None fields keep the stored value.
+        :return: The merged mapping.
+        """
+        key = (scope_id, mapping.conversation_id)
+        with self._lock:
+            current = self._entries.get(key) or self._load(key)
+            if current is not None:
+                mapping = current.model_copy(
+                    update=mapping.model_dump(exclude_none=True)
+                )
+                if mapping == current:
+                    self._remember(key, current)
+                    return current
+
+            self._remember(key, mapping)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO conversation_mapping (scope_id, "
+                    "conversation_id, ref_id, user_id, user_ref_id, user_name) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        scope_id,
+                        mapping.conversation_id,
+                        mapping.ref_id,
+                        mapping.user_id,
+                        mapping.user_ref_id,
+                        mapping.user_name,
+                    ),
+                )
+        return mapping
+
+    def remember_webhook(self, scope_id: str, event) -> None:
+        """
+        Remembers the ids carried by a webhook message event.
+
+        :param scope_id: The scope id of the channel receiving the webhook.
+        :param event: A WebhookEvent; events without a message are ignored.
+        """
+        message = getattr(event, "message", None)
+        if message is None or not message.conversation.client_id:
+            return
+        self.put(
+            scope_id,
+            ConversationMapping(
+                conversation_id=message.conversation.client_id,
+                ref_id=message.conversation.id,
+                user_id=message.receiver.client_id,
+                user_ref_id=message.receiver.id,
+                user_name=message.receiver.name,
+            ),
+        )
+
+    def stats(self) -> MappingStats:
+        """
+        Returns a snapshot of the store counters.
+
+        :return: An instance of MappingStats.
+        """
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.entries = len(self._entries)
+        return stats
+
+    def close(self) -> None:
+        """
+        Closes the SQLite connection, if any.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
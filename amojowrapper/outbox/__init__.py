@@ -0,0 +1,2 @@
+from amojowrapper.outbox.outbox import Outbox
+from amojowrapper.outbox.store import OutboxItem, OutboxStats, OutboxStore
@@ -0,0 +1,268 @@
+import json
+import threading
+from typing import Any, Optional
+
+from loguru import logger
+
+from amojowrapper.actions.delivery.action import DeliveryStatusAction
+from amojowrapper.actions.message.action import MessageAction
+from amojowrapper.actions.react.action import ReactAction
+from amojowrapper.outbox.store import OutboxStats, OutboxStore
+from amojowrapper.request import RequestError, RetryPolicy
+
+
+class Outbox:
+    """
+    An opt-in durable outbox for messages, delivery statuses and reactions.
+
+    Calls are journaled to a local SQLite file before anything is sent, with the
+    msgid generated up front. A background sender drains the journal in order and
+    in batches through the client (so its retry policy and rate limiter apply),
+    and marks acknowledged items. This gives at-least-once delivery across process
+    restarts, with duplicates filtered by msgid both locally and by amojo.
+
+    Attributes:
+        client: The AmojoClient used to send the journaled requests.
+        store (OutboxStore): The SQLite journal.
+        batch_size (int): Maximum number of items sent per drain iteration.
+        poll_interval (float): Seconds between drains of the background sender.
+        retention (float): Seconds acknowledged items are kept for deduplication
+            before the background sender compacts them.
+        max_backoff (float): Upper bound of the pause of the background sender
+            after an unexpected error.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str = "amojowrapper_outbox.sqlite3",
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        retention: float = 3600.0,
+        max_backoff: float = 60.0,
+    ):
+        """
+        Initializes the Outbox.
+
+        :param client: The AmojoClient used to send the journaled requests.
+        :param path: The SQLite journal path. Defaults to "amojowrapper_outbox.sqlite3".
+        :param batch_size: Maximum number of items sent per iteration. Defaults to 100.
+        :param poll_interval: Seconds between drains. Defaults to 1.
+        :param retention: Seconds acknowledged items are kept. Defaults to 3600.
+        :param max_backoff: Maximum pause after an unexpected error. Defaults to 60.
+        """
+        self.client = client
+        self.store = OutboxStore(path)
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.max_backoff = max_backoff
+
+        self._message = MessageAction(client)
+        self._delivery = DeliveryStatusAction(client)
+        self._react = ReactAction(client)
+        self._retry_policy = getattr(client, "retry_policy", None) or RetryPolicy()
+
+        self._drain_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def send_message(self, **kwargs) -> str:
+        """
+        Journals a new message.
+
+        :param kwargs: The same arguments as MessageAction.send.
+        :return: The msgid of the message, generated if not given.
+        """
+        body = self._message.build_send_body(**kwargs)
+        msgid = body["payload"]["msgid"]
+
+        self.store.append(
+            key=msgid,
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self._message.scope_id}",
+            body=json.dumps(body),
+        )
+        return msgid
+
+    def set_delivery_status(self, dedup_key: Optional[str] = None, **kwargs) -> str:
+        """
+        Journals a delivery status update.
+
+        :param dedup_key: A key identifying the update. Defaults to one derived
+            from the msgid and the status, so the same update is journaled once.
+        :param kwargs: The same arguments as DeliveryStatusAction.set.
+        :return: The deduplication key of the update.
+        :raises ValueError: If the 'msgid' is not provided.
+        """
+        body = self._delivery.build_body(**kwargs)
+        if not body.get("msgid"):
+            raise ValueError("msgid not found")
+
+        key = dedup_key or (
+            f"delivery_status:{body['msgid']}:{body.get('delivery_status')}"
+        )
+        self.store.append(
+            key=key,
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self._delivery.scope_id}/{body['msgid']}/delivery_status",
+            body=json.dumps(body),
+        )
+        return key
+
+    def set_react(self, dedup_key: Optional[str] = None, **kwargs) -> str:
+        """
+        Journals a reaction.
+
+        :param dedup_key: A key identifying the reaction. Defaults to one derived
+            from the conversation, message, user, type and emoji, so the same
+            reaction is journaled once within the retention period; pass a key to
+            journal an identical reaction again, e.g. after an unreact.
+        :param kwargs: The same arguments as ReactAction.set.
+        :return: The deduplication key of the reaction.
+        """
+        body = self._react.build_body(**kwargs)
+
+        user = body.get("user") or {}
+        key = dedup_key or ":".join(
+            [
+                "react",
+                body.get("conversation_id") or body.get("conversation_ref_id") or "",
+                body.get("id") or "",
+                user.get("id") or user.get("ref_id") or "",
+                body.get("type") or "react",
+                body.get("emoji") or "",
+            ]
+        )
+        self.store.append(
+            key=key,
+            method="POST",
+            endpoint=f"/v2/origin/custom/{self._react.scope_id}/react",
+            body=json.dumps(body),
+        )
+        return key
+
+    def drain(self) -> int:
+        """
+        Sends pending items in journal order until the journal is empty or a
+        transient error occurs.
+
+        Items rejected with a non-retryable status (e.g. 400) are marked as failed
+        and skipped; on a transient error draining stops, so that items are never
+        sent out of order, and resumes on the next call.
+
+        :return: The number of acknowledged items.
+        """
+        sent = 0
+        with self._drain_lock:
+            while True:
+                items = self.store.fetch_pending(self.batch_size)
+                if not items:
+                    return sent
+
+                acked = []
+                try:
+                    for item in items:
+                        try:
+                            data = json.loads(item.body)
+                        except ValueError as e:
+                            # A corrupt item can never be sent, it must not block
+                            # the journal
+                            self.store.record_failure(
+                                item.id, f"Invalid body: {e}", permanent=True
+                            )
+                            continue
+                        try:
+                            self.client.custom_request(
+                                method=item.method, endpoint=item.endpoint, data=data
+                            )
+                        except RequestError as e:
+                            permanent = not self._retry_policy.is_retryable(e)
+                            self.store.record_failure(item.id, e.message, permanent)
+                            if permanent:
+                                continue
+                            return sent
+
+                        acked.append(item.id)
+                        sent += 1
+                finally:
+                    # Whatever stops the batch, the items sent are not sent again
+                    self.store.ack(acked)
+
+    def _run(self) -> None:
+        """
+        The background sender loop.
+
+        Unexpected errors (a locked or full database, an unreadable item, ...) are
+        logged and the loop backs off exponentially instead of dying, so the
+        outbox resumes delivering once the cause is gone.
+        """
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                self.drain()
+                self.store.compact(self.retention)
+            except Exception:
+                failures += 1
+                delay = min(self.max_backoff, self.poll_interval * 2**failures)
+                logger.exception(
+                    f"Outbox sender failed ({failures} in a row), retrying in {delay:g}s"
+                )
+            else:
+                failures = 0
+                delay = self.poll_interval
+            self._stop.wait(delay)
+
+    def start(self) -> None:
+        """
+        Starts the background sender thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="amojowrapper-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background sender thread after its current drain.
+
+        :param timeout: Seconds to wait for the thread to finish.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def compact(self, older_than: Optional[float] = None) -> int:
+        """
+        Removes acknowledged items from the journal.
+
+        :param older_than: Only remove items acknowledged this many seconds ago or
+            earlier.
+        :return: The number of removed items.
+        """
+        return self.store.compact(older_than)
+
+    def stats(self) -> OutboxStats:
+        """
+        Returns the number of pending, acknowledged and failed items.
+
+        :return: An instance of OutboxStats.
+        """
+        return self.store.stats()
+
+    def close(self) -> None:
+        """
+        Stops the background sender and closes the journal.
+        """
+        self.stop()
+        self.store.close()
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
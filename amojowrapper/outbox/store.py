@@ -0,0 +1,200 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from amojowrapper.helpers.sqlite import connect
+
+
+class OutboxItem(BaseModel):
+    """
+    A request journaled in the outbox.
+
+    Attributes:
+        id (int): The position of the item in the journal.
+        key (str): The deduplication key, the msgid for messages.
+        method (str): The HTTP method.
+        endpoint (str): The endpoint of the AmoCRM API.
+        body (str): The JSON encoded payload.
+        attempts (int): Number of failed send attempts so far.
+    """
+
+    id: int
+    key: str
+    method: str
+    endpoint: str
+    body: str
+    attempts: int = 0
+
+
+class OutboxStats(BaseModel):
+    """
+    Counters of the outbox journal.
+
+    Attributes:
+        pending (int): Items waiting to be sent.
+        acked (int): Items acknowledged by the server and not compacted yet.
+        failed (int): Items given up on after a permanent error.
+    """
+
+    pending: int = 0
+    acked: int = 0
+    failed: int = 0
+
+
+class OutboxStore:
+    """
+    A durable SQLite (WAL) journal of outgoing requests.
+
+    Items are deduplicated by key, so appending the same msgid twice (for example
+    after a crash before the append was confirmed) stores it once. Acknowledged
+    items are kept until `compact()` so that late duplicates are still detected.
+    """
+
+    def __init__(self, path: str = "amojowrapper_outbox.sqlite3"):
+        """
+        Opens or creates the journal.
+
+        :param path: The SQLite database path.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = connect(path)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL UNIQUE,
+                method TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                body TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                acked_at REAL
+            )
+            """)
+        columns = {
+            row["name"] for row in self._connection.execute("PRAGMA table_info(outbox)")
+        }
+        if "acked_at" not in columns:
+            # Journals created before acked_at was recorded
+            self._connection.execute("ALTER TABLE outbox ADD COLUMN acked_at REAL")
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id)"
+        )
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Groups the statements of the block into one transaction.
+        """
+        self._connection.execute("BEGIN")
+        try:
+            yield
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def append(self, key: str, method: str, endpoint: str, body: str) -> bool:
+        """
+        Appends a request to the journal.
+
+        :param key: The deduplication key.
+        :param method: The HTTP method.
+        :param endpoint: The endpoint of the AmoCRM API.
+        :param body: The JSON encoded payload.
+        :return: True if the item was added, False if the key is already journaled.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO outbox (key, method, endpoint, body, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, method, endpoint, body, time.time()),
+            )
+            return cursor.rowcount == 1
+
+    def fetch_pending(self, limit: int = 100) -> List[OutboxItem]:
+        """
+        Returns the oldest pending items in journal order.
+
+        :param limit: Maximum number of items.
+        :return: A list of OutboxItem.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, key, method, endpoint, body, attempts FROM outbox "
+                "WHERE status = 'pending' ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [OutboxItem(**dict(row)) for row in rows]
+
+    def ack(self, ids: List[int]) -> None:
+        """
+        Marks items as acknowledged by the server, in one transaction.
+
+        :param ids: The ids of the acknowledged items.
+        """
+        if not ids:
+            return
+        acked_at = time.time()
+        with self._lock, self._transaction():
+            self._connection.executemany(
+                "UPDATE outbox SET status = 'acked', last_error = NULL, acked_at = ? "
+                "WHERE id = ?",
+                [(acked_at, item_id) for item_id in ids],
+            )
+
+    def record_failure(self, item_id: int, error: str, permanent: bool) -> None:
+        """
+        Records a failed send attempt.
+
+        :param item_id: The id of the item.
+        :param error: The error message.
+        :param permanent: True to stop retrying the item.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE outbox SET attempts = attempts + 1, last_error = ?, "
+                "status = CASE WHEN ? THEN 'failed' ELSE status END WHERE id = ?",
+                (error, permanent, item_id),
+            )
+
+    def compact(self, older_than: Optional[float] = None) -> int:
+        """
+        Deletes acknowledged items from the journal.
+
+        :param older_than: Only delete items acknowledged this many seconds ago or
+            earlier, so their key keeps deduplicating for that long.
+        :return: The number of deleted items.
+        """
+        cutoff = time.time() - (older_than or 0)
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM outbox WHERE status = 'acked' "
+                "AND COALESCE(acked_at, created_at) <= ?",
+                (cutoff,),
+            )
+            return cursor.rowcount
+
+    def stats(self) -> OutboxStats:
+        """
+        Returns the number of items per status.
+
+        :return: An instance of OutboxStats.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall()
+        return OutboxStats(**{status: count for status, count in rows})
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,5 @@
+from amojowrapper.registry.registry import (
+    ChannelCredentials,
+    ChannelRegistry,
+    RegistryStats,
+)
@@ -0,0 +1,349 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from amojowrapper.actions import (
+    ChannelAction,
+    ChatAction,
+    DeliveryStatusAction,
+    HistoryAction,
+    MessageAction,
+    ReactAction,
+    TypingAction,
+)
+from amojowrapper.client import AmojoClient
+from amojowrapper.helpers.endpoint import get_base_url
+from amojowrapper.helpers.serializer import JSONEncoder, get_default_json_encoder
+from amojowrapper.request import AmojoSession, PoolStats, RateLimiter, RetryPolicy
+
+ActionType = TypeVar("ActionType")
+
+
+class ChannelCredentials(NamedTuple):
+    """
+    The credentials of one channel and account pair, stored compactly.
+
+    Attributes:
+        channel_secret (str): The secret key for the channel.
+        channel_id (str): The unique identifier for the channel.
+        amojo_account_token (str): The account token for the AmoCRM API.
+        referer (str): The referer of the account.
+        base_url (str): The base URL of the chat API, resolved from the referer
+            unless given explicitly.
+    """
+
+    channel_secret: str
+    channel_id: str
+    amojo_account_token: str
+    referer: str
+    base_url: str
+
+
+class RegistryStats(BaseModel):
+    """
+    Counters of a ChannelRegistry.
+
+    Attributes:
+        channels (int): Registered scopes.
+        cached_scopes (int): Scopes with a client and actions currently cached.
+        sessions (int): Connection pools, one per base URL.
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups that had to build a client.
+        evictions (int): Scopes dropped from the cache to keep it bounded.
+    """
+
+    channels: int = 0
+    cached_scopes: int = 0
+    sessions: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class _Scope:
+    """
+    The client and the action objects of a cached scope.
+    """
+
+    __slots__ = ("client", "actions")
+
+    def __init__(self, client: AmojoClient):
+        self.client = client
+        self.actions: Dict[type, Any] = {}
+
+
+class ChannelRegistry:
+    """
+    Serves many channel and account pairs from one process.
+
+    Only the credentials of each scope are kept for every registered channel. The
+    clients and action objects are built on first use and kept in a bounded LRU
+    cache, so memory stays flat as the number of channels grows. All clients with
+    the same base URL share one connection pool, and base URLs are resolved once
+    per referer.
+
+    Attributes:
+        max_cached (int): Maximum number of scopes kept with a client and actions.
+        debug (bool): A flag to enable or disable debugging output of the clients.
+        json_encoder (JSONEncoder): The encoder shared by all clients.
+        retry_policy (Optional[RetryPolicy]): The retry policy shared by all clients.
+        rate_limiter (Optional[RateLimiter]): The rate limiter shared by all clients.
+    """
+
+    def __init__(
+        self,
+        max_cached: int = 1024,
+        debug: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keepalive_timeout: Optional[float] = 30.0,
+        json_encoder: Optional[JSONEncoder] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """
+        Initializes the ChannelRegistry.
+
+        Args:
+            max_cached (int): Maximum number of cached scopes. Defaults to 1024.
+            debug (bool): Enables debugging output of the clients. Defaults to False.
+            pool_connections (int): Number of per-host connection pools of each
+                shared pool. Defaults to 10.
+            pool_maxsize (int): Maximum kept-alive connections per host. Defaults to 10.
+            keepalive_timeout (Optional[float]): Seconds after which idle connections
+                are dropped. Defaults to 30.
+            json_encoder (Optional[JSONEncoder]): A callable encoding payloads to
+                JSON bytes. Defaults to orjson when installed.
+            retry_policy (Optional[RetryPolicy]): The policy retrying throttled and
+                failed requests. Defaults to no retries.
+            rate_limiter (Optional[RateLimiter]): The limiter throttling requests per
+                scope. Defaults to no limit.
+        """
+        if max_cached < 1:
+            raise ValueError("max_cached must be positive")
+
+        self.max_cached = max_cached
+        self.debug = debug
+        self.json_encoder = json_encoder or get_default_json_encoder()
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self._pool_config = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "keepalive_timeout": keepalive_timeout,
+        }
+
+        self._credentials: Dict[str, ChannelCredentials] = {}
+        self._sessions: Dict[str, AmojoSession] = {}
+        self._cache: "OrderedDict[str, _Scope]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = RegistryStats()
+
+    def register(
+        self,
+        channel_secret: str,
+        channel_id: str,
+        referer: str,
+        amojo_account_token: str,
+        base_url: Optional[str] = None,
+    ) -> str:
+        """
+        Registers the credentials of a channel and account pair.
+
+        Registering a scope again replaces its credentials.
+
+        Args:
+            channel_secret (str): The secret key for the channel.
+            channel_id (str): The unique identifier for the channel.
+            referer (str): The referer to get the base URL.
+            amojo_account_token (str): The account token for the AmoCRM API.
+            base_url (Optional[str]): The base URL of the chat API, e.g. a proxy
+                or a test server. Defaults to the URL derived from the referer.
+
+        Returns:
+            str: The scope id used to address the channel.
+        """
+        scope_id = f"{channel_id}_{amojo_account_token}"
+        credentials = ChannelCredentials(
+            channel_secret,
+            channel_id,
+            amojo_account_token,
+            referer,
+            base_url.rstrip("/") if base_url else get_base_url(referer),
+        )
+        with self._lock:
+            self._credentials[scope_id] = credentials
+            self._cache.pop(scope_id, None)
+        return scope_id
+
+    def unregister(self, scope_id: str) -> None:
+        """
+        Forgets a scope and drops its cached client.
+
+        Args:
+            scope_id (str): The scope id returned by `register`.
+        """
+        with self._lock:
+            self._credentials.pop(scope_id, None)
+            self._cache.pop(scope_id, None)
+
+    def _get_scope(self, scope_id: str) -> _Scope:
+        """
+        Returns the cached scope, building its client if needed.
+
+        Must be called under the registry lock.
+        """
+        scope = self._cache.get(scope_id)
+        if scope is not None:
+            self._cache.move_to_end(scope_id)
+            self._stats.hits += 1
+            return scope
+
+        credentials = self._credentials.get(scope_id)
+        if credentials is None:
+            raise KeyError(f"scope {scope_id!r} is not registered")
+
+        self._stats.misses += 1
+        scope = self._cache[scope_id] = _Scope(self._create_client(credentials))
+        if len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+            self._stats.evictions += 1
+        return scope
+
+    def _create_client(self, credentials: ChannelCredentials) -> AmojoClient:
+        """
+        Creates a client using the shared pool of the credentials' base URL.
+        """
+        session = self._sessions.get(credentials.base_url)
+        if session is None:
+            session = self._sessions[credentials.base_url] = AmojoSession(
+                **self._pool_config
+            )
+
+        return AmojoClient(
+            channel_secret=credentials.channel_secret,
+            channel_id=credentials.channel_id,
+            referer=credentials.referer,
+            amojo_account_token=credentials.amojo_account_token,
+            base_url=credentials.base_url,
+            debug=self.debug,
+            json_encoder=self.json_encoder,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            session=session,
+        )
+
+    def client(self, scope_id: str) -> AmojoClient:
+        """
+        Returns the client of a scope.
+
+        Args:
+            scope_id (str): The scope id returned by `register`.
+
+        Returns:
+            AmojoClient: The client, sharing the pool of its base URL.
+
+        Raises:
+            KeyError: If the scope is not registered.
+        """
+        with self._lock:
+            return self._get_scope(scope_id).client
+
+    def action(self, scope_id: str, action_class: Type[ActionType]) -> ActionType:
+        """
+        Returns the cached action object of a scope, creating it on first use.
+
+        Args:
+            scope_id (str): The scope id returned by `register`.
+            action_class (Type): The action class, e.g. MessageAction.
+
+        Returns:
+            The action object bound to the scope's client.
+
+        Raises:
+            KeyError: If the scope is not registered.
+        """
+        with self._lock:
+            scope = self._get_scope(scope_id)
+            action = scope.actions.get(action_class)
+            if action is None:
+                action = scope.actions[action_class] = action_class(scope.client)
+            return action
+
+    def channel(self, scope_id: str) -> ChannelAction:
+        """Returns the ChannelAction of a scope."""
+        return self.action(scope_id, ChannelAction)
+
+    def chat(self, scope_id: str) -> ChatAction:
+        """Returns the ChatAction of a scope."""
+        return self.action(scope_id, ChatAction)
+
+    def message(self, scope_id: str) -> MessageAction:
+        """Returns the MessageAction of a scope."""
+        return self.action(scope_id, MessageAction)
+
+    def history(self, scope_id: str) -> HistoryAction:
+        """Returns the HistoryAction of a scope."""
+        return self.action(scope_id, HistoryAction)
+
+    def typing(self, scope_id: str) -> TypingAction:
+        """Returns the TypingAction of a scope."""
+        return self.action(scope_id, TypingAction)
+
+    def delivery_status(self, scope_id: str) -> DeliveryStatusAction:
+        """Returns the DeliveryStatusAction of a scope."""
+        return self.action(scope_id, DeliveryStatusAction)
+
+    def react(self, scope_id: str) -> ReactAction:
+        """Returns the ReactAction of a scope."""
+        return self.action(scope_id, ReactAction)
+
+    def pool_stats(self) -> Dict[str, PoolStats]:
+        """
+        Returns the connection reuse counters of each shared pool.
+
+        Returns:
+            Dict[str, PoolStats]: The counters keyed by base URL.
+        """
+        with self._lock:
+            sessions = dict(self._sessions)
+        return {base_url: session.stats() for base_url, session in sessions.items()}
+
+    def stats(self) -> RegistryStats:
+        """
+        Returns a snapshot of the registry counters.
+
+        Returns:
+            RegistryStats: The number of channels, cached scopes and pools.
+        """
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.channels = len(self._credentials)
+            stats.cached_scopes = len(self._cache)
+            stats.sessions = len(self._sessions)
+        return stats
+
+    def close(self) -> None:
+        """
+        Closes every shared connection pool.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._cache.clear()
+        for session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        return len(self._credentials)
+
+    def __contains__(self, scope_id: str) -> bool:
+        return scope_id in self._credentials
+
+    def __enter__(self) -> "ChannelRegistry":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -1 +1,8 @@
 from amojowrapper.request.request import CustomRequest
+from amojowrapper.request.session import AmojoSession, PoolStats
+from amojowrapper.request.async_request import AsyncCustomRequest
+from amojowrapper.request.async_session import AsyncAmojoSession
+from amojowrapper.request.exceptions import RequestError
+from amojowrapper.request.retry import RetryPolicy, RetryStats
+from amojowrapper.request.ratelimit import RateLimiter, RateLimiterStats
+from amojowrapper.request.cache import ResponseCache, ResponseCacheStats
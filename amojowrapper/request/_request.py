@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 import requests
 import sys
 from amojowrapper import __version__
+from amojowrapper.request.session import AmojoSession
 
 
 class AbstractBaseRequest(ABC):
@@ -32,7 +33,8 @@ class AbstractBaseRequest(ABC):
         method: str,
         url: str,
         headers: Dict[str, str],
-        data: Optional[Dict[str, str]],
+        data: Optional[Union[Dict[str, str], bytes]],
+        session: Optional[AmojoSession] = None,
     ) -> requests.Response:
         """
         Sends an HTTP request.
@@ -40,7 +42,10 @@ class AbstractBaseRequest(ABC):
         :param method: The HTTP method (GET, POST, PATCH, PUT, DELETE).
         :param url: The URL to send the request to.
         :param headers: The headers to include in the request.
-        :param data: The data to send in the request body (optional).
+        :param data: The data to send in the request body (optional). Bytes are
+            sent verbatim, anything else is encoded as JSON.
+        :param session: The pooled session to send the request with (optional).
+            Without it a new connection is opened for every request.
         :return: The response from the server.
         :raises ValueError: If the HTTP method is unsupported.
         """
@@ -58,8 +63,15 @@ class AbstractBaseRequest(ABC):
         identifier = f"amojowrapper/{__version__}"  # Переименовано в snake_case
         headers.update({"User-Agent": identifier})
 
+        if isinstance(data, (bytes, bytearray)):
+            body = {"data": data}
+        else:
+            body = {"json": data}
+
         try:
-            return method_map[method](url, headers=headers, json=data)
+            if session is not None:
+                return session.request(method, url, headers=headers, **body)
+            return method_map[method](url, headers=headers, **body)
         except KeyboardInterrupt:
             print("User interrupt. Exiting.")
             sys.exit()  # Использование sys.exit вместо exit
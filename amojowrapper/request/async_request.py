@@ -0,0 +1,137 @@
+import asyncio
+from typing import Dict, Optional, Union
+
+from requests import Response, exceptions
+from requests.structures import CaseInsensitiveDict
+
+from amojowrapper import __version__
+from amojowrapper.request._request import AbstractBaseRequest
+from amojowrapper.request.async_session import AsyncAmojoSession
+from amojowrapper.request.exceptions import RequestError
+
+
+class AsyncCustomRequest(AbstractBaseRequest):
+    """
+    An asyncio HTTP request handler mirroring CustomRequest.
+
+    Requests are sent through an AsyncAmojoSession and the aiohttp response is
+    converted into a requests.Response, so actions parse synchronous and
+    asynchronous responses with the same code.
+    """
+
+    @classmethod
+    async def request(
+        cls,
+        url: str,
+        method: str,
+        headers: Dict[str, str],
+        data: Optional[Dict] = None,
+        debug: bool = False,
+        session: Optional[AsyncAmojoSession] = None,
+    ) -> Response:
+        """
+        Send an HTTP request and handle errors with optional logging for debugging.
+
+        Args:
+            url (str): The URL to which the request will be sent.
+            method (str): The HTTP method (GET, POST, etc.).
+            headers (dict): The headers to include in the request.
+            data (dict, optional): The body of the request (default is None).
+            debug (bool, optional): If True, enables logging for debugging (default is False).
+            session (AsyncAmojoSession): The pooled session to send the request with.
+
+        Returns:
+            Response: The response object from the HTTP request.
+
+        Raises:
+            RequestError: If an HTTP error or request error occurs.
+        """
+        if debug:
+            from loguru import logger  # Import inside the function for debug
+
+        try:
+            import aiohttp  # Optional dependency, required only for the async client
+        except ImportError as e:
+            raise ImportError(
+                "AsyncAmojoClient requires aiohttp: pip install amojowrapper[async]"
+            ) from e
+
+        try:
+            if debug:
+                logger.info(f"Trying to request: {method} {url} {data}")
+
+            response = await cls._send_request(
+                method=method, url=url, headers=headers, data=data, session=session
+            )
+
+            response.raise_for_status()
+
+            if debug:
+                logger.success(f"Response: {response.status_code}: {response.reason}")
+
+            return response
+
+        except exceptions.HTTPError as e:
+            __error_msg = f"HTTP error occurred: {e.response.reason} {e.response.status_code}: {method} {url}\n"
+            __error_msg += f"Payload: {data}\nResponse: {e.response.content}\n {str(e)}"
+
+            if debug:
+                logger.critical(__error_msg)
+
+            raise RequestError(
+                __error_msg,
+                status_code=e.response.status_code,
+                headers=e.response.headers,
+            ) from e
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            __error_msg = f"Error during request: {method} {url}\nPayload: {data}\nError: {str(e)}"
+
+            if debug:
+                logger.critical(__error_msg)
+
+            raise RequestError(__error_msg) from e
+
+    @classmethod
+    async def _send_request(
+        cls,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[Union[Dict[str, str], bytes]],
+        session: Optional[AsyncAmojoSession] = None,
+    ) -> Response:
+        """
+        Sends an HTTP request over the aiohttp session.
+
+        :param method: The HTTP method (GET, POST, PATCH, PUT, DELETE).
+        :param url: The URL to send the request to.
+        :param headers: The headers to include in the request.
+        :param data: The data to send in the request body (optional). Bytes are
+            sent verbatim, anything else is encoded as JSON.
+        :param session: The pooled session to send the request with.
+        :return: The response from the server as a requests.Response.
+        :raises ValueError: If the HTTP method is unsupported or no session is given.
+        """
+        if method not in {"GET", "POST", "PATCH", "PUT", "DELETE"}:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        if session is None:
+            raise ValueError("AsyncCustomRequest requires an AsyncAmojoSession")
+
+        headers.update({"User-Agent": f"amojowrapper/{__version__}"})
+
+        if isinstance(data, (bytes, bytearray)):
+            body = {"data": data}
+        else:
+            body = {"json": data}
+
+        client_session = await session.get_session()
+        async with client_session.request(method, url, headers=headers, **body) as raw:
+            response = Response()
+            response.status_code = raw.status
+            response.reason = raw.reason
+            response.url = str(raw.url)
+            response.headers = CaseInsensitiveDict(raw.headers)
+            response._content = await raw.read()
+            return response
@@ -0,0 +1,128 @@
+import asyncio
+from typing import Optional
+
+from amojowrapper import __version__
+from amojowrapper.request.session import PoolStats
+
+
+class AsyncAmojoSession:
+    """
+    An asyncio counterpart of AmojoSession built on top of aiohttp.
+
+    The underlying aiohttp.ClientSession is created lazily inside the running
+    event loop and keeps a pool of keep-alive connections shared by every
+    asynchronous action of the client that owns it.
+
+    Attributes:
+        pool_connections (int): Maximum number of connections across all hosts.
+        pool_maxsize (int): Maximum number of connections kept per host.
+        keepalive_timeout (Optional[float]): Seconds an idle connection is kept open.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keepalive_timeout: Optional[float] = 30.0,
+    ):
+        """
+        Initializes the AsyncAmojoSession with the given pool configuration.
+
+        Args:
+            pool_connections (int): Number of per-host connection pools. Defaults to 10.
+            pool_maxsize (int): Maximum connections per host. Defaults to 10.
+            keepalive_timeout (Optional[float]): Idle timeout in seconds. Defaults to 30.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_timeout = keepalive_timeout
+
+        self._session = None
+        self._closed = False
+        self._lock: Optional[asyncio.Lock] = None
+        self._stats = PoolStats()
+
+    def _create_session(self):
+        """
+        Creates an aiohttp.ClientSession with a sized connector and tracing hooks.
+
+        :return: The configured aiohttp.ClientSession.
+        :raises ImportError: If aiohttp is not installed.
+        """
+        try:
+            import aiohttp  # Optional dependency, required only for the async client
+        except ImportError as e:
+            raise ImportError(
+                "AsyncAmojoClient requires aiohttp: pip install amojowrapper[async]"
+            ) from e
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_connections * self.pool_maxsize,
+            limit_per_host=self.pool_maxsize,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[trace_config],
+            headers={"User-Agent": f"amojowrapper/{__version__}"},
+        )
+
+    async def _on_request_start(self, session, context, params) -> None:
+        self._stats.requests += 1
+
+    async def _on_connection_create(self, session, context, params) -> None:
+        self._stats.new_connections += 1
+
+    async def _on_connection_reuse(self, session, context, params) -> None:
+        self._stats.reused_connections += 1
+
+    async def get_session(self):
+        """
+        Returns the live aiohttp.ClientSession, creating it on first use.
+
+        :return: The aiohttp.ClientSession to send requests with.
+        :raises RuntimeError: If the session is closed.
+        """
+        if self._closed:
+            raise RuntimeError("the session is closed")
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self._closed:
+                raise RuntimeError("the session is closed")
+            if self._session is None or self._session.closed:
+                self._session = self._create_session()
+            return self._session
+
+    def stats(self) -> PoolStats:
+        """
+        Returns the pool usage counters.
+
+        :return: An instance of PoolStats.
+        """
+        return self._stats.model_copy()
+
+    async def close(self) -> None:
+        """
+        Closes the aiohttp.ClientSession and all pooled connections. New
+        requests are refused.
+        """
+        self._closed = True
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncAmojoSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
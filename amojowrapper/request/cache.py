@@ -0,0 +1,254 @@
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+from requests import Response
+
+
+class ResponseCacheStats(BaseModel):
+    """
+    Counters of a ResponseCache.
+
+    Attributes:
+        entries (int): Responses currently cached.
+        size_bytes (int): Total size of the cached response bodies.
+        hits (int): Requests served from the cache.
+        misses (int): Requests sent to the server.
+        coalesced (int): Requests that waited for an identical in-flight request.
+        evictions (int): Responses dropped to stay under `max_bytes`.
+        expirations (int): Responses dropped because their TTL elapsed.
+    """
+
+    entries: int = 0
+    size_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+# Result of an async flight whose leader was cancelled before fetching
+_ABANDONED = object()
+
+
+class _Flight:
+    """
+    A request in progress, shared by the threads asking for the same key.
+    """
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """
+    An opt-in cache of GET responses with TTL, LRU eviction and single-flight.
+
+    Responses are cached by URL for the TTL of their endpoint family (history,
+    chats, ...) and evicted least recently used first once the cached bodies
+    exceed `max_bytes`. Concurrent identical requests are coalesced: the first
+    one is sent and the others wait for its response (or error) instead of
+    sending their own. Each caller receives its own copy of the response.
+
+    Attributes:
+        max_bytes (int): Maximum total size of the cached response bodies.
+        default_ttl (float): Seconds a response is cached for unlisted families.
+        family_ttls (Dict[str, float]): TTLs of specific endpoint families. A TTL
+            of 0 disables caching of the family but still coalesces requests.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        default_ttl: float = 5.0,
+        family_ttls: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initializes the ResponseCache.
+
+        Args:
+            max_bytes (int): Maximum size of the cached bodies. Defaults to 16 MiB.
+            default_ttl (float): TTL in seconds of unlisted families. Defaults to 5.
+            family_ttls (Optional[Dict[str, float]]): TTLs per endpoint family,
+                e.g. {"history": 2}.
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.family_ttls = family_ttls or {}
+
+        self._entries: "OrderedDict[str, Tuple[float, Response]]" = OrderedDict()
+        self._size = 0
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._stats = ResponseCacheStats()
+
+    def _ttl(self, family: Optional[str]) -> float:
+        return self.family_ttls.get(family, self.default_ttl)
+
+    def _lookup(self, key: str) -> Optional[Response]:
+        """
+        Returns a fresh cached response. Must be called under the lock.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self._stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return response
+
+    def _remove(self, key: str) -> None:
+        """
+        Removes an entry. Must be called under the lock.
+        """
+        _, response = self._entries.pop(key)
+        self._size -= len(response.content)
+
+    def _store(self, key: str, family: Optional[str], response: Response) -> None:
+        """
+        Caches a response and evicts the least recently used ones if needed.
+        """
+        ttl = self._ttl(family)
+        size = len(response.content)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def get_or_fetch(
+        self, key: str, family: Optional[str], fetch: Callable[[], Response]
+    ) -> Response:
+        """
+        Returns the cached response for the key, or fetches it once for all
+        concurrent callers.
+
+        :param key: The cache key, usually the request URL.
+        :param family: The endpoint family, used to pick the TTL.
+        :param fetch: Sends the request and returns the response.
+        :return: A copy of the response.
+        """
+        with self._lock:
+            response = self._lookup(key)
+            if response is not None:
+                return copy.copy(response)
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats.misses += 1
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.copy(flight.response)
+
+        try:
+            flight.response = fetch()
+            self._store(key, family, flight.response)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return copy.copy(flight.response)
+
+    async def get_or_fetch_async(
+        self,
+        key: str,
+        family: Optional[str],
+        fetch: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """
+        Asynchronous counterpart of `get_or_fetch` for one event loop. If the
+        task sending the request is cancelled, one of its waiters sends it again.
+
+        :param key: The cache key, usually the request URL.
+        :param family: The endpoint family, used to pick the TTL.
+        :param fetch: A coroutine function sending the request.
+        :return: A copy of the response.
+        """
+        while True:
+            with self._lock:
+                response = self._lookup(key)
+                if response is not None:
+                    return copy.copy(response)
+                future = self._async_flights.get(key)
+                if future is None:
+                    self._stats.misses += 1
+                else:
+                    self._stats.coalesced += 1
+
+            if future is None:
+                break
+            response = await asyncio.shield(future)
+            if response is not _ABANDONED:
+                return copy.copy(response)
+            # The leader was cancelled, one of its waiters takes over the fetch
+
+        future = self._async_flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await fetch()
+            self._store(key, family, response)
+            future.set_result(response)
+        except asyncio.CancelledError:
+            # Only the leader was cancelled, its waiters retry instead
+            future.set_result(_ABANDONED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting
+            future.exception()
+            raise
+        finally:
+            del self._async_flights[key]
+        return copy.copy(response)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """
+        Drops cached responses whose key starts with the prefix.
+
+        :param prefix: The key prefix, an empty string drops everything.
+        :return: The number of dropped responses.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def stats(self) -> ResponseCacheStats:
+        """
+        Returns a snapshot of the cache counters.
+
+        :return: An instance of ResponseCacheStats.
+        """
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.entries = len(self._entries)
+            stats.size_bytes = self._size
+        return stats
@@ -1,3 +1,6 @@
+from typing import Mapping, Optional
+
+
 class RequestError(Exception):
     """
     Custom exception to handle errors in the request process.
@@ -8,11 +11,21 @@ class RequestError(Exception):
     details about the error.
     """
 
-    def __init__(self, message: str):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
         """
         Initialize the RequestError with a message.
 
         Args:
             message (str): The error message describing the issue.
+            status_code (Optional[int]): The HTTP status code, None for network errors.
+            headers (Optional[Mapping[str, str]]): The response headers, if any.
         """
+        super().__init__(message)
         self.message = message
+        self.status_code = status_code
+        self.headers = headers or {}
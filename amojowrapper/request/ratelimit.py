@@ -0,0 +1,266 @@
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class RateLimiterStats(BaseModel):
+    """
+    Counters of a RateLimiter.
+
+    Attributes:
+        waiting (int): Number of requests currently waiting for a token.
+        waiting_by_scope (Dict[str, int]): Waiting requests per scope id.
+        acquired (int): Total number of tokens handed out.
+        delayed (int): Number of requests that had to wait for a token.
+        total_wait (float): Total time spent waiting, in seconds.
+        max_wait (float): The longest single wait, in seconds.
+        buckets (int): Number of buckets currently held.
+        evicted_buckets (int): Number of idle buckets dropped.
+        refunded (int): Number of tokens given back by cancelled waits.
+    """
+
+    waiting: int = 0
+    waiting_by_scope: Dict[str, int] = {}
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    buckets: int = 0
+    evicted_buckets: int = 0
+    refunded: int = 0
+
+    @property
+    def average_wait(self) -> float:
+        """The average wait per acquired token, in seconds."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class TokenBucket:
+    """
+    A token bucket handing out reservations instead of rejecting requests.
+
+    Each call takes a token immediately, letting the balance go negative, and
+    returns how long the caller has to wait until that token is refilled. Callers
+    are therefore served in the order they arrived.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum number of tokens, i.e. the allowed burst.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns the delay before it may be used.
+
+        Must be called under the owner's lock.
+
+        :return: The delay in seconds, 0 if a token was available.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self) -> None:
+        """
+        Gives back a token reserved by a request that was not sent.
+
+        Must be called under the owner's lock.
+        """
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def is_idle(self, now: float) -> bool:
+        """
+        Tells whether the bucket is full again, so dropping it loses nothing.
+        """
+        return self.tokens + (now - self.updated) * self.rate >= self.capacity
+
+
+class RateLimiter:
+    """
+    A client-side token-bucket rate limiter keyed by scope id.
+
+    Every scope (channel and account pair) gets its own bucket, the limit amoCRM
+    enforces. Endpoint families listed in `family_rates` (messages, typing,
+    delivery_status, react, ...) additionally get a bucket per scope with their
+    own rate: their requests take a token from both buckets and wait for the
+    longer delay. When a bucket is empty the caller blocks (or awaits) until a
+    token is available instead of failing.
+
+    Buckets that have refilled are dropped every `idle_timeout` seconds, so the
+    limiter does not grow with the number of scopes seen.
+
+    Attributes:
+        rate (float): Default requests per second per scope.
+        burst (float): Default bucket capacity.
+        family_rates (Dict[str, float]): Requests per second for specific families.
+        idle_timeout (float): Seconds between sweeps dropping refilled buckets.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        family_rates: Optional[Dict[str, float]] = None,
+        idle_timeout: float = 60.0,
+    ):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            rate (float): Default requests per second per scope. Defaults to 10.
+            burst (Optional[float]): Bucket capacity. Defaults to one second of `rate`.
+            family_rates (Optional[Dict[str, float]]): Rates of families limited
+                separately, e.g. {"typing": 2}. Their burst equals their rate.
+            idle_timeout (float): Seconds between sweeps dropping refilled
+                buckets. Defaults to 60.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = burst or rate
+        self.family_rates = family_rates or {}
+        self.idle_timeout = idle_timeout
+
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._stats = RateLimiterStats()
+        self._next_sweep = time.monotonic() + idle_timeout
+
+    def _bucket(self, scope_id: str, family: Optional[str]) -> TokenBucket:
+        """
+        Returns the bucket of a scope, or of a family of the scope, creating it.
+
+        Must be called under the lock.
+        """
+        key = (scope_id, family)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if family is None:
+                bucket = TokenBucket(self.rate, self.burst)
+            else:
+                rate = self.family_rates[family]
+                bucket = TokenBucket(rate, rate)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _evict_idle(self, now: float) -> None:
+        """
+        Drops the buckets that have refilled. Must be called under the lock.
+        """
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.idle_timeout
+        idle = [key for key, bucket in self._buckets.items() if bucket.is_idle(now)]
+        for key in idle:
+            del self._buckets[key]
+        self._stats.evicted_buckets += len(idle)
+
+    def _reserve(
+        self, scope_id: str, family: Optional[str]
+    ) -> Tuple[float, List[TokenBucket]]:
+        """
+        Reserves a token from the bucket of the scope and, if the family is
+        limited separately, from the bucket of the family.
+
+        :param scope_id: The scope id of the request.
+        :param family: The endpoint family of the request.
+        :return: The delay before the request may be sent and the buckets the
+            tokens were taken from.
+        """
+        with self._lock:
+            self._evict_idle(time.monotonic())
+
+            buckets = [self._bucket(scope_id, None)]
+            if family in self.family_rates:
+                buckets.append(self._bucket(scope_id, family))
+            delay = max(bucket.reserve() for bucket in buckets)
+
+            stats = self._stats
+            stats.acquired += 1
+            if delay > 0:
+                stats.delayed += 1
+                stats.waiting += 1
+                stats.waiting_by_scope[scope_id] = (
+                    stats.waiting_by_scope.get(scope_id, 0) + 1
+                )
+                stats.total_wait += delay
+                stats.max_wait = max(stats.max_wait, delay)
+            return delay, buckets
+
+    def _refund(self, buckets: List[TokenBucket]) -> None:
+        """
+        Gives back the tokens of a request cancelled while waiting.
+        """
+        with self._lock:
+            for bucket in buckets:
+                bucket.refund()
+            self._stats.refunded += 1
+
+    def _release(self, scope_id: str) -> None:
+        """
+        Marks a delayed request as no longer waiting.
+        """
+        with self._lock:
+            stats = self._stats
+            stats.waiting -= 1
+            stats.waiting_by_scope[scope_id] -= 1
+            if not stats.waiting_by_scope[scope_id]:
+                del stats.waiting_by_scope[scope_id]
+
+    def acquire(self, scope_id: str, family: Optional[str] = None) -> float:
+        """
+        Blocks the calling thread until the request may be sent.
+
+        :param scope_id: The scope id of the request.
+        :param family: The endpoint family of the request (optional).
+        :return: The time spent waiting, in seconds.
+        """
+        delay, _ = self._reserve(scope_id, family)
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._release(scope_id)
+        return delay
+
+    async def acquire_async(self, scope_id: str, family: Optional[str] = None) -> float:
+        """
+        Waits without blocking the event loop until the request may be sent.
+
+        :param scope_id: The scope id of the request.
+        :param family: The endpoint family of the request (optional).
+        :return: The time spent waiting, in seconds.
+        """
+        delay, buckets = self._reserve(scope_id, family)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # The request is not sent, so its token goes back to the buckets
+                self._refund(buckets)
+                raise
+            finally:
+                self._release(scope_id)
+        return delay
+
+    def stats(self) -> RateLimiterStats:
+        """
+        Returns a snapshot of the limiter counters.
+
+        :return: An instance of RateLimiterStats.
+        """
+        with self._lock:
+            self._stats.buckets = len(self._buckets)
+            return self._stats.model_copy(deep=True)
@@ -2,6 +2,7 @@ from requests import Response, exceptions
 from typing import Dict, Optional
 from amojowrapper.request._request import AbstractBaseRequest
 from amojowrapper.request.exceptions import RequestError
+from amojowrapper.request.session import AmojoSession
 
 
 class CustomRequest(AbstractBaseRequest):
@@ -20,6 +21,7 @@ class CustomRequest(AbstractBaseRequest):
         headers: Dict[str, str],
         data: Optional[Dict] = None,
         debug: bool = False,
+        session: Optional[AmojoSession] = None,
     ) -> Response:
         """
         Send an HTTP request and handle errors with optional logging for debugging.
@@ -30,6 +32,7 @@ class CustomRequest(AbstractBaseRequest):
             headers (dict): The headers to include in the request.
             data (dict, optional): The body of the request (default is None).
             debug (bool, optional): If True, enables logging for debugging (default is False).
+            session (AmojoSession, optional): The pooled session to reuse connections from.
 
         Returns:
             Response: The response object from the HTTP request.
@@ -47,7 +50,7 @@ class CustomRequest(AbstractBaseRequest):
 
             # Send the actual request
             response = cls._send_request(
-                method=method, url=url, headers=headers, data=data
+                method=method, url=url, headers=headers, data=data, session=session
             )
 
             # Raise an error for unsuccessful responses
@@ -66,7 +69,11 @@ class CustomRequest(AbstractBaseRequest):
             if debug:
                 logger.critical(__error_msg)
 
-            raise RequestError(__error_msg) from e
+            raise RequestError(
+                __error_msg,
+                status_code=e.response.status_code,
+                headers=e.response.headers,
+            ) from e
 
         except exceptions.RequestException as e:
             # Handle any request-related errors (e.g., network issues)
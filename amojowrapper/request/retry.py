@@ -0,0 +1,226 @@
+import asyncio
+import datetime
+import email.utils
+import math
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+from requests import Response
+
+from amojowrapper.request.exceptions import RequestError
+
+
+class RetryStats(BaseModel):
+    """
+    Retry counters of a RetryPolicy, keyed by endpoint family.
+
+    Attributes:
+        retries (Dict[str, int]): Number of retried attempts per endpoint family.
+        exhausted (Dict[str, int]): Number of requests that failed after all attempts.
+    """
+
+    retries: Dict[str, int] = {}
+    exhausted: Dict[str, int] = {}
+
+
+class RetryPolicy:
+    """
+    Retries failed requests with capped exponential backoff and full jitter.
+
+    A request is retried on network errors and on the configured status codes
+    (429 and 5xx by default). A Retry-After header sent by the server takes
+    precedence over the computed backoff, capped at `backoff_cap`. The caller
+    re-signs the request on every attempt, while the encoded body (and therefore
+    the msgid) stays the same, so amojo can deduplicate a message that was
+    delivered before the error.
+
+    Requests that are not idempotent, e.g. a chat creation or a message without a
+    msgid, could be processed twice if resent after a network error or a 5xx
+    response. They are only retried on the `unprocessed_statuses` (429 by
+    default), which show that the server rejected the request without handling it.
+
+    Attributes:
+        max_attempts (int): Total number of attempts, including the first one.
+        backoff_base (float): Backoff of the first retry in seconds.
+        backoff_cap (float): Upper bound of the backoff in seconds.
+        jitter (bool): Whether to use full jitter (a random delay up to the backoff).
+        retry_statuses (Tuple[int, ...]): HTTP status codes that are retried.
+        respect_retry_after (bool): Whether to honor the Retry-After header.
+        unprocessed_statuses (Tuple[int, ...]): HTTP status codes retried even for
+            requests that are not idempotent.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+        unprocessed_statuses: Tuple[int, ...] = (429,),
+    ):
+        """
+        Initializes the RetryPolicy.
+
+        Args:
+            max_attempts (int): Total number of attempts. Defaults to 3.
+            backoff_base (float): Backoff of the first retry in seconds. Defaults to 0.5.
+            backoff_cap (float): Upper bound of the backoff in seconds. Defaults to 30.
+            jitter (bool): Whether to use full jitter. Defaults to True.
+            retry_statuses (Tuple[int, ...]): Retried status codes. Defaults to 429 and 5xx.
+            respect_retry_after (bool): Whether to honor Retry-After, up to
+                backoff_cap. Defaults to True.
+            unprocessed_statuses (Tuple[int, ...]): Status codes retried even for
+                requests that are not idempotent. Defaults to 429.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.respect_retry_after = respect_retry_after
+        self.unprocessed_statuses = unprocessed_statuses
+
+        self._stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def is_retryable(self, error: RequestError, idempotent: bool = True) -> bool:
+        """
+        Checks whether a failed request may be retried.
+
+        :param error: The error raised by the request.
+        :param idempotent: Whether resending the request cannot duplicate its effect.
+        :return: True for network errors and retried status codes, and only for
+            the unprocessed statuses if the request is not idempotent.
+        """
+        if not idempotent:
+            return error.status_code in self.unprocessed_statuses
+        return error.status_code is None or error.status_code in self.retry_statuses
+
+    def get_delay(self, attempt: int, error: Optional[RequestError] = None) -> float:
+        """
+        Computes the delay before the next attempt.
+
+        :param attempt: The number of the attempt that has just failed, starting at 1.
+        :param error: The error raised by the failed attempt.
+        :return: The delay in seconds, at most backoff_cap.
+        """
+        if error is not None and self.respect_retry_after:
+            retry_after = self._parse_retry_after(error.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.backoff_cap)
+
+        backoff = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parses a Retry-After header given either in seconds or as an HTTP date.
+
+        :param value: The header value.
+        :return: The delay in seconds, or None if the header is absent or invalid.
+        """
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            pass
+        else:
+            # nan and inf cannot be slept on, fall back to the backoff
+            return max(seconds, 0.0) if math.isfinite(seconds) else None
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            # HTTP dates are in GMT, a naive result must not be read as local time
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+    def _should_retry(
+        self, error: RequestError, attempt: int, family: str, idempotent: bool
+    ) -> bool:
+        """
+        Decides whether to retry and updates the counters accordingly.
+        """
+        if not self.is_retryable(error, idempotent):
+            return False
+
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self._stats.exhausted[family] = self._stats.exhausted.get(family, 0) + 1
+                return False
+            self._stats.retries[family] = self._stats.retries.get(family, 0) + 1
+        return True
+
+    def execute(
+        self,
+        send: Callable[[], Response],
+        family: str = "default",
+        idempotent: bool = True,
+    ) -> Response:
+        """
+        Calls `send` until it succeeds or the attempts are exhausted.
+
+        :param send: A callable signing and sending the request.
+        :param family: The endpoint family used for the counters.
+        :param idempotent: Whether resending the request cannot duplicate its
+            effect. Defaults to True.
+        :return: The response of the first successful attempt.
+        :raises RequestError: The error of the last attempt.
+        """
+        attempt = 1
+        while True:
+            try:
+                return send()
+            except RequestError as e:
+                if not self._should_retry(e, attempt, family, idempotent):
+                    raise
+                time.sleep(self.get_delay(attempt, e))
+                attempt += 1
+
+    async def execute_async(
+        self,
+        send: Callable[[], Awaitable[Response]],
+        family: str = "default",
+        idempotent: bool = True,
+    ) -> Response:
+        """
+        Asynchronous counterpart of `execute`, sleeping without blocking the loop.
+
+        :param send: A coroutine function signing and sending the request.
+        :param family: The endpoint family used for the counters.
+        :param idempotent: Whether resending the request cannot duplicate its
+            effect. Defaults to True.
+        :return: The response of the first successful attempt.
+        :raises RequestError: The error of the last attempt.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await send()
+            except RequestError as e:
+                if not self._should_retry(e, attempt, family, idempotent):
+                    raise
+                await asyncio.sleep(self.get_delay(attempt, e))
+                attempt += 1
+
+    def stats(self) -> RetryStats:
+        """
+        Returns a snapshot of the retry counters.
+
+        :return: An instance of RetryStats.
+        """
+        with self._lock:
+            return self._stats.model_copy(deep=True)
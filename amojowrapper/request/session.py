@@ -0,0 +1,209 @@
+import threading
+import time
+from typing import Optional
+
+import requests
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+
+from amojowrapper import __version__
+
+
+class PoolStats(BaseModel):
+    """
+    Connection pool usage counters of an AmojoSession.
+
+    Attributes:
+        requests (int): Total number of requests sent through the pool.
+        new_connections (int): Number of TCP/TLS connections that had to be opened.
+        reused_connections (int): Number of requests served over a kept-alive connection.
+        recycled_sessions (int): Number of times the pool was dropped after being idle
+            longer than the keep-alive timeout.
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    recycled_sessions: int = 0
+
+
+class AmojoSession:
+    """
+    A keep-alive HTTP session with a reusable connection pool.
+
+    The session is created lazily on the first request and shared by every action
+    of the client that owns it, so consecutive requests to amojo reuse already
+    established TCP/TLS connections instead of opening a new one per call.
+
+    Attributes:
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of connections kept per host.
+        keepalive_timeout (Optional[float]): Seconds of inactivity after which the
+            idle connections are dropped and reopened. None disables the timeout.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keepalive_timeout: Optional[float] = 30.0,
+    ):
+        """
+        Initializes the AmojoSession with the given pool configuration.
+
+        Args:
+            pool_connections (int): Number of per-host connection pools. Defaults to 10.
+            pool_maxsize (int): Maximum connections per host. Defaults to 10.
+            keepalive_timeout (Optional[float]): Idle timeout in seconds. Defaults to 30.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_timeout = keepalive_timeout
+
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._last_used: float = 0.0
+        self._in_flight = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._closed_stats = PoolStats()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Creates a new requests.Session mounted with a pooled HTTPAdapter.
+
+        :return: The configured session.
+        """
+        session = requests.Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        session.headers.update({"User-Agent": f"amojowrapper/{__version__}"})
+        return session
+
+    def _acquire_session(self) -> requests.Session:
+        """
+        Returns the live session for one request, recycling it if it has been
+        idle for too long. Every call must be paired with `_release_session`.
+
+        The session is only recycled while no request is in flight, so a
+        request never loses its connection to another thread; the session may
+        be shared by many clients (see ChannelRegistry).
+
+        :return: The session to send the request with.
+        :raises RuntimeError: If the session is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("the session is closed")
+            now = time.monotonic()
+            if (
+                self._session is not None
+                and self._in_flight == 0
+                and self.keepalive_timeout is not None
+                and now - self._last_used > self.keepalive_timeout
+            ):
+                self._drop_session()
+                self._closed_stats.recycled_sessions += 1
+
+            if self._session is None:
+                self._session = self._create_session()
+
+            self._in_flight += 1
+            self._last_used = now
+            return self._session
+
+    def _release_session(self) -> None:
+        """
+        Marks a request as finished, closing the session if `close()` was called
+        while it was in flight.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+            if self._closed and self._in_flight == 0:
+                self._drop_session()
+
+    def _live_stats(self) -> PoolStats:
+        """
+        Collects counters from the connection pools of the live session.
+
+        :return: The counters of the live session.
+        """
+        stats = PoolStats()
+        if self._adapter is None:
+            return stats
+
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats.requests += pool.num_requests
+            stats.new_connections += pool.num_connections
+        return stats
+
+    def _drop_session(self) -> None:
+        """
+        Closes the live session and keeps its counters. Must be called under the lock.
+        """
+        live = self._live_stats()
+        self._closed_stats.requests += live.requests
+        self._closed_stats.new_connections += live.new_connections
+
+        if self._session is not None:
+            self._session.close()
+        self._session = None
+        self._adapter = None
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends an HTTP request over the pooled session.
+
+        :param method: The HTTP method (GET, POST, PATCH, PUT, DELETE).
+        :param url: The URL to send the request to.
+        :param kwargs: Additional arguments passed to requests.Session.request.
+        :return: The response from the server.
+        :raises RuntimeError: If the session is closed.
+        """
+        session = self._acquire_session()
+        try:
+            return session.request(method=method, url=url, **kwargs)
+        finally:
+            self._release_session()
+
+    def stats(self) -> PoolStats:
+        """
+        Returns the pool usage counters, including the ones of recycled sessions.
+
+        :return: An instance of PoolStats.
+        """
+        with self._lock:
+            live = self._live_stats()
+            total_requests = self._closed_stats.requests + live.requests
+            total_new = self._closed_stats.new_connections + live.new_connections
+            return PoolStats(
+                requests=total_requests,
+                new_connections=total_new,
+                reused_connections=max(total_requests - total_new, 0),
+                recycled_sessions=self._closed_stats.recycled_sessions,
+            )
+
+    def close(self) -> None:
+        """
+        Closes the session and all pooled connections. Requests in flight finish
+        first; new requests are refused.
+        """
+        with self._lock:
+            self._closed = True
+            if self._in_flight == 0:
+                self._drop_session()
+
+    def __enter__(self) -> "AmojoSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
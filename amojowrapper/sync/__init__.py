@@ -0,0 +1,2 @@
+from amojowrapper.sync.store import HistoryStore, HistoryStoreStats
+from amojowrapper.sync.sync import HistorySync
@@ -0,0 +1,237 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from amojowrapper.actions.history.schemes import MessageItem
+from amojowrapper.helpers.sqlite import connect
+
+
+class HistoryStoreStats(BaseModel):
+    """
+    Counters of a HistoryStore.
+
+    Attributes:
+        conversations (int): Conversations with stored messages or sync state.
+        messages (int): Stored messages.
+        hits (int): Reads served from the in-memory cache.
+        misses (int): Reads that had to query SQLite.
+    """
+
+    conversations: int = 0
+    messages: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class HistoryStore:
+    """
+    A local SQLite (WAL) cache of chat history keyed by conversation.
+
+    Messages are stored once per (conversation_ref_id, message id), so the same
+    message delivered by a webhook and later by a history sync is kept once. The
+    parsed messages of the most recently read conversations are also kept in
+    memory, so repeated reads of an unchanged conversation skip SQLite and
+    parsing entirely. Reads return a tuple of the cached messages themselves,
+    without copying them, so returned messages must not be modified; pass
+    copy=True to `get_messages` for copies that may be.
+
+    The sync state (`synced_until`) is tracked apart from the stored messages:
+    messages merged from webhooks never move it, so an incremental sync still
+    fetches every message the API returned since the previous sync.
+    """
+
+    def __init__(
+        self, path: str = "amojowrapper_history.sqlite3", max_cached: int = 256
+    ):
+        """
+        Opens or creates the store.
+
+        :param path: The SQLite database path, or ":memory:".
+        :param max_cached: Conversations kept parsed in memory. Defaults to 256.
+        """
+        self.path = path
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, Tuple[MessageItem, ...]]" = OrderedDict()
+        self._stats = HistoryStoreStats()
+
+        self._connection = connect(path)
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                conversation_ref_id TEXT NOT NULL,
+                message_id TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                item TEXT NOT NULL,
+                PRIMARY KEY (conversation_ref_id, message_id)
+            ) WITHOUT ROWID
+            """)
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS messages_timestamp "
+            "ON messages (conversation_ref_id, timestamp)"
+        )
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS conversations (
+                conversation_ref_id TEXT PRIMARY KEY,
+                synced_until INTEGER,
+                synced_at REAL
+            )
+            """)
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Groups the statements of the block into one transaction.
+        """
+        self._connection.execute("BEGIN")
+        try:
+            yield
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def upsert(self, conversation_ref_id: str, items: Iterable[MessageItem]) -> int:
+        """
+        Stores messages of a conversation, replacing those already stored.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :param items: The messages to store.
+        :return: The number of stored messages.
+        """
+        rows = [
+            (
+                conversation_ref_id,
+                item.message.id,
+                item.timestamp,
+                item.model_dump_json(),
+            )
+            for item in items
+        ]
+        if not rows:
+            return 0
+        with self._lock, self._transaction():
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO messages "
+                "(conversation_ref_id, message_id, timestamp, item) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._cache.pop(conversation_ref_id, None)
+        return len(rows)
+
+    def mark_synced(self, conversation_ref_id: str, synced_until: int) -> None:
+        """
+        Records the newest timestamp returned by a history sync.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :param synced_until: The timestamp of the newest synced message.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO conversations (conversation_ref_id, synced_until, "
+                "synced_at) VALUES (?, ?, ?) ON CONFLICT (conversation_ref_id) DO "
+                "UPDATE SET synced_until = MAX(COALESCE(synced_until, 0), "
+                "excluded.synced_until), synced_at = excluded.synced_at",
+                (conversation_ref_id, synced_until, time.time()),
+            )
+
+    def sync_state(
+        self, conversation_ref_id: str
+    ) -> Tuple[Optional[int], Optional[float]]:
+        """
+        Returns the sync state of a conversation.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :return: A tuple (synced_until, synced_at), (None, None) if never synced.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT synced_until, synced_at FROM conversations "
+                "WHERE conversation_ref_id = ?",
+                (conversation_ref_id,),
+            ).fetchone()
+        return (row["synced_until"], row["synced_at"]) if row else (None, None)
+
+    def get_messages(
+        self,
+        conversation_ref_id: str,
+        limit: Optional[int] = None,
+        copy: bool = False,
+    ) -> Tuple[MessageItem, ...]:
+        """
+        Returns the stored messages of a conversation, newest first.
+
+        The messages are shared with the in-memory cache and must not be
+        modified; pass copy=True to get copies that can be.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :param limit: Maximum number of messages (optional).
+        :param copy: True to return deep copies of the messages. Defaults to False.
+        :return: A tuple of MessageItem, the cached ones unless copy is True.
+        """
+        with self._lock:
+            items = self._cache.get(conversation_ref_id)
+            if items is not None:
+                self._cache.move_to_end(conversation_ref_id)
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+                rows = self._connection.execute(
+                    "SELECT item FROM messages WHERE conversation_ref_id = ? "
+                    "ORDER BY timestamp DESC, message_id DESC",
+                    (conversation_ref_id,),
+                ).fetchall()
+                items = tuple(
+                    MessageItem.model_validate_json(row["item"]) for row in rows
+                )
+                self._cache[conversation_ref_id] = items
+                if len(self._cache) > self.max_cached:
+                    self._cache.popitem(last=False)
+        if copy:
+            return tuple(item.model_copy(deep=True) for item in items[:limit])
+        return items[:limit]
+
+    def delete(self, conversation_ref_id: str) -> None:
+        """
+        Removes the messages and the sync state of a conversation.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        """
+        with self._lock, self._transaction():
+            self._connection.execute(
+                "DELETE FROM messages WHERE conversation_ref_id = ?",
+                (conversation_ref_id,),
+            )
+            self._connection.execute(
+                "DELETE FROM conversations WHERE conversation_ref_id = ?",
+                (conversation_ref_id,),
+            )
+            self._cache.pop(conversation_ref_id, None)
+
+    def stats(self) -> HistoryStoreStats:
+        """
+        Returns the number of stored conversations and messages.
+
+        :return: An instance of HistoryStoreStats.
+        """
+        with self._lock:
+            stats = self._stats.model_copy()
+            stats.messages = self._connection.execute(
+                "SELECT COUNT(*) FROM messages"
+            ).fetchone()[0]
+            stats.conversations = self._connection.execute(
+                "SELECT COUNT(*) FROM (SELECT conversation_ref_id FROM messages "
+                "UNION SELECT conversation_ref_id FROM conversations)"
+            ).fetchone()[0]
+        return stats
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._connection.close()
@@ -0,0 +1,143 @@
+import time
+from typing import Any, Optional, Tuple
+
+from amojowrapper.actions.history.action import HistoryAction
+from amojowrapper.actions.history.schemes import (
+    MessageItem,
+    MessageModel,
+    SenderReceiverBase,
+)
+from amojowrapper.sync.store import HistoryStore
+from amojowrapper.webhook.schemes import WebhookEvent, WebhookUser
+
+
+class HistorySync:
+    """
+    Keeps a HistoryStore up to date with the chat API and incoming webhooks.
+
+    `sync` only pages through messages newer than the last synced timestamp and
+    stops at the first older one, and `get` serves the stored messages, syncing
+    first only when the conversation has not been synced for `max_age` seconds.
+    Register `on_webhook` as a "message" handler of a WebhookDispatcher to merge
+    messages delivered by webhooks as they arrive.
+
+    Attributes:
+        client: The AmojoClient used to fetch the history.
+        store (HistoryStore): The local history store.
+        page_size (int): Number of messages requested per page.
+        max_age (float): Seconds a synced conversation is served without syncing.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        store: Optional[HistoryStore] = None,
+        page_size: int = 50,
+        max_age: float = 60.0,
+    ):
+        """
+        Initializes the HistorySync.
+
+        :param client: The AmojoClient used to fetch the history.
+        :param store: The local store. Defaults to "amojowrapper_history.sqlite3".
+        :param page_size: Number of messages requested per page. Defaults to 50.
+        :param max_age: Seconds a conversation is served without syncing.
+            Defaults to 60.
+        """
+        self.client = client
+        self.store = store or HistoryStore()
+        self.page_size = page_size
+        self.max_age = max_age
+        self._history = HistoryAction(client)
+
+    def sync(self, conversation_ref_id: str) -> int:
+        """
+        Fetches the messages newer than the last sync and stores them.
+
+        Messages sent in the same second as the last synced one are fetched again
+        and deduplicated by the store.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :return: The number of fetched messages.
+        :raises RuntimeError: If a request fails or a page is invalid.
+        """
+        synced_until, _ = self.store.sync_state(conversation_ref_id)
+        newest = synced_until or 0
+        fetched = 0
+        batch = []
+        for item in self._history.iter_messages(
+            conversation_ref_id, self.page_size, since=synced_until
+        ):
+            newest = max(newest, item.timestamp)
+            batch.append(item)
+            if len(batch) >= self.page_size:
+                fetched += self.store.upsert(conversation_ref_id, batch)
+                batch = []
+        fetched += self.store.upsert(conversation_ref_id, batch)
+
+        self.store.mark_synced(conversation_ref_id, newest)
+        return fetched
+
+    def get(
+        self,
+        conversation_ref_id: str,
+        limit: Optional[int] = None,
+        refresh: Optional[bool] = None,
+        copy: bool = False,
+    ) -> Tuple[MessageItem, ...]:
+        """
+        Returns the messages of a conversation, newest first.
+
+        :param conversation_ref_id: The unique identifier of the conversation.
+        :param limit: Maximum number of messages (optional).
+        :param refresh: True to always sync, False to never sync. By default the
+            conversation is synced when its last sync is older than `max_age`.
+        :param copy: True to return copies that may be modified (see
+            HistoryStore.get_messages). Defaults to False.
+        :return: A tuple of MessageItem, the cached ones unless copy is True.
+        """
+        if refresh is None:
+            _, synced_at = self.store.sync_state(conversation_ref_id)
+            refresh = synced_at is None or time.time() - synced_at > self.max_age
+        if refresh:
+            self.sync(conversation_ref_id)
+        return self.store.get_messages(conversation_ref_id, limit, copy=copy)
+
+    def on_webhook(self, event: WebhookEvent) -> None:
+        """
+        Merges the message of a webhook event into the store.
+
+        :param event: The webhook event; events without a message are ignored.
+        """
+        if event.message is None:
+            return
+        webhook = event.message
+        item = MessageItem(
+            timestamp=webhook.timestamp,
+            sender=self._user(webhook.sender),
+            receiver=self._user(webhook.receiver),
+            message=MessageModel(
+                id=webhook.message.id,
+                type=webhook.message.type,
+                text=webhook.message.text,
+                media=webhook.message.media,
+                thumbnail=webhook.message.thumbnail,
+                file_name=webhook.message.file_name,
+                file_size=webhook.message.file_size,
+            ),
+        )
+        self.store.upsert(webhook.conversation.id, [item])
+
+    @staticmethod
+    def _user(user: WebhookUser) -> SenderReceiverBase:
+        """
+        Converts a webhook user to the history sender and receiver model.
+        """
+        return SenderReceiverBase(
+            id=user.id,
+            name=user.name,
+            client_id=user.client_id,
+            avatar=user.avatar,
+            phone=user.phone,
+            email=user.email,
+        )
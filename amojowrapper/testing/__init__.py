@@ -0,0 +1 @@
+from amojowrapper.testing.stub import StubAmojoServer, StubFault, StubRequest
@@ -0,0 +1,460 @@
+import hashlib
+import hmac
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel
+
+from amojowrapper.helpers.endpoint import get_endpoint_family
+
+PREFIX = "/v2/origin/custom/"
+
+
+class StubFault(BaseModel):
+    """
+    A fault injected into the responses of a StubAmojoServer.
+
+    Attributes:
+        status (Optional[int]): The status code returned instead of the normal
+            response, e.g. 429 or 503. None only adds latency.
+        latency (float): Seconds to wait before responding.
+        times (Optional[int]): Number of requests affected, None for all.
+        family (Optional[str]): Only affect an endpoint family, e.g. "history".
+        path_contains (Optional[str]): Only affect paths containing this string.
+        body_contains (Optional[str]): Only affect requests whose raw JSON body
+            contains this string, e.g. '"broken"'.
+        retry_after (Optional[float]): The Retry-After header sent with the status.
+    """
+
+    status: Optional[int] = None
+    latency: float = 0.0
+    times: Optional[int] = 1
+    family: Optional[str] = None
+    path_contains: Optional[str] = None
+    body_contains: Optional[str] = None
+    retry_after: Optional[float] = None
+
+    def matches(self, path: str, body: bytes = b"") -> bool:
+        """Tells whether the fault applies to a request."""
+        if self.family is not None and get_endpoint_family(path) != self.family:
+            return False
+        if self.path_contains is not None and self.path_contains not in path:
+            return False
+        return self.body_contains is None or self.body_contains.encode() in body
+
+
+class StubRequest(BaseModel):
+    """
+    A request received by a StubAmojoServer.
+
+    Attributes:
+        method (str): The HTTP method.
+        path (str): The path with the query string.
+        body (Any): The decoded JSON body, None if empty.
+        status (int): The status code of the response.
+    """
+
+    method: str
+    path: str
+    body: Any = None
+    status: int = 0
+
+
+class _StubState:
+    """
+    The chats and messages held by a StubAmojoServer.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.chats: Dict[str, Dict[str, Any]] = {}
+        self.conversation_refs: Dict[str, str] = {}
+        self.history: Dict[str, List[Dict[str, Any]]] = {}
+        self.msgids: Dict[str, Tuple[str, int]] = {}
+
+    def conversation_ref(self, payload: Dict[str, Any]) -> str:
+        """Returns the ref id of the conversation of a payload, creating it."""
+        ref_id = payload.get("conversation_ref_id")
+        if ref_id:
+            return ref_id
+        conversation_id = payload.get("conversation_id")
+        if conversation_id not in self.conversation_refs:
+            self.conversation_refs[conversation_id] = str(uuid.uuid4())
+        return self.conversation_refs[conversation_id]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Serves the chat API endpoints from the state of its StubAmojoServer.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which Nagle would delay
+    disable_nagle_algorithm = True
+    server: "_StubHTTPServer"
+
+    # (method, pattern of the path after the prefix, handler name)
+    ROUTES = (
+        ("POST", re.compile(r"^(?P<channel>[^/]+)/connect$"), "connect"),
+        ("DELETE", re.compile(r"^(?P<channel>[^/]+)/disconnect$"), "disconnect"),
+        ("POST", re.compile(r"^(?P<scope>[^/]+)/chats$"), "create_chat"),
+        (
+            "GET",
+            re.compile(r"^(?P<scope>[^/]+)/chats/(?P<ref>[^/]+)/history$"),
+            "history",
+        ),
+        ("POST", re.compile(r"^(?P<scope>[^/]+)/typing$"), "typing"),
+        ("POST", re.compile(r"^(?P<scope>[^/]+)/react$"), "react"),
+        (
+            "POST",
+            re.compile(r"^(?P<scope>[^/]+)/(?P<msgid>[^/]+)/delivery_status$"),
+            "delivery_status",
+        ),
+        ("POST", re.compile(r"^(?P<scope>[^/]+)$"), "message"),
+    )
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(
+        self,
+        status: int,
+        content: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> int:
+        # Record the request before answering, so the client sees it right away
+        self._request.status = status
+        self.server.stub._record(self._request)
+
+        data = b"" if content is None else json.dumps(content).encode()
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        return status
+
+    def _verify(self, body: bytes) -> Optional[str]:
+        """Returns why the request signature is invalid, or None."""
+        content_md5 = hashlib.md5(body).hexdigest()
+        if self.headers.get("Content-MD5", "").lower() != content_md5:
+            return "Content-MD5 does not match the body"
+        sign = "\n".join(
+            [
+                self.command,
+                content_md5,
+                self.headers.get("Content-Type", ""),
+                self.headers.get("Date", ""),
+                self.path,
+            ]
+        )
+        expected = hmac.new(
+            self.server.stub.channel_secret.encode(), sign.encode(), hashlib.sha1
+        ).hexdigest()
+        if not hmac.compare_digest(
+            self.headers.get("X-Signature", "").lower(), expected
+        ):
+            return "X-Signature is invalid"
+        return None
+
+    def _handle(self) -> None:
+        stub = self.server.stub
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        self._request = StubRequest(method=self.command, path=self.path, body=data)
+
+        fault = stub._take_fault(self.path, body)
+        if fault is not None and fault.latency:
+            time.sleep(fault.latency)
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if fault is not None and fault.status is not None:
+            headers = {}
+            if fault.retry_after is not None:
+                headers["Retry-After"] = f"{fault.retry_after:g}"
+            self._respond(fault.status, {"error": "injected fault"}, headers)
+        elif stub.verify_signature and (error := self._verify(body)) is not None:
+            self._respond(403, {"error": error})
+        else:
+            self._route(data if isinstance(data, dict) else {})
+
+    def _route(self, data: Any) -> int:
+        url = urlsplit(self.path)
+        if not url.path.startswith(PREFIX):
+            return self._respond(404, {"error": "not found"})
+        path = url.path[len(PREFIX) :]
+        for method, pattern, name in self.ROUTES:
+            match = pattern.match(path)
+            if match and method == self.command:
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                return getattr(self, f"_{name}")(data, query, **match.groupdict())
+        return self._respond(404, {"error": "not found"})
+
+    def _connect(self, data: Dict, query: Dict, channel: str) -> int:
+        account_id = data.get("account_id", "")
+        return self._respond(
+            200,
+            {
+                "account_id": account_id,
+                "hook_api_version": data.get("hook_api_version", "v2"),
+                "title": data.get("title", "Stub channel"),
+                "scope_id": f"{channel}_{account_id}",
+                "is_time_window_disabled": False,
+            },
+        )
+
+    def _disconnect(self, data: Dict, query: Dict, channel: str) -> int:
+        return self._respond(200)
+
+    def _create_chat(self, data: Dict, query: Dict, scope: str) -> int:
+        state = self.server.stub.state
+        user = data.get("user") or {}
+        with state.lock:
+            ref_id = state.conversation_ref(data)
+            chat = state.chats.setdefault(
+                ref_id,
+                {
+                    "id": ref_id,
+                    "user": {
+                        "id": str(uuid.uuid4()),
+                        "client_id": user.get("id"),
+                        "name": user.get("name"),
+                    },
+                },
+            )
+            # Creating a known chat again updates its user, as amojo does
+            if user.get("name"):
+                chat["user"]["name"] = user["name"]
+        return self._respond(200, chat)
+
+    def _message(self, data: Dict, query: Dict, scope: str) -> int:
+        state = self.server.stub.state
+        payload = data.get("payload") or {}
+        msgid = payload.get("msgid") or str(uuid.uuid4())
+        sender = payload.get("sender") or {}
+        message = payload.get("message") or {}
+        with state.lock:
+            ref_id = state.conversation_ref(payload)
+            history = state.history.setdefault(ref_id, [])
+            if data.get("event_type") == "edit_message" and msgid in state.msgids:
+                _, index = state.msgids[msgid]
+                history[index]["message"]["text"] = message.get("text", "")
+            elif msgid not in state.msgids:
+                state.msgids[msgid] = (ref_id, len(history))
+                history.append(
+                    {
+                        "timestamp": payload.get("timestamp") or int(time.time()),
+                        "sender": {
+                            "id": sender.get("ref_id") or str(uuid.uuid4()),
+                            "client_id": sender.get("id"),
+                            "name": sender.get("name"),
+                        },
+                        "message": {
+                            "id": str(uuid.uuid4()),
+                            "client_id": msgid,
+                            "type": message.get("type", "text"),
+                            "text": message.get("text", ""),
+                            "media": message.get("media", ""),
+                            "file_name": message.get("file_name", ""),
+                            "file_size": message.get("file_size", 0),
+                        },
+                    }
+                )
+            item = history[state.msgids[msgid][1]]
+        return self._respond(
+            200,
+            {
+                "new_message": {
+                    "conversation_id": ref_id,
+                    "sender_id": item["sender"]["id"],
+                    "msgid": item["message"]["id"],
+                    "ref_id": msgid,
+                }
+            },
+        )
+
+    def _history(self, data: Dict, query: Dict, scope: str, ref: str) -> int:
+        state = self.server.stub.state
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 50))
+        with state.lock:
+            newest_first = list(reversed(state.history.get(ref, [])))
+        return self._respond(200, {"messages": newest_first[offset : offset + limit]})
+
+    def _typing(self, data: Dict, query: Dict, scope: str) -> int:
+        return self._respond(204)
+
+    def _react(self, data: Dict, query: Dict, scope: str) -> int:
+        return self._respond(200)
+
+    def _delivery_status(self, data: Dict, query: Dict, scope: str, msgid: str) -> int:
+        return self._respond(200)
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, stub: "StubAmojoServer"):
+        super().__init__(address, _StubHandler)
+        self.stub = stub
+
+
+class StubAmojoServer:
+    """
+    An in-process stand-in for the amojo chat API, for offline tests and
+    benchmarks.
+
+    It serves the `/v2/origin/custom/...` endpoints used by the actions (connect,
+    disconnect, chats, messages, history, typing, react, delivery_status), keeps
+    the created chats and sent messages in memory so the history reflects them,
+    and checks Content-MD5 and X-Signature like the real API (403 on mismatch).
+    Latency, 429 and 5xx responses can be injected with `add_fault`.
+
+    Example:
+        with StubAmojoServer(channel_secret="secret") as stub:
+            client = AmojoClient(..., channel_secret="secret", base_url=stub.base_url)
+            MessageAction(client).send(...)
+            assert stub.requests[-1].status == 200
+
+    Attributes:
+        channel_secret (str): The secret the requests must be signed with.
+        host (str): The interface to listen on.
+        port (int): The port to listen on, 0 for a free port.
+        verify_signature (bool): Whether to reject badly signed requests.
+        latency (float): Seconds added to every response.
+        requests (List[StubRequest]): The received requests, oldest first.
+    """
+
+    def __init__(
+        self,
+        channel_secret: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        verify_signature: bool = True,
+        latency: float = 0.0,
+    ):
+        """
+        Initializes the StubAmojoServer.
+
+        :param channel_secret: The secret the requests must be signed with.
+        :param host: The interface to listen on. Defaults to "127.0.0.1".
+        :param port: The port to listen on. Defaults to a free port.
+        :param verify_signature: Whether to reject badly signed requests.
+            Defaults to True.
+        :param latency: Seconds added to every response. Defaults to 0.
+        """
+        self.channel_secret = channel_secret
+        self.host = host
+        self.port = port
+        self.verify_signature = verify_signature
+        self.latency = latency
+        self.requests: List[StubRequest] = []
+        self.state = _StubState()
+
+        self._faults: List[StubFault] = []
+        self._lock = threading.Lock()
+        self._server: Optional[_StubHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        """The base URL to pass as the client's `base_url`."""
+        if self._server is None:
+            raise RuntimeError("the stub server is not started")
+        return f"http://{self.host}:{self._server.server_port}"
+
+    def add_messages(self, conversation_ref_id: str, items: List[Dict]) -> None:
+        """
+        Appends messages to the history of a conversation.
+
+        :param conversation_ref_id: The amojo id of the conversation.
+        :param items: History items, oldest first, shaped like the API returns them.
+        """
+        with self.state.lock:
+            self.state.history.setdefault(conversation_ref_id, []).extend(items)
+
+    def add_fault(self, **kwargs) -> StubFault:
+        """
+        Injects a fault into the next matching responses.
+
+        :param kwargs: The StubFault fields, e.g. status=429, times=2.
+        :return: The injected StubFault.
+        """
+        fault = StubFault(**kwargs)
+        with self._lock:
+            self._faults.append(fault)
+        return fault
+
+    def clear_faults(self) -> None:
+        """Removes the injected faults."""
+        with self._lock:
+            self._faults.clear()
+
+    def _take_fault(self, path: str, body: bytes = b"") -> Optional[StubFault]:
+        """
+        Returns the first fault matching a request and consumes one of its uses.
+        """
+        with self._lock:
+            for fault in self._faults:
+                if fault.matches(path, body):
+                    if fault.times is not None:
+                        fault.times -= 1
+                        if fault.times <= 0:
+                            self._faults.remove(fault)
+                    return fault
+        return None
+
+    def _record(self, request: StubRequest) -> None:
+        with self._lock:
+            self.requests.append(request)
+
+    def start(self) -> "StubAmojoServer":
+        """
+        Starts serving in a background thread.
+
+        :return: The server itself.
+        """
+        if self._server is None:
+            self._server = _StubHTTPServer((self.host, self.port), self)
+            threading.Thread(
+                target=self._server.serve_forever,
+                name="amojowrapper-stub",
+                daemon=True,
+            ).start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubAmojoServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -1,5 +1,8 @@
 import hashlib
 import hmac
+from typing import Union
+
+_NEWLINES = b"\r\n"
 
 
 class WebhookValidator:
@@ -18,6 +21,20 @@ class WebhookValidator:
             client (object): The client object that holds the channel secret.
         """
         self.client: object = client
+        self._secret = None
+        self._hmac = None
+
+    def _prepared_hmac(self):
+        """
+        Returns a copy of an HMAC object keyed with the channel secret.
+
+        The keyed object is cached and rebuilt only if the channel secret changes.
+        """
+        secret = self.client.channel_secret
+        if secret != self._secret:
+            self._hmac = hmac.new(secret.encode(), digestmod=hashlib.sha1)
+            self._secret = secret
+        return self._hmac.copy()
 
     def validate(self, payload: str, x_signature: str) -> bool:
         """
@@ -30,8 +47,42 @@ class WebhookValidator:
         Returns:
             bool: True if the signatures match, indicating a valid webhook; False otherwise.
         """
-        payload: str = payload.strip("\r\n")
-        hash_result: str = hmac.new(
-            self.client.channel_secret.encode(), payload.encode(), hashlib.sha1
-        ).hexdigest()
-        return hash_result == x_signature
+        return self.validate_bytes(payload.encode(), x_signature)
+
+    def validate_bytes(
+        self,
+        payload: Union[bytes, bytearray, memoryview],
+        x_signature: Union[str, bytes],
+    ) -> bool:
+        """
+        Validates the webhook straight from the raw request body, without copying it.
+
+        Leading and trailing CR/LF characters are skipped by slicing a memoryview,
+        and the digests are compared in constant time.
+
+        Args:
+            payload (Union[bytes, bytearray, memoryview]): The raw webhook body.
+            x_signature (Union[str, bytes]): The signature sent with the webhook request.
+
+        Returns:
+            bool: True if the signatures match, indicating a valid webhook; False otherwise.
+        """
+        start, end = 0, len(payload)
+        while start < end and payload[start] in _NEWLINES:
+            start += 1
+        while end > start and payload[end - 1] in _NEWLINES:
+            end -= 1
+        if end - start < len(payload):
+            payload = memoryview(payload)[start:end]
+
+        mac = self._prepared_hmac()
+        mac.update(payload)
+
+        digest = mac.hexdigest()
+        if not isinstance(x_signature, str):
+            digest = digest.encode()
+        try:
+            return hmac.compare_digest(digest, x_signature)
+        except TypeError:
+            # A non-ASCII str signature cannot match a hex digest
+            return False
@@ -0,0 +1,10 @@
+from amojowrapper.webhook.dispatcher import DispatcherStats, WebhookDispatcher
+from amojowrapper.webhook.schemes import (
+    WebhookConversation,
+    WebhookEvent,
+    WebhookMessage,
+    WebhookMessageContent,
+    WebhookSource,
+    WebhookUser,
+)
+from amojowrapper.webhook.server import WebhookServer
@@ -0,0 +1,187 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+from amojowrapper.webhook.schemes import WebhookEvent
+
+WebhookHandler = Callable[[WebhookEvent], Any]
+
+
+class DispatcherStats(BaseModel):
+    """
+    Counters of a WebhookDispatcher.
+
+    Attributes:
+        queued (int): Events waiting for a worker.
+        max_queued (int): The highest queue depth observed.
+        queue_size (int): The queue capacity.
+        received (int): Events accepted into the queue.
+        rejected (int): Events rejected because the queue stayed full.
+        processed (int): Events handled by all their handlers.
+        failed (int): Handler calls that raised an exception.
+        unhandled (int): Events without a registered handler.
+        handler_time (float): Total time spent in handlers, in seconds.
+    """
+
+    queued: int = 0
+    max_queued: int = 0
+    queue_size: int = 0
+    received: int = 0
+    rejected: int = 0
+    processed: int = 0
+    failed: int = 0
+    unhandled: int = 0
+    handler_time: float = 0.0
+
+    @property
+    def average_handler_time(self) -> float:
+        """The average time spent handling an event, in seconds."""
+        return self.handler_time / self.processed if self.processed else 0.0
+
+
+class WebhookDispatcher:
+    """
+    Routes webhook events to handlers registered by event type through a bounded
+    pool of asyncio workers.
+
+    Coroutine handlers are awaited on the event loop, regular functions run in the
+    loop's default thread pool so that slow handlers never block the receiver.
+    Handlers registered for "*" receive every event.
+
+    Attributes:
+        workers (int): Number of worker tasks.
+        queue_size (int): Maximum number of events waiting for a worker.
+    """
+
+    def __init__(self, workers: int = 8, queue_size: int = 1000):
+        """
+        Initializes the WebhookDispatcher.
+
+        Args:
+            workers (int): Number of worker tasks. Defaults to 8.
+            queue_size (int): Maximum number of waiting events. Defaults to 1000.
+        """
+        self.workers = workers
+        self.queue_size = queue_size
+
+        self._handlers: Dict[str, List[WebhookHandler]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._stats = DispatcherStats(queue_size=queue_size)
+
+    def on(self, event_type: str = "*") -> Callable[[WebhookHandler], WebhookHandler]:
+        """
+        Decorator registering a handler for an event type.
+
+        :param event_type: The event type, e.g. "message", or "*" for all events.
+        :return: The decorator.
+        """
+
+        def decorator(handler: WebhookHandler) -> WebhookHandler:
+            self.add_handler(event_type, handler)
+            return handler
+
+        return decorator
+
+    def add_handler(self, event_type: str, handler: WebhookHandler) -> None:
+        """
+        Registers a handler for an event type.
+
+        :param event_type: The event type, e.g. "message", or "*" for all events.
+        :param handler: A function or coroutine function taking a WebhookEvent.
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    async def start(self) -> None:
+        """
+        Starts the worker tasks on the running event loop.
+        """
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """
+        Waits for queued events to be handled and stops the workers.
+        """
+        if self._queue is not None:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def dispatch(self, event: WebhookEvent, timeout: float = 0.0) -> bool:
+        """
+        Queues an event for the workers.
+
+        :param event: The parsed webhook event.
+        :param timeout: Seconds to wait for a free slot when the queue is full.
+        :return: True if the event was queued, False if the queue stayed full.
+        """
+        try:
+            if timeout > 0:
+                await asyncio.wait_for(self._queue.put(event), timeout)
+            else:
+                self._queue.put_nowait(event)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            self._stats.rejected += 1
+            return False
+
+        self._stats.received += 1
+        self._stats.max_queued = max(self._stats.max_queued, self._queue.qsize())
+        return True
+
+    async def _worker(self) -> None:
+        """
+        Takes events from the queue and runs their handlers.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await self._queue.get()
+            try:
+                await self._handle(loop, event)
+            finally:
+                self._queue.task_done()
+
+    async def _handle(self, loop: asyncio.AbstractEventLoop, event: WebhookEvent):
+        """
+        Runs the handlers registered for the event type and for "*".
+        """
+        handlers = self._handlers.get(event.event_type, []) + self._handlers.get(
+            "*", []
+        )
+        if not handlers:
+            self._stats.unhandled += 1
+            return
+
+        started = time.monotonic()
+        for handler in handlers:
+            try:
+                if asyncio.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    await loop.run_in_executor(None, handler, event)
+            except Exception:
+                self._stats.failed += 1
+                logger.exception(
+                    f"Webhook handler {getattr(handler, '__qualname__', handler)!r} "
+                    f"failed on a {event.event_type!r} event"
+                )
+
+        self._stats.processed += 1
+        self._stats.handler_time += time.monotonic() - started
+
+    def stats(self) -> DispatcherStats:
+        """
+        Returns a snapshot of the dispatcher counters.
+
+        :return: An instance of DispatcherStats.
+        """
+        stats = self._stats.model_copy()
+        stats.queued = self._queue.qsize() if self._queue is not None else 0
+        return stats
@@ -0,0 +1,128 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class WebhookUser(BaseModel):
+    """
+    Represents the sender or the receiver of a webhook message.
+
+    Attributes:
+        id (str): The user identifier in the chat API.
+        client_id (Optional[str]): The user identifier on the integration side.
+        name (Optional[str]): The user name.
+        avatar (Optional[str]): URL of the user avatar.
+        phone (Optional[str]): The user phone.
+        email (Optional[str]): The user email.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    client_id: Optional[str] = None
+    name: Optional[str] = None
+    avatar: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+
+
+class WebhookConversation(BaseModel):
+    """
+    Represents the conversation of a webhook message.
+
+    Attributes:
+        id (str): The conversation identifier in the chat API.
+        client_id (Optional[str]): The conversation identifier on the integration side.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    client_id: Optional[str] = None
+
+
+class WebhookMessageContent(BaseModel):
+    """
+    Represents the content of a webhook message.
+
+    Attributes:
+        id (str): The message identifier in the chat API.
+        type (str): The message type (text, picture, file, ...).
+        text (str): The message text.
+        media (str): URL of the attached media file.
+        thumbnail (str): URL of the media thumbnail.
+        file_name (str): The attached file name.
+        file_size (int): The attached file size in bytes.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    type: str
+    text: str = ""
+    media: str = ""
+    thumbnail: str = ""
+    file_name: str = ""
+    file_size: int = 0
+
+
+class WebhookSource(BaseModel):
+    """Represents the source of a webhook message."""
+
+    model_config = ConfigDict(extra="allow")
+
+    external_id: Optional[str] = None
+
+
+class WebhookMessage(BaseModel):
+    """
+    Represents an outgoing message sent from amoCRM to the integration.
+
+    Attributes:
+        receiver (WebhookUser): The receiver of the message.
+        sender (WebhookUser): The sender of the message.
+        conversation (WebhookConversation): The conversation of the message.
+        timestamp (int): The message timestamp in seconds.
+        msec_timestamp (Optional[int]): The message timestamp in milliseconds.
+        message (WebhookMessageContent): The message content.
+        source (Optional[WebhookSource]): The source of the message.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    receiver: WebhookUser
+    sender: WebhookUser
+    conversation: WebhookConversation
+    timestamp: int
+    msec_timestamp: Optional[int] = None
+    message: WebhookMessageContent
+    source: Optional[WebhookSource] = None
+
+
+class WebhookEvent(BaseModel):
+    """
+    Represents a webhook sent by the chat API.
+
+    The event payload is stored under a key naming the event type, e.g. "message".
+    Event types without a dedicated model are kept as plain dictionaries.
+
+    Attributes:
+        account_id (str): The account identifier in the chat API.
+        time (int): The time the webhook was sent.
+        message (Optional[WebhookMessage]): The payload of a "message" event.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    account_id: str
+    time: int = Field(default=0)
+    message: Optional[WebhookMessage] = None
+
+    @property
+    def event_type(self) -> str:
+        """The event type, i.e. the key holding the event payload."""
+        if self.message is not None:
+            return "message"
+        for key in self.model_extra or {}:
+            return key
+        return "unknown"
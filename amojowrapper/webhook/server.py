@@ -0,0 +1,169 @@
+from typing import Optional
+
+from pydantic import ValidationError
+
+from amojowrapper.validators.webhook import WebhookValidator
+from amojowrapper.webhook.dispatcher import WebhookDispatcher
+from amojowrapper.webhook.schemes import WebhookEvent
+
+
+class WebhookServer:
+    """
+    An embedded asyncio receiver for amojo webhooks built on top of aiohttp.
+
+    Each request is checked against its X-Signature header, parsed into a
+    WebhookEvent and handed to the dispatcher queue; the response is sent right
+    away, without waiting for the handlers. When the queue stays full for
+    `enqueue_timeout` seconds the request is answered with 503 so that amojo
+    delivers the webhook again later.
+
+    The dispatcher counters are served as JSON on `metrics_path`.
+
+    Attributes:
+        channel_secret (str): The channel secret used to check signatures.
+        dispatcher (WebhookDispatcher): Routes the events to their handlers.
+        host (str): The interface to listen on.
+        port (int): The port to listen on.
+        path (str): The path webhooks are posted to.
+        metrics_path (Optional[str]): The path of the metrics endpoint, None to disable.
+        enqueue_timeout (float): Seconds to wait for a free slot in the queue.
+    """
+
+    def __init__(
+        self,
+        channel_secret: str,
+        dispatcher: Optional[WebhookDispatcher] = None,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        path: str = "/",
+        metrics_path: Optional[str] = "/metrics",
+        enqueue_timeout: float = 1.0,
+    ):
+        """
+        Initializes the WebhookServer.
+
+        Args:
+            channel_secret (str): The channel secret used to check signatures.
+            dispatcher (Optional[WebhookDispatcher]): The dispatcher. Defaults to a new one.
+            host (str): The interface to listen on. Defaults to "0.0.0.0".
+            port (int): The port to listen on. Defaults to 8080.
+            path (str): The path webhooks are posted to. Defaults to "/".
+            metrics_path (Optional[str]): The metrics path. Defaults to "/metrics".
+            enqueue_timeout (float): Seconds to wait for a queue slot. Defaults to 1.
+        """
+        self.channel_secret = channel_secret
+        self.dispatcher = dispatcher or WebhookDispatcher()
+        self.host = host
+        self.port = port
+        self.path = path
+        self.metrics_path = metrics_path
+        self.enqueue_timeout = enqueue_timeout
+
+        self.validator = WebhookValidator(self)
+        self._runner = None
+
+    def on(self, event_type: str = "*"):
+        """
+        Decorator registering a handler for an event type, see WebhookDispatcher.on.
+        """
+        return self.dispatcher.on(event_type)
+
+    def create_app(self):
+        """
+        Creates the aiohttp application serving the webhook and metrics endpoints.
+
+        :return: An instance of aiohttp.web.Application.
+        :raises ImportError: If aiohttp is not installed.
+        """
+        try:
+            from aiohttp import web  # Optional dependency, required only here
+        except ImportError as e:
+            raise ImportError(
+                "WebhookServer requires aiohttp: pip install amojowrapper[async]"
+            ) from e
+
+        app = web.Application()
+        app.router.add_post(self.path, self._handle_webhook)
+        if self.metrics_path:
+            app.router.add_get(self.metrics_path, self._handle_metrics)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+    async def _on_startup(self, app) -> None:
+        await self.dispatcher.start()
+
+    async def _on_cleanup(self, app) -> None:
+        await self.dispatcher.stop()
+
+    async def _handle_webhook(self, request):
+        """
+        Validates, parses and queues one webhook.
+        """
+        from aiohttp import web
+
+        body = await request.read()
+        signature = request.headers.get("X-Signature", "")
+        if not self.validator.validate_bytes(body, signature):
+            return web.Response(status=401, text="invalid signature")
+
+        try:
+            event = WebhookEvent.model_validate_json(body)
+        except ValidationError:
+            return web.Response(status=400, text="invalid payload")
+
+        if not await self.dispatcher.dispatch(event, self.enqueue_timeout):
+            return web.Response(status=503, text="queue is full")
+        return web.Response(status=200, text="ok")
+
+    async def _handle_metrics(self, request):
+        """
+        Serves the dispatcher counters as JSON.
+        """
+        from aiohttp import web
+
+        stats = self.dispatcher.stats()
+        return web.json_response(
+            {**stats.model_dump(), "average_handler_time": stats.average_handler_time}
+        )
+
+    async def start(self) -> None:
+        """
+        Starts listening inside the running event loop.
+        """
+        from aiohttp import web
+
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+    async def stop(self) -> None:
+        """
+        Stops listening and waits for the queued events to be handled.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def run(self) -> None:
+        """
+        Runs the server until interrupted, blocking the calling thread.
+        """
+        from aiohttp import web
+
+        web.run_app(self.create_app(), host=self.host, port=self.port, print=None)
+
+    @property
+    def bound_port(self) -> Optional[int]:
+        """The port actually bound by `start()`, useful when `port` is 0."""
+        if self._runner is None or not self._runner.addresses:
+            return None
+        return self._runner.addresses[0][1]
+
+    async def __aenter__(self) -> "WebhookServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop()
@@ -0,0 +1,178 @@
+"""
+Runs the benchmark suite, writes the results as JSON and compares them with a
+previous run.
+
+Each benchmark module exposes `run()` returning a flat dict of metrics. Metrics
+ending in "_us" or "_ms" are costs (lower is better), metrics ending in
+"_per_second" are throughputs (higher is better); the others are informational.
+
+Run with:
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare baseline.json --threshold 0.15
+    python -m benchmarks compare baseline.json results.json
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+BENCHMARKS = (
+    "bench_actions",
+    "bench_signing",
+    "bench_serialization",
+    "bench_webhook_validator",
+    "bench_end_to_end",
+)
+
+
+def git_commit() -> Optional[str]:
+    """Returns the current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(results: Dict, prefix: str = "") -> Dict[str, object]:
+    """Flattens nested result dicts into "module.group.metric" keys."""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def run_suite(names: List[str]) -> Dict:
+    """Runs the named benchmark modules and returns the results document."""
+    results = {}
+    for name in names:
+        print(f"running {name}...", file=sys.stderr)
+        module = importlib.import_module(f"benchmarks.{name}")
+        results[name] = module.run()
+    return {
+        "commit": git_commit(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": flatten(results),
+    }
+
+
+def direction(metric: str) -> int:
+    """Returns 1 if lower is better, -1 if higher is better, 0 otherwise."""
+    if metric.endswith(("_us", "_ms")):
+        return 1
+    if metric.endswith("_per_second"):
+        return -1
+    return 0
+
+
+def compare(
+    baseline: Dict, current: Dict, threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Compares two results documents.
+
+    :param baseline: The reference results.
+    :param current: The new results.
+    :param threshold: The relative change counted as a regression, e.g. 0.1.
+    :return: The report lines and the regressed metrics.
+    """
+    lines, regressions = [], []
+    for metric, value in current["results"].items():
+        sign = direction(metric)
+        before = baseline["results"].get(metric)
+        if not sign or not isinstance(before, (int, float)) or not before:
+            continue
+        change = (value - before) / before
+        worse = change * sign > threshold
+        if worse:
+            regressions.append(metric)
+        lines.append(
+            f"{metric:<52}{before:>12.2f}{value:>12.2f}{change:>+9.1%}"
+            + ("  REGRESSION" if worse else "")
+        )
+    return lines, regressions
+
+
+def print_comparison(baseline: Dict, current: Dict, threshold: float) -> bool:
+    """Prints the comparison and returns True if nothing regressed."""
+    lines, regressions = compare(baseline, current, threshold)
+    print(
+        f"baseline {baseline.get('commit') or '?'} -> current "
+        f"{current.get('commit') or '?'} (threshold {threshold:.0%})"
+    )
+    print(f"{'metric':<52}{'baseline':>12}{'current':>12}{'change':>9}")
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+    return not regressions
+
+
+def load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "command",
+        nargs="*",
+        help="'compare BASELINE CURRENT' to compare two saved results",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=BENCHMARKS,
+        help="benchmark module to run, may be repeated (default: all)",
+    )
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="results JSON to compare the run with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change counted as a regression (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command:
+        if args.command[0] != "compare" or len(args.command) != 3:
+            parser.error("usage: python -m benchmarks compare BASELINE CURRENT")
+        ok = print_comparison(
+            load(args.command[1]), load(args.command[2]), args.threshold
+        )
+        raise SystemExit(0 if ok else 1)
+
+    current = run_suite(args.only or list(BENCHMARKS))
+    for metric, value in current["results"].items():
+        shown = f"{value:.2f}" if isinstance(value, float) else value
+        print(f"{metric:<52}{shown:>12}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2)
+        print(f"results written to {args.output}", file=sys.stderr)
+
+    if args.compare:
+        print()
+        if not print_comparison(load(args.compare), current, args.threshold):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Measures the CPU cost of building the request payload of each action and of
+parsing the typical responses, without any network.
+
+Payloads are built through the same private helpers the actions use before
+sending, so a regression in e.g. MessageAction._build_payload shows up here.
+
+Run with: python -m benchmarks.bench_actions
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+from amojowrapper.actions import (
+    ChannelAction,
+    ChatAction,
+    DeliveryStatusAction,
+    HistoryAction,
+    MessageAction,
+    ReactAction,
+    TypingAction,
+)
+from amojowrapper.actions.chat.schemes import ChatResponse
+from amojowrapper.actions.message.schemes import MessageResponse
+
+ITERATIONS = 5000
+REPEATS = 5
+
+# Actions only read the credentials from the client to build their payloads
+CLIENT = SimpleNamespace(
+    channel_id="channel-id",
+    amojo_account_token="account-token",
+    mapping_store=None,
+)
+
+MESSAGE = {
+    "conversation_id": "conversation-id",
+    "sender_id": "sender-id",
+    "sender_name": "amojowrapper",
+    "message_type": "text",
+    "message_text": "benchmark message " * 10,
+    "msgid": "amojowrapper_msgid_9636081a-68f8-47d4-96d3-c07429e1fcbf",
+}
+
+CHAT_RESPONSE = json.dumps(
+    {"id": "chat-ref", "user": {"id": "user-ref", "client_id": "user", "name": "Ann"}}
+).encode()
+
+MESSAGE_RESPONSE = json.dumps(
+    {
+        "new_message": {
+            "conversation_id": "conversation-ref",
+            "sender_id": "sender-ref",
+            "msgid": "message-id",
+            "ref_id": "amojowrapper_msgid_9636081a",
+        }
+    }
+).encode()
+
+HISTORY_RESPONSE = json.dumps(
+    {
+        "messages": [
+            {
+                "timestamp": 1700000000 - i,
+                "sender": {"id": "sender-ref", "name": "Ann", "client_id": "user"},
+                "receiver": {"id": "receiver-ref", "name": "Bot"},
+                "message": {"id": f"message-{i}", "type": "text", "text": "hi " * 20},
+            }
+            for i in range(50)
+        ]
+    }
+).encode()
+
+
+def measure(func, *args, iterations: int = ITERATIONS) -> float:
+    """
+    Returns the best CPU time per call out of REPEATS runs, in microseconds.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.process_time()
+        for _ in range(iterations):
+            func(*args)
+        best = min(best, time.process_time() - start)
+    return best / iterations * 1_000_000
+
+
+def run() -> dict:
+    """
+    Runs the benchmark and returns CPU microseconds per payload or response.
+    """
+    channel = ChannelAction(CLIENT)
+    chat = ChatAction(CLIENT)
+    message = MessageAction(CLIENT)
+    trusted = MessageAction(CLIENT, validation="trusted")
+    typing = TypingAction(CLIENT)
+    delivery = DeliveryStatusAction(CLIENT)
+    react = ReactAction(CLIENT)
+
+    chat_kwargs = {
+        "conversation_id": "conversation-id",
+        "user_id": "user",
+        "user_name": "Ann",
+        "user_profile_phone": "+10000000000",
+    }
+    typing_kwargs = {"conversation_id": "conversation-id", "sender_id": "sender-id"}
+    delivery_kwargs = {"msgid": "message-id", "delivery_status": 1}
+    react_kwargs = {
+        "conversation_id": "conversation-id",
+        "id": "message-id",
+        "user_id": "user",
+        "type": "react",
+        "emoji": "+1",
+    }
+
+    def send_body(action):
+        return action._build_request_body(
+            "new_message", MESSAGE, **action._create_send_components(MESSAGE)
+        )
+
+    def edit_body():
+        return message._build_request_body(
+            "edit_message", MESSAGE, **message._create_edit_components(MESSAGE)
+        )
+
+    return {
+        "channel_connect_us": measure(channel._build_connect_payload, "v2", "title"),
+        "chat_create_us": measure(chat._build_payload, chat_kwargs),
+        "message_send_strict_us": measure(send_body, message),
+        "message_send_trusted_us": measure(send_body, trusted),
+        "message_edit_us": measure(edit_body),
+        "typing_us": measure(
+            lambda: typing._build_payload(
+                typing_kwargs, sender=typing._create_sender(typing_kwargs)
+            )
+        ),
+        "delivery_status_us": measure(delivery._build_payload, delivery_kwargs),
+        "react_us": measure(
+            lambda: react._build_payload(
+                react_kwargs, user=react._create_user(react_kwargs)
+            )
+        ),
+        "parse_chat_us": measure(ChatResponse.model_validate_json, CHAT_RESPONSE),
+        "parse_message_us": measure(
+            MessageResponse.model_validate_json, MESSAGE_RESPONSE
+        ),
+        "parse_history_50_us": measure(
+            HistoryAction._parse_page, HISTORY_RESPONSE, 50, None, iterations=500
+        ),
+    }
+
+
+def main():
+    for name, value in run().items():
+        print(f"{name[:-3]:<28}{value:>10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
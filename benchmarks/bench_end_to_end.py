@@ -0,0 +1,91 @@
+"""
+Measures the throughput and latency of sending messages end to end against the
+local stub server: payload building, signing, the HTTP round trip through the
+connection pool and response parsing.
+
+Messages are sent from a pool of threads sharing one client, like a bot
+answering many conversations at once. Latency percentiles are wall-clock times
+per MessageAction.send call.
+
+Run with: python -m benchmarks.bench_end_to_end
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from amojowrapper.actions import MessageAction
+from amojowrapper.client import AmojoClient
+from amojowrapper.testing import StubAmojoServer
+
+MESSAGES = 2000
+CONCURRENCY = 8
+SECRET = "channel-secret"
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Returns the value below which the given fraction of the values falls.
+    """
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run(messages: int = MESSAGES, concurrency: int = CONCURRENCY) -> dict:
+    """
+    Runs the benchmark and returns the throughput and latency percentiles.
+    """
+    with StubAmojoServer(channel_secret=SECRET) as stub:
+        with AmojoClient(
+            channel_secret=SECRET,
+            channel_id="channel-id",
+            referer="benchmark.amocrm.ru",
+            amojo_account_token="account-token",
+            pool_maxsize=concurrency,
+            base_url=stub.base_url,
+        ) as client:
+            action = MessageAction(client)
+
+            def send(index: int) -> float:
+                start = time.perf_counter()
+                action.send(
+                    conversation_id=f"conversation-{index % 100}",
+                    sender_id="sender-id",
+                    sender_name="amojowrapper",
+                    message_type="text",
+                    message_text="benchmark message",
+                )
+                return time.perf_counter() - start
+
+            # Warm up the connection pool
+            list(map(send, range(concurrency)))
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                latencies = sorted(executor.map(send, range(messages)))
+            elapsed = time.perf_counter() - start
+
+    return {
+        "messages": messages,
+        "concurrency": concurrency,
+        "messages_per_second": messages / elapsed,
+        "latency_p50_ms": percentile(latencies, 0.50) * 1000,
+        "latency_p90_ms": percentile(latencies, 0.90) * 1000,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    results = run()
+    print(
+        f"{results['messages']} messages, {results['concurrency']} threads: "
+        f"{results['messages_per_second']:.0f} msg/s"
+    )
+    print(
+        f"latency p50 {results['latency_p50_ms']:.2f} ms, "
+        f"p90 {results['latency_p90_ms']:.2f} ms, "
+        f"p99 {results['latency_p99_ms']:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
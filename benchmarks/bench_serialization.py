@@ -0,0 +1,128 @@
+"""
+Compares the CPU cost of preparing a request body before and after the
+encode-once pipeline.
+
+The legacy path serialized the payload with json.dumps for signing and let
+requests serialize it a second time for the body. The current path encodes the
+payload once with the client's JSON encoder and sends the signed bytes.
+
+Run with: python -m benchmarks.bench_serialization
+"""
+
+import json
+import time
+
+from amojowrapper.helpers.headers import AmojoHeaderBuilder
+from amojowrapper.helpers.serializer import (
+    get_default_json_encoder,
+    stdlib_json_encoder,
+)
+
+ITERATIONS = 20000
+
+
+def build_payload(forwards: int = 20) -> dict:
+    """
+    Builds a large new_message payload with forwarded messages.
+    """
+    embedded = {
+        "msgid": "amojowrapper_msgid_1ecac67d-64d2-414b-afea-4e274fec4d7e",
+        "type": "text",
+        "text": "forwarded message " * 20,
+        "timestamp": 1700000000,
+        "msec_timestamp": 1700000000000,
+        "sender": {"id": "sender-id", "name": "Sender"},
+    }
+    return {
+        "event_type": "new_message",
+        "payload": {
+            "timestamp": 1700000000,
+            "msec_timestamp": 1700000000000,
+            "msgid": "amojowrapper_msgid_9636081a-68f8-47d4-96d3-c07429e1fcbf",
+            "conversation_id": "conversation-id",
+            "silent": False,
+            "sender": {"id": "sender-id", "name": "amojowrapper"},
+            "message": {"type": "text", "text": "benchmark message " * 50},
+            "forwards": {"messages": [embedded] * forwards},
+        },
+    }
+
+
+def legacy_prepare(data: dict) -> bytes:
+    """
+    Signs json.dumps output, then serializes again the way requests' json= does.
+    """
+    payload_str = json.dumps(data)
+    (
+        AmojoHeaderBuilder()
+        .add_date()
+        .add_content_type()
+        .add_content_md5(payload_str)
+        .add_signature("secret", "POST", "/v2/origin/custom/scope", payload_str)
+        .build()
+    )
+    return json.dumps(data, allow_nan=False).encode("utf-8")
+
+
+def encode_once_prepare(data: dict, encoder) -> bytes:
+    """
+    Encodes once and signs the bytes that are sent.
+    """
+    body = encoder(data)
+    (
+        AmojoHeaderBuilder()
+        .add_date()
+        .add_content_type()
+        .add_content_md5(body)
+        .add_signature("secret", "POST", "/v2/origin/custom/scope", body)
+        .build()
+    )
+    return body
+
+
+def measure(func, *args, iterations: int = ITERATIONS) -> float:
+    """
+    Returns the CPU time per call in microseconds.
+    """
+    start = time.process_time()
+    for _ in range(iterations):
+        func(*args)
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def run() -> dict:
+    """
+    Runs the benchmark and returns CPU microseconds per request for each path.
+    """
+    data = build_payload()
+    encoder = get_default_json_encoder()
+
+    results = {
+        "payload_bytes": len(stdlib_json_encoder(data)),
+        "legacy_us": measure(legacy_prepare, data),
+        "encode_once_stdlib_us": measure(
+            encode_once_prepare, data, stdlib_json_encoder
+        ),
+        "encode_once_default_us": measure(encode_once_prepare, data, encoder),
+        "default_encoder": f"{encoder.__module__}.{encoder.__name__}",
+    }
+    return results
+
+
+def main():
+    results = run()
+    print(f"payload size: {results['payload_bytes']} bytes")
+    print(f"legacy (dumps twice):      {results['legacy_us']:.1f} us/request")
+    print(
+        f"encode once (json):        {results['encode_once_stdlib_us']:.1f} us/request"
+    )
+    print(
+        f"encode once ({results['default_encoder']}): "
+        f"{results['encode_once_default_us']:.1f} us/request"
+    )
+    saved = results["legacy_us"] - results["encode_once_default_us"]
+    print(f"saved: {saved:.1f} us of CPU per request")
+
+
+if __name__ == "__main__":
+    main()
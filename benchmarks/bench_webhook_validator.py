@@ -0,0 +1,106 @@
+"""
+Compares the CPU cost of validating a webhook signature with the legacy str
+path and the bytes fast path.
+
+The legacy path decoded the body, stripped it, encoded the payload and the
+channel secret again and compared hex strings with ==. The fast path hashes the
+raw body through a memoryview with a pre-keyed HMAC object and compares the
+digests in constant time.
+
+Run with: python -m benchmarks.bench_webhook_validator
+"""
+
+import hashlib
+import hmac
+import json
+import time
+from types import SimpleNamespace
+
+from amojowrapper.validators.webhook import WebhookValidator
+
+ITERATIONS = 20000
+REPEATS = 5
+
+
+def build_body(attachments: int = 20) -> bytes:
+    """
+    Builds a multi-KB webhook body with attachment metadata.
+    """
+    media = {
+        "id": "c1b5a0e6-2d3f-4b8a-9d6e-0f1e2a3b4c5d",
+        "type": "file",
+        "media": "https://amojo.amocrm.ru/attachments/" + "a" * 64,
+        "file_name": "document.pdf",
+        "file_size": 123456,
+    }
+    return json.dumps(
+        {
+            "account_id": "account-id",
+            "time": 1700000000,
+            "message": {
+                "receiver": {"id": "receiver-id", "client_id": "client-id"},
+                "sender": {"id": "sender-id"},
+                "conversation": {"id": "conversation-id", "client_id": "ref-id"},
+                "timestamp": 1700000000,
+                "message": {"id": "message-id", "type": "text", "text": "x" * 500},
+                "attachments": [media] * attachments,
+            },
+        }
+    ).encode()
+
+
+def legacy_validate(secret: str, body: bytes, x_signature: str) -> bool:
+    """
+    The validation as it was done before the bytes fast path.
+    """
+    payload = body.decode().strip("\r\n")
+    hash_result = hmac.new(secret.encode(), payload.encode(), hashlib.sha1).hexdigest()
+    return hash_result == x_signature
+
+
+def measure(func, *args, iterations: int = ITERATIONS) -> float:
+    """
+    Returns the best CPU time per call out of REPEATS runs, in microseconds.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.process_time()
+        for _ in range(iterations):
+            func(*args)
+        best = min(best, time.process_time() - start)
+    return best / iterations * 1_000_000
+
+
+def run() -> dict:
+    """
+    Runs the benchmark and returns CPU microseconds per webhook for each path,
+    for a typical and a large body.
+    """
+    secret = "channel-secret"
+    validator = WebhookValidator(SimpleNamespace(channel_secret=secret))
+
+    results = {}
+    for name, attachments in (("typical", 20), ("large", 250)):
+        body = build_body(attachments)
+        signature = hmac.new(secret.encode(), body, hashlib.sha1).hexdigest()
+
+        assert legacy_validate(secret, body, signature)
+        assert validator.validate_bytes(body, signature)
+
+        results[name] = {
+            "payload_bytes": len(body),
+            "legacy_us": measure(legacy_validate, secret, body, signature),
+            "validate_bytes_us": measure(validator.validate_bytes, body, signature),
+        }
+    return results
+
+
+def main():
+    for name, result in run().items():
+        print(f"{name} payload: {result['payload_bytes']} bytes")
+        print(f"  legacy (str, ==):  {result['legacy_us']:.2f} us/webhook")
+        print(f"  validate_bytes:    {result['validate_bytes_us']:.2f} us/webhook")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 import pytest
 from amojowrapper.client import AmojoClient
+from amojowrapper.testing import StubAmojoServer
 from helpers import get_env
 from collections import deque
 from pprint import pprint
 
+STUB_SECRET = "stub-secret"
+
 
 def pytest_addoption(parser):
     """
@@ -55,15 +58,65 @@ def amojo_client_fixture(request):
     """
     Fixture to create an AmojoClient instance with data from .pytest.env.
     Supports debug mode via the --amojo-debug command-line option.
+
+    Without credentials, the client is pointed to a local StubAmojoServer so the
+    tests run offline.
     """
     debug_mode = request.config.getoption(
         "--amojo-debug"
     )  # Get the value of --amojo-debug
 
-    return AmojoClient(
-        referer=get_env("referer"),
-        amojo_account_token=get_env("amojo_account_token"),
-        channel_secret=get_env("channel_secret"),
-        channel_id=get_env("channel_id"),
-        debug=debug_mode,  # Pass the debug mode value
-    )
+    credentials = {
+        "referer": get_env("referer"),
+        "amojo_account_token": get_env("amojo_account_token"),
+        "channel_secret": get_env("channel_secret"),
+        "channel_id": get_env("channel_id"),
+    }
+    if all(credentials.values()):
+        yield AmojoClient(**credentials, debug=debug_mode)
+        return
+
+    with StubAmojoServer(channel_secret=STUB_SECRET) as stub:
+        with AmojoClient(
+            referer="stub.amocrm.ru",
+            amojo_account_token="stub-account",
+            channel_secret=STUB_SECRET,
+            channel_id="stub-channel",
+            debug=debug_mode,
+            base_url=stub.base_url,
+        ) as client:
+            yield client
+
+
+@pytest.fixture
+def amojo_stub():
+    """
+    Fixture running a fresh StubAmojoServer for one test, so injected faults and
+    recorded requests never leak between tests.
+    """
+    with StubAmojoServer(channel_secret=STUB_SECRET) as stub:
+        yield stub
+
+
+@pytest.fixture
+def stub_client_kwargs(amojo_stub):
+    """
+    Fixture with the AmojoClient/AsyncAmojoClient arguments pointing to the
+    amojo_stub server. The scope id of such clients is "channel_account".
+    """
+    return {
+        "channel_secret": STUB_SECRET,
+        "channel_id": "channel",
+        "referer": "test.amocrm.ru",
+        "amojo_account_token": "account",
+        "base_url": amojo_stub.base_url,
+    }
+
+
+@pytest.fixture
+def stub_client(stub_client_kwargs):
+    """
+    Fixture with an AmojoClient sending to the amojo_stub server.
+    """
+    with AmojoClient(**stub_client_kwargs) as client:
+        yield client
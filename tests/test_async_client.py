@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from amojowrapper.actions import AsyncMessageAction, AsyncReactAction
+from amojowrapper.client import AsyncAmojoClient
+from amojowrapper.request import AsyncAmojoSession
+
+
+def test_async_message_send(stub_client_kwargs):
+    async def send_all():
+        async with AsyncAmojoClient(**stub_client_kwargs, pool_maxsize=5) as client:
+            message = AsyncMessageAction(client)
+            results = await asyncio.gather(
+                *(
+                    message.send(
+                        msgid=f"msgid-{i}",
+                        message_type="text",
+                        message_text="async message",
+                        conversation_id="conversation",
+                        sender_id="sender",
+                    )
+                    for i in range(10)
+                )
+            )
+            return results, client.pool_stats()
+
+    results, stats = asyncio.run(send_all())
+
+    assert [r.new_message.ref_id for r in results] == [f"msgid-{i}" for i in range(10)]
+    assert stats.requests == 10
+    assert stats.new_connections <= 5
+
+
+def test_async_react_invalid_params_raise():
+    async def react():
+        async with AsyncAmojoClient(
+            channel_secret="secret",
+            channel_id="channel",
+            referer="test.amocrm.ru",
+            amojo_account_token="account",
+        ) as client:
+            await AsyncReactAction(client).set()
+
+    with pytest.raises(ValueError):
+        asyncio.run(react())
+
+
+def test_async_session_refuses_requests_after_close():
+    async def use_after_close():
+        session = AsyncAmojoSession()
+        await session.get_session()
+        await session.close()
+        with pytest.raises(RuntimeError):
+            await session.get_session()
+
+    asyncio.run(use_after_close())
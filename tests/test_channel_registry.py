@@ -0,0 +1,73 @@
+import pytest
+
+from amojowrapper.actions import MessageAction
+from amojowrapper.registry import ChannelRegistry
+
+
+def test_registry_shares_pool_and_caches_actions():
+    with ChannelRegistry(max_cached=2) as registry:
+        scopes = [
+            registry.register("secret", f"channel-{i}", "test.amocrm.ru", "account")
+            for i in range(3)
+        ]
+        other = registry.register("secret", "channel", "test.kommo.com", "account")
+
+        assert scopes[0] == "channel-0_account"
+        assert registry.message(scopes[0]) is registry.message(scopes[0])
+        assert registry.client(scopes[0]).amojo_base_url == "https://amojo.amocrm.ru"
+        assert registry.client(other).amojo_base_url == "https://amojo.kommo.com"
+        assert registry.client(scopes[1]).session is registry.client(scopes[2]).session
+
+        stats = registry.stats()
+        assert stats.channels == 4
+        assert stats.cached_scopes == 2
+        assert stats.sessions == 2
+        assert stats.evictions >= 1
+
+
+def test_registry_sends_through_shared_pool(amojo_stub, stub_client_kwargs):
+    secret = stub_client_kwargs["channel_secret"]
+    with ChannelRegistry() as registry:
+        scopes = [
+            registry.register(
+                secret,
+                f"channel-{i}",
+                "test.amocrm.ru",
+                "acc",
+                base_url=amojo_stub.base_url,
+            )
+            for i in range(5)
+        ]
+        for scope in scopes:
+            response = registry.action(scope, MessageAction).send(
+                msgid=f"msgid-{scope}",
+                message_type="text",
+                message_text="hello",
+                conversation_id="conversation",
+                sender_id="sender",
+            )
+            assert response.new_message.ref_id == f"msgid-{scope}"
+
+        (stats,) = registry.pool_stats().values()
+
+    assert stats.requests == 5
+    assert stats.new_connections == 1
+
+
+def test_registry_keeps_explicit_base_url():
+    with ChannelRegistry() as registry:
+        scope = registry.register(
+            "secret",
+            "channel",
+            "test.amocrm.ru",
+            "account",
+            base_url="http://127.0.0.1:8080/amojo/",
+        )
+        client = registry.client(scope)
+
+    assert client.amojo_base_url == "http://127.0.0.1:8080/amojo"
+
+
+def test_registry_unknown_scope():
+    with pytest.raises(KeyError):
+        ChannelRegistry().message("missing")
@@ -0,0 +1,54 @@
+import io
+import json
+
+from amojowrapper.bulk import ChatImporter, read_chat_records
+
+
+def test_read_chat_records():
+    lines = ["conversation_id,user_id,user_name,note", "conv-1,user-1,Ann,x"]
+    assert list(read_chat_records(lines, "csv")) == [
+        {"conversation_id": "conv-1", "user_id": "user-1", "user_name": "Ann"}
+    ]
+    source = io.StringIO(
+        'conversation_id,user_name\r\nconv-2,"Ann\r\n Smith"\r\n', newline=""
+    )
+    assert list(read_chat_records(source, "csv")) == [
+        {"conversation_id": "conv-2", "user_name": "Ann\r\n Smith"}
+    ]
+    lines = ['{"conversation_id": "conv-1", "user_profile_phone": "+1"}', ""]
+    assert list(read_chat_records(lines)) == [
+        {"conversation_id": "conv-1", "user_profile_phone": "+1"}
+    ]
+
+
+def test_chat_import_resumes(tmp_path, amojo_stub, stub_client):
+    checkpoint = str(tmp_path / "chats.jsonl")
+    records = [
+        {"conversation_id": f"conv-{i}", "user_id": f"user-{i}", "user_name": "Ann"}
+        for i in range(20)
+    ]
+    records.append({"user_id": "user-x", "user_name": "Nobody"})
+
+    amojo_stub.add_fault(status=400, times=None, body_contains='"conv-2"')
+    importer = ChatImporter(stub_client, checkpoint, concurrency=4)
+
+    stats = importer.run(records + records[:3])
+    assert stats.rows == 24
+    assert stats.completed == 19
+    assert stats.skipped == 3
+    assert sorted(stats.failed_ids) == ["conv-2", "row 21"]
+    assert "400" in stats.errors["conv-2"]
+    assert stats.errors["row 21"] == "conversation_id is missing"
+
+    amojo_stub.clear_faults()
+    stats = importer.run(records)
+    assert stats.completed == 1
+    assert stats.skipped == 19
+
+    with open(checkpoint, "rb") as file:
+        entries = [json.loads(line) for line in file]
+    assert [e.get("status") for e in entries].count("failed") == 1
+    completed = [e for e in entries if e.get("status", "completed") == "completed"]
+    assert len(completed) == 20
+    entry = next(e for e in completed if e["conversation_id"] == "conv-2")
+    assert entry["ref_id"] == amojo_stub.state.conversation_refs["conv-2"]
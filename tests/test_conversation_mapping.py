@@ -0,0 +1,91 @@
+from amojowrapper.actions.chat.action import ChatAction
+from amojowrapper.actions.message.action import MessageAction
+from amojowrapper.client import AmojoClient
+from amojowrapper.mapping import (
+    ConversationMapping,
+    ConversationMappingStore,
+    MappingStoreInterface,
+)
+
+
+class BrokenStore(MappingStoreInterface):
+    def get(self, scope_id, conversation_id):
+        return None
+
+    def put(self, scope_id, mapping):
+        raise OSError("disk full")
+
+
+def test_known_chats_are_not_created_again(amojo_stub, stub_client_kwargs):
+    store = ConversationMappingStore()
+    chat = dict(conversation_id="conv-1", user_id="user-1", user_name="Ann")
+
+    with AmojoClient(**stub_client_kwargs, mapping_store=store) as client:
+        first = ChatAction(client).create(**chat)
+        second = ChatAction(client).create(**chat)
+        refreshed = ChatAction(client).create(refresh=True, **chat)
+
+    assert len(amojo_stub.requests) == 2
+    assert first == second == refreshed
+    assert second.id == amojo_stub.state.conversation_refs["conv-1"]
+    assert second.user.client_id == "user-1"
+
+    renamed = dict(chat, user_name="Anna")
+    with AmojoClient(**stub_client_kwargs, mapping_store=store) as client:
+        ChatAction(client).create(**renamed)
+        ChatAction(client).create(**renamed)
+
+    assert len(amojo_stub.requests) == 3
+    assert store.get("channel_account", "conv-1").user_name == "Anna"
+
+
+def test_failing_store_does_not_fail_delivered_calls(amojo_stub, stub_client_kwargs):
+    with AmojoClient(**stub_client_kwargs, mapping_store=BrokenStore()) as client:
+        chat = ChatAction(client).create(
+            conversation_id="conv-3", user_id="user-3", user_name="Cid"
+        )
+        response = MessageAction(client).send(
+            conversation_id="conv-3",
+            sender_id="user-3",
+            message_type="text",
+            message_text="Hello",
+        )
+
+    assert chat.id == amojo_stub.state.conversation_refs["conv-3"]
+    assert response.new_message.conversation_id == chat.id
+
+
+def test_messages_resolve_and_remember_ref_ids(amojo_stub, stub_client_kwargs):
+    store = ConversationMappingStore()
+    message = dict(
+        sender_id="user-2",
+        sender_name="Bob",
+        message_type="text",
+        message_text="Hello",
+    )
+
+    with AmojoClient(**stub_client_kwargs, mapping_store=store) as client:
+        MessageAction(client).send(conversation_id="conv-2", **message)
+        MessageAction(client).send(conversation_id="conv-2", **message)
+
+    ref_id = amojo_stub.state.conversation_refs["conv-2"]
+    first, second = (request.body["payload"] for request in amojo_stub.requests)
+    assert "conversation_ref_id" not in first
+    assert second["conversation_ref_id"] == ref_id
+    assert store.get("channel_account", "conv-2").ref_id == ref_id
+
+
+def test_mappings_persist_and_merge(tmp_path):
+    path = str(tmp_path / "mapping.sqlite3")
+    store = ConversationMappingStore(max_entries=1, path=path)
+    store.put("scope", ConversationMapping(conversation_id="a", ref_id="ref-a"))
+    store.put("scope", ConversationMapping(conversation_id="a", user_id="user-a"))
+    store.put("scope", ConversationMapping(conversation_id="b", ref_id="ref-b"))
+    assert store.stats().evictions == 1
+    store.close()
+
+    reopened = ConversationMappingStore(path=path)
+    mapping = reopened.get("scope", "a")
+    assert (mapping.ref_id, mapping.user_id) == ("ref-a", "user-a")
+    assert reopened.get("other", "a") is None
+    reopened.close()
@@ -0,0 +1,101 @@
+import threading
+import time
+
+import pytest
+
+from amojowrapper.actions import DeliveryStatusAction, DeliveryStatusPipeline
+from amojowrapper.request import RequestError
+
+
+def sent_statuses(stub):
+    """Returns (msgid in the path, msgid in the body, status) per request."""
+    return [
+        (
+            request.path.split("/")[-2],
+            request.body["msgid"],
+            request.body["delivery_status"],
+        )
+        for request in stub.requests
+    ]
+
+
+def test_shared_action_uses_the_msgid_of_each_call(amojo_stub, stub_client):
+    action = DeliveryStatusAction(stub_client)
+    threads = [
+        threading.Thread(
+            target=action.set, kwargs={"msgid": f"m{i}", "delivery_status": 1}
+        )
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statuses = sent_statuses(amojo_stub)
+    assert len(statuses) == 8
+    assert all(path_msgid == msgid for path_msgid, msgid, _ in statuses)
+
+
+def test_pipeline_collapses_statuses_per_msgid(amojo_stub, stub_client):
+    amojo_stub.add_fault(status=400, times=None, path_contains="/broken/")
+    with DeliveryStatusPipeline(stub_client, flush_interval=0.2) as pipeline:
+        delivered = pipeline.set(msgid="m1", delivery_status=1)
+        read = pipeline.set(msgid="m1", delivery_status=2)
+        other = pipeline.set(msgid="m2", delivery_status=1)
+        broken = pipeline.set(msgid="broken", delivery_status=1)
+        assert pipeline.flush(timeout=5)
+
+        assert delivered is read
+        assert read.result() == other.result() == 200
+        with pytest.raises(RequestError):
+            broken.result()
+        stats = pipeline.stats()
+
+    assert sorted(sent_statuses(amojo_stub)) == [
+        ("broken", "broken", 1),
+        ("m1", "m1", 2),
+        ("m2", "m2", 1),
+    ]
+    assert (stats.requested, stats.collapsed, stats.sent, stats.failed) == (4, 1, 2, 1)
+    assert stats.pending == 0
+
+
+def test_pipeline_requires_msgid(stub_client):
+    with DeliveryStatusPipeline(stub_client) as pipeline:
+        with pytest.raises(ValueError):
+            pipeline.set(delivery_status=1)
+
+
+def test_slow_msgid_does_not_hold_back_others(amojo_stub, stub_client):
+    amojo_stub.add_fault(latency=1.0, times=1, path_contains="/slow/")
+    with DeliveryStatusPipeline(stub_client, flush_interval=0.05) as pipeline:
+        slow = pipeline.set(msgid="slow", delivery_status=1)
+        time.sleep(0.2)
+        slow_read = pipeline.set(msgid="slow", delivery_status=2)
+        fast = pipeline.set(msgid="fast", delivery_status=1)
+
+        assert fast.result(timeout=0.8) == 200
+        assert not slow.done()
+        assert slow_read.result(timeout=5) == 200
+
+    # The stub records a request once answered, i.e. in completion order
+    assert sent_statuses(amojo_stub) == [
+        ("fast", "fast", 1),
+        ("slow", "slow", 1),
+        ("slow", "slow", 2),
+    ]
+
+
+def test_close_timeout_fails_unsent_updates(amojo_stub, stub_client):
+    amojo_stub.add_fault(latency=1.0, times=1, path_contains="/slow/")
+    pipeline = DeliveryStatusPipeline(stub_client, flush_interval=0.05)
+    in_flight = pipeline.set(msgid="slow", delivery_status=1)
+    time.sleep(0.2)
+    queued = pipeline.set(msgid="slow", delivery_status=2)
+    pipeline.close(timeout=0.1)
+
+    with pytest.raises(RuntimeError):
+        queued.result(timeout=0)
+    assert in_flight.result(timeout=5) == 200
+    assert pipeline.stats().pending == 0
@@ -0,0 +1,60 @@
+import time
+
+import pytest
+
+from amojowrapper.actions import EditCoalescer
+
+
+def edit_kwargs(msgid, text):
+    return dict(
+        msgid=msgid,
+        conversation_id="conv",
+        sender_id="bot",
+        sender_name="Bot",
+        message_type="text",
+        message_text=text,
+    )
+
+
+def test_streamed_edits_are_coalesced(amojo_stub, stub_client):
+    with EditCoalescer(stub_client, interval=0.1) as coalescer:
+        text = ""
+        for token in range(60):
+            text += f"{token} "
+            last = coalescer.edit(**edit_kwargs("m1", text))
+            coalescer.edit(**edit_kwargs("m2", text))
+            time.sleep(0.005)
+        assert last.result(timeout=5).new_message.ref_id == "m1"
+        assert coalescer.flush(timeout=5)
+        stats = coalescer.stats()
+
+    with pytest.raises(RuntimeError):
+        coalescer.edit(**edit_kwargs("m1", "late"))
+
+    edits = [
+        (request.body["payload"]["msgid"], request.body["payload"]["message"]["text"])
+        for request in amojo_stub.requests
+    ]
+    for msgid in ("m1", "m2"):
+        texts = [t for m, t in edits if m == msgid]
+        assert texts[0] == "0 "
+        assert texts[-1] == text
+        assert texts == sorted(texts, key=len)
+    assert stats.requested == 120
+    assert stats.sent == len(edits) < 40
+    assert stats.skipped == stats.requested - stats.sent
+    assert stats.pending == 0
+
+
+def test_close_timeout_fails_unsent_edits(amojo_stub, stub_client):
+    amojo_stub.add_fault(latency=0.5, times=None)
+    coalescer = EditCoalescer(stub_client, interval=0, concurrency=1)
+    edits = [coalescer.edit(**edit_kwargs(f"m{i}", "text")) for i in range(3)]
+
+    started = time.monotonic()
+    coalescer.close(timeout=0.2)
+
+    assert time.monotonic() - started < 0.4
+    with pytest.raises(RuntimeError):
+        edits[-1].result()
+    assert edits[0].result(timeout=5)
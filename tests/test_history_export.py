@@ -0,0 +1,76 @@
+import io
+import json
+import os
+import sys
+
+from amojowrapper.__main__ import EXPORT_RATE, create_parser, read_lines
+from amojowrapper.bulk import HistoryExporter
+
+
+def history_items(conversation: str, total: int) -> list:
+    # Oldest first, the stub serves the newest message first
+    return [
+        {
+            "timestamp": 1700000000 - i,
+            "sender": {"id": "sender"},
+            "message": {"id": f"{conversation}-{i}", "type": "text", "text": "hi"},
+        }
+        for i in reversed(range(total))
+    ]
+
+
+def test_history_export_resumes(tmp_path, amojo_stub, stub_client):
+    conversations = ["conv-3", "conv-12", "broken-2", "conv-0", "conv-3"]
+
+    for conversation in ("conv-3", "conv-12", "broken-2"):
+        total = int(conversation.split("-")[1])
+        amojo_stub.add_messages(conversation, history_items(conversation, total))
+    amojo_stub.add_fault(status=400, times=None, path_contains="/broken-2/")
+    exporter = HistoryExporter(stub_client, str(tmp_path), page_size=5)
+
+    stats = exporter.export(conversations)
+    assert stats.conversations == 4
+    assert stats.completed == 3
+    assert stats.failed_ids == ["broken-2"]
+    assert "400" in stats.errors["broken-2"]
+    assert stats.messages == 15
+    with open(exporter.manifest_path, "rb") as manifest:
+        records = [json.loads(line) for line in manifest]
+    (failed,) = [record for record in records if record["status"] == "failed"]
+    assert failed["conversation_ref_id"] == "broken-2"
+    assert failed["error"] == stats.errors["broken-2"]
+
+    amojo_stub.clear_faults()
+    stats = exporter.export(conversations)
+    assert stats.skipped == 3
+    assert stats.completed == 1
+
+    with open(tmp_path / "conv-12.jsonl", "rb") as file:
+        rows = [json.loads(line) for line in file]
+    assert [row["message"]["id"] for row in rows] == [f"conv-12-{i}" for i in range(12)]
+    assert rows[0]["conversation_ref_id"] == "conv-12"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+    assert exporter.completed_ids() == {"conv-3", "conv-12", "conv-0", "broken-2"}
+
+
+def test_history_export_keeps_files_in_output_dir(tmp_path, stub_client):
+    output_dir = tmp_path / "export"
+    exporter = HistoryExporter(stub_client, str(output_dir))
+
+    for ref_id in ("../../etc/x", "/etc/x", "..", "a\\b", "c:x"):
+        path = exporter._file_path(ref_id)
+        assert os.path.dirname(path) == str(output_dir)
+    assert exporter._file_path("conv-1") == str(output_dir / "conv-1.jsonl")
+
+
+def test_export_command_reads_stdin_and_limits_rate(monkeypatch):
+    stdin = io.StringIO("conv-1\n\n conv-2 \n")
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    assert list(read_lines("-")) == ["conv-1", "conv-2"]
+    assert not stdin.closed
+
+    args = create_parser().parse_args(
+        ["export-history", "--ids", "-", "--output", "export"]
+    )
+    assert args.rate == EXPORT_RATE
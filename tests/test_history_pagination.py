@@ -0,0 +1,77 @@
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from amojowrapper.actions import AsyncHistoryAction, HistoryAction
+from amojowrapper.client import AmojoClient, AsyncAmojoClient
+
+TOTAL = 23
+
+
+def history_item(index: int) -> dict:
+    # The newest message comes first
+    return {
+        "timestamp": 1700000000 - index,
+        "sender": {"id": "sender"},
+        "message": {"id": f"message-{index}", "type": "text", "text": str(index)},
+    }
+
+
+@pytest.fixture
+def history_stub(amojo_stub):
+    amojo_stub.add_messages("ref", [history_item(i) for i in reversed(range(TOTAL))])
+    return amojo_stub
+
+
+def requested_offsets(stub) -> list:
+    """Returns the offsets of the history requests received by the stub."""
+    offsets = [
+        int(parse_qs(urlsplit(request.path).query)["offset"][0])
+        for request in stub.requests
+    ]
+    stub.requests.clear()
+    return offsets
+
+
+def test_iter_messages_pages_lazily(history_stub, stub_client_kwargs):
+    with AmojoClient(**stub_client_kwargs) as client:
+        history = HistoryAction(client)
+
+        ids = [item.message.id for item in history.iter_messages("ref", 10)]
+        assert ids == [f"message-{i}" for i in range(TOTAL)]
+        assert requested_offsets(history_stub) == [0, 10, 20]
+
+        for index, item in enumerate(history.iter_messages("ref", 10)):
+            if index == 4:
+                break
+        assert requested_offsets(history_stub) == [0]
+
+        recent = list(history.iter_messages("ref", 5, since=1700000000 - 7))
+        assert len(recent) == 8
+        assert requested_offsets(history_stub) == [0, 5]
+
+
+def test_async_iter_messages(history_stub, stub_client_kwargs):
+    async def collect():
+        async with AsyncAmojoClient(**stub_client_kwargs) as client:
+            history = AsyncHistoryAction(client)
+            return [item.message.id async for item in history.iter_messages("ref", 10)]
+
+    ids = asyncio.run(collect())
+
+    assert ids == [f"message-{i}" for i in range(TOTAL)]
+
+
+def test_iter_messages_rejects_empty_pages(history_stub, stub_client_kwargs):
+    async def collect():
+        async with AsyncAmojoClient(**stub_client_kwargs) as client:
+            history = AsyncHistoryAction(client)
+            return [item async for item in history.iter_messages("ref", 0)]
+
+    with AmojoClient(**stub_client_kwargs) as client:
+        with pytest.raises(ValueError):
+            list(HistoryAction(client).iter_messages("ref", 0))
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+    assert history_stub.requests == []
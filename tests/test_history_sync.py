@@ -0,0 +1,92 @@
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from amojowrapper.actions.history.schemes import MessageItem
+from amojowrapper.sync import HistoryStore, HistorySync
+from amojowrapper.webhook import WebhookEvent
+
+
+def history_item(index: int) -> dict:
+    return {
+        "timestamp": 1700000000 + index,
+        "sender": {"id": "sender"},
+        "message": {"id": f"message-{index}", "type": "text", "text": str(index)},
+    }
+
+
+def requests_made(stub) -> list:
+    """Returns the offsets of the history requests received since the last call."""
+    offsets = [
+        int(parse_qs(urlsplit(request.path).query)["offset"][0])
+        for request in stub.requests
+    ]
+    stub.requests.clear()
+    return offsets
+
+
+def webhook_event(index: int) -> WebhookEvent:
+    return WebhookEvent.model_validate(
+        {
+            "account_id": "account",
+            "message": {
+                "receiver": {"id": "receiver"},
+                "sender": {"id": "sender"},
+                "conversation": {"id": "ref"},
+                "timestamp": 1700000000 + index,
+                "message": {"id": f"message-{index}", "type": "text", "text": "hook"},
+            },
+        }
+    )
+
+
+def test_incremental_sync_merges_webhooks(amojo_stub, stub_client):
+    amojo_stub.add_messages("ref", [history_item(i) for i in range(12)])
+    sync = HistorySync(stub_client, HistoryStore(":memory:"), page_size=5)
+
+    messages = sync.get("ref")
+    assert [m.message.id for m in messages][:2] == ["message-11", "message-10"]
+    assert len(messages) == 12
+    assert requests_made(amojo_stub) == [0, 5, 10]
+
+    # A webhook message is served without touching the API
+    sync.on_webhook(webhook_event(12))
+    assert sync.get("ref", limit=1)[0].message.text == "hook"
+    assert requests_made(amojo_stub) == []
+
+    # The next sync only fetches the newest page and deduplicates
+    amojo_stub.add_messages("ref", [history_item(12), history_item(13)])
+    assert sync.sync("ref") == 3
+    assert requests_made(amojo_stub) == [0]
+    messages = sync.get("ref", refresh=False)
+    assert len(messages) == 14
+    assert messages[0].message.id == "message-13"
+
+    stats = sync.store.stats()
+    assert stats.conversations == 1
+    assert stats.messages == 14
+
+
+def test_store_serves_cached_reads_without_parsing():
+    store = HistoryStore(":memory:")
+    store.upsert("ref", [MessageItem(**history_item(i)) for i in range(200)])
+
+    assert len(store.get_messages("ref")) == 200
+    with mock.patch.object(
+        MessageItem, "model_validate_json", side_effect=AssertionError
+    ):
+        for _ in range(100):
+            assert len(store.get_messages("ref", limit=50)) == 50
+    stats = store.stats()
+    assert stats.hits == 100
+    assert stats.misses == 1
+
+
+def test_store_returns_copies_only_on_request():
+    store = HistoryStore(":memory:")
+    store.upsert("ref", [MessageItem(**history_item(0))])
+
+    assert store.get_messages("ref")[0] is store.get_messages("ref")[0]
+    copies = store.get_messages("ref", copy=True)
+    assert isinstance(copies, tuple)
+    copies[0].message.text = "changed"
+    assert store.get_messages("ref")[0].message.text == "0"
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from amojowrapper.dispatch import AsyncLaneDispatcher, LaneDispatcher
+
+
+def test_calls_are_ordered_per_conversation_and_parallel_across():
+    calls = []
+    running = set()
+    overlap = []
+    lock = threading.Lock()
+
+    def send(conversation_id, index):
+        with lock:
+            overlap.append(len(running))
+            running.add(conversation_id)
+        time.sleep(0.01)
+        with lock:
+            running.discard(conversation_id)
+            calls.append((conversation_id, index))
+        return index
+
+    with LaneDispatcher(lanes=8) as lanes:
+        futures = [
+            lanes.dispatch(send, conversation_id=f"conv-{c}", index=i)
+            for i in range(10)
+            for c in range(4)
+        ]
+        assert [f.result() for f in futures] == [i for i in range(10) for _ in range(4)]
+        stats = lanes.stats()
+
+    for c in range(4):
+        assert [i for conv, i in calls if conv == f"conv-{c}"] == list(range(10))
+    assert max(overlap) > 0
+    assert (stats.submitted, stats.completed, stats.failed) == (40, 40, 0)
+    assert stats.depths == [0] * 8
+    assert stats.max_depth >= 10
+
+
+def test_failures_do_not_stop_the_lane():
+    def fail():
+        raise RuntimeError("boom")
+
+    with LaneDispatcher(lanes=2) as lanes:
+        failed = lanes.submit("conv", fail)
+        succeeded = lanes.submit("conv", lambda: "ok")
+        assert succeeded.result(timeout=5) == "ok"
+        with pytest.raises(RuntimeError):
+            failed.result()
+        assert lanes.stats().failed == 1
+
+    with pytest.raises(ValueError):
+        LaneDispatcher(lanes=1).dispatch(print, text="no conversation")
+
+
+def test_async_calls_are_ordered_per_conversation():
+    calls = []
+
+    async def send(conversation_ref_id, index):
+        await asyncio.sleep(0.001 * (5 - index % 5))
+        calls.append((conversation_ref_id, index))
+
+    async def scenario():
+        async with AsyncLaneDispatcher(lanes=4) as lanes:
+            futures = [
+                await lanes.dispatch(send, conversation_ref_id=f"ref-{c}", index=i)
+                for i in range(10)
+                for c in range(3)
+            ]
+            await asyncio.gather(*futures)
+            return lanes.stats()
+
+    stats = asyncio.run(scenario())
+    for c in range(3):
+        assert [i for ref, i in calls if ref == f"ref-{c}"] == list(range(10))
+    assert stats.completed == 30
+
+
+def test_async_cancelled_call_does_not_stop_the_lane():
+    async def cancel():
+        raise asyncio.CancelledError()
+
+    async def ok():
+        return "ok"
+
+    async def scenario():
+        async with AsyncLaneDispatcher(lanes=1) as lanes:
+            cancelled = await lanes.submit("conv", cancel)
+            succeeded = await lanes.submit("conv", ok)
+            assert await asyncio.wait_for(succeeded, 5) == "ok"
+            assert cancelled.cancelled()
+            return lanes.stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats.completed, stats.failed) == (1, 1)
@@ -0,0 +1,44 @@
+import pytest
+
+from amojowrapper.actions import MessageAction
+from amojowrapper.client import AmojoClient
+
+
+@pytest.fixture
+def offline_client():
+    return AmojoClient(
+        channel_secret="secret",
+        channel_id="channel",
+        referer="test.amocrm.ru",
+        amojo_account_token="account",
+    )
+
+
+def test_message_payload_validation_levels(offline_client):
+    kwargs = {
+        "timestamp": 1700000000,
+        "msec_timestamp": 1700000000000,
+        "msgid": "msgid",
+        "message_type": "text",
+        "message_text": "payload",
+        "conversation_ref_id": "conversation",
+        "sender_ref_id": "sender",
+        "receiver_ref_id": "receiver",
+        "reply_to_msgid": "reply",
+    }
+
+    bodies = []
+    for validation in ("strict", "trusted"):
+        message = MessageAction(offline_client, validation=validation)
+        components = message._create_send_components(kwargs)
+        bodies.append(message._build_request_body("new_message", kwargs, **components))
+
+    assert bodies[0] == bodies[1]
+    assert bodies[0]["payload"]["reply_to"] == {"message": {"msgid": "reply"}}
+
+
+def test_message_payload_strict_rejects_invalid(offline_client):
+    message = MessageAction(offline_client)
+
+    with pytest.raises(RuntimeError):
+        message.send(message_type="text", conversation_id="conversation")
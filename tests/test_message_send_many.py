@@ -0,0 +1,85 @@
+import asyncio
+
+from amojowrapper.actions import AsyncMessageAction, MessageAction
+from amojowrapper.client import AmojoClient, AsyncAmojoClient
+from amojowrapper.mapping import ConversationMapping, ConversationMappingStore
+
+
+def build_messages():
+    messages = [
+        {
+            "message_type": "text",
+            "message_text": str(i),
+            "conversation_id": f"conversation-{i % 3}",
+            "sender_id": "sender",
+        }
+        for i in range(12)
+    ]
+    messages.insert(5, {"message_type": "text", "conversation_id": "invalid"})
+    return messages
+
+
+def check_results(results, stub):
+    assert len(results) == 13
+    assert not results[5].ok
+    assert all(result.ok for i, result in enumerate(results) if i != 5)
+    assert results[0].response.new_message.ref_id == results[0].msgid
+
+    received = [
+        (
+            request.body["payload"]["conversation_id"],
+            request.body["payload"]["message"]["text"],
+        )
+        for request in stub.requests
+    ]
+    for conversation in range(3):
+        texts = [
+            text for conv, text in received if conv == f"conversation-{conversation}"
+        ]
+        assert texts == [str(i) for i in range(conversation, 12, 3)]
+
+
+def test_message_send_many(amojo_stub, stub_client):
+    results = MessageAction(stub_client).send_many(build_messages(), concurrency=3)
+
+    check_results(results, amojo_stub)
+
+
+def test_async_message_send_many(amojo_stub, stub_client_kwargs):
+    async def send_all():
+        async with AsyncAmojoClient(**stub_client_kwargs) as client:
+            message = AsyncMessageAction(client)
+            return await message.send_many(build_messages(), concurrency=3)
+
+    results = asyncio.run(send_all())
+
+    check_results(results, amojo_stub)
+
+
+def test_send_many_groups_conversation_ids_and_ref_ids(stub_client_kwargs):
+    store = ConversationMappingStore()
+    store.put(
+        "channel_account",
+        ConversationMapping(conversation_id="mapped", ref_id="mapped-ref"),
+    )
+    text = {"message_type": "text", "sender_id": "sender"}
+    messages = [
+        {**text, "message_text": "0", "conversation_id": "mapped"},
+        {**text, "message_text": "1", "conversation_ref_id": "mapped-ref"},
+        {**text, "message_text": "2", "conversation_id": "linked"},
+        {**text, "message_text": "3", "conversation_ref_id": "linked-ref"},
+        {
+            **text,
+            "message_text": "4",
+            "conversation_id": "linked",
+            "conversation_ref_id": "linked-ref",
+        },
+    ]
+
+    with AmojoClient(**stub_client_kwargs, mapping_store=store) as client:
+        _, groups = MessageAction(client)._prepare_batch(messages)
+
+    assert [[result.index for result, _ in group] for group in groups] == [
+        [0, 1],
+        [2, 3, 4],
+    ]
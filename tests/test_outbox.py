@@ -0,0 +1,108 @@
+import sqlite3
+import threading
+
+import pytest
+
+from amojowrapper.outbox import Outbox
+
+
+def test_outbox_delivers_after_restart(tmp_path, amojo_stub, stub_client):
+    path = str(tmp_path / "outbox.sqlite3")
+
+    with Outbox(stub_client, path=path) as outbox:
+        msgid = outbox.send_message(
+            msgid="outbox-msgid",
+            message_type="text",
+            message_text="outbox",
+            conversation_id="conversation",
+            sender_id="sender",
+        )
+        # A duplicate append with the same msgid is ignored
+        outbox.send_message(
+            msgid=msgid,
+            message_type="text",
+            message_text="outbox",
+            conversation_id="conversation",
+            sender_id="sender",
+        )
+        # Identical status updates and reactions are journaled once
+        for _ in range(2):
+            outbox.set_delivery_status(msgid="incoming-msgid", delivery_status=1)
+            outbox.set_react(
+                conversation_id="conversation",
+                id="message-id",
+                user_id="user",
+                type="react",
+                emoji="+",
+            )
+
+        # A transient error stops the drain before anything is sent
+        amojo_stub.add_fault(status=503)
+        assert outbox.drain() == 0
+        assert outbox.stats().pending == 3
+
+    # The journal survives a restart
+    with Outbox(stub_client, path=path) as outbox:
+        amojo_stub.add_fault(status=400)
+        assert outbox.drain() == 2
+        stats = outbox.stats()
+        assert (stats.acked, stats.failed, stats.pending) == (2, 1, 0)
+        assert outbox.compact() == 2
+
+    received = [request for request in amojo_stub.requests if request.status == 200]
+    assert [request.path.rsplit("/", 1)[-1] for request in received] == [
+        "delivery_status",
+        "react",
+    ]
+    assert received[0].body["msgid"] == "incoming-msgid"
+
+
+def test_sender_survives_unexpected_errors(tmp_path, stub_client):
+    outbox = Outbox(
+        stub_client, path=str(tmp_path / "outbox.sqlite3"), poll_interval=0.01
+    )
+    drained = threading.Event()
+    calls = []
+
+    def drain():
+        calls.append(1)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        drained.set()
+        return 0
+
+    outbox.drain = drain
+    with outbox:
+        outbox.start()
+        assert drained.wait(timeout=5)
+        assert outbox._thread.is_alive()
+
+
+def test_drain_acks_sent_items_on_unexpected_errors(tmp_path, stub_client):
+    outbox = Outbox(stub_client, path=str(tmp_path / "outbox.sqlite3"))
+    for index in range(3):
+        outbox.set_delivery_status(msgid=f"msgid-{index}", delivery_status=1)
+    outbox.store._connection.execute(
+        "UPDATE outbox SET body = '{' WHERE key LIKE '%msgid-1%'"
+    )
+    custom_request = stub_client.custom_request
+
+    def flaky_request(**kwargs):
+        if "msgid-2" in kwargs["endpoint"]:
+            raise ConnectionResetError("reset by peer")
+        return custom_request(**kwargs)
+
+    with outbox:
+        stub_client.custom_request = flaky_request
+        try:
+            with pytest.raises(ConnectionResetError):
+                outbox.drain()
+        finally:
+            del stub_client.custom_request
+        stats = outbox.stats()
+        assert (stats.acked, stats.failed, stats.pending) == (1, 1, 1)
+
+        # Acked items are kept for the retention period after their ack
+        outbox.store._connection.execute("UPDATE outbox SET created_at = 0")
+        assert outbox.compact(older_than=60) == 0
+        assert outbox.compact() == 1
@@ -0,0 +1,76 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from amojowrapper.request import RateLimiter
+
+
+def test_rate_limiter_blocks_per_scope():
+    limiter = RateLimiter(rate=20, burst=1, family_rates={"typing": 20})
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda _: limiter.acquire("scope"), range(5)))
+    elapsed = time.monotonic() - start
+
+    # Other scopes do not wait, separately limited families still take a scope token
+    assert limiter.acquire("other-scope") == 0
+    assert limiter.acquire("scope", "typing") > 0
+
+    stats = limiter.stats()
+    assert elapsed >= 0.15
+    assert stats.acquired == 7
+    assert stats.delayed == 5
+    assert stats.waiting == 0
+    assert stats.buckets == 3
+
+
+def test_family_rate_is_bounded_by_scope_rate():
+    limiter = RateLimiter(rate=10, burst=1, family_rates={"typing": 1000})
+
+    assert limiter.acquire("scope", "typing") == 0
+    assert limiter.acquire("scope", "messages") > 0
+
+
+def test_idle_buckets_are_evicted():
+    limiter = RateLimiter(rate=1000, idle_timeout=0.01)
+
+    for i in range(50):
+        limiter.acquire(f"scope-{i}")
+    time.sleep(0.02)
+    limiter.acquire("scope-new")
+
+    stats = limiter.stats()
+    assert stats.evicted_buckets == 50
+    assert stats.buckets == 1
+
+
+def test_rate_limiter_async():
+    limiter = RateLimiter(rate=20, burst=1)
+
+    async def acquire_all():
+        return await asyncio.gather(
+            *(limiter.acquire_async("scope", "messages") for _ in range(3))
+        )
+
+    delays = asyncio.run(acquire_all())
+    assert delays[0] == 0
+    assert 0 < delays[1] < delays[2]
+
+
+def test_cancelled_acquire_refunds_token():
+    limiter = RateLimiter(rate=10, burst=1)
+
+    async def cancel_waiter():
+        await limiter.acquire_async("scope")
+        waiter = asyncio.ensure_future(limiter.acquire_async("scope"))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        # Only the first token is still reserved
+        return await limiter.acquire_async("scope")
+
+    delay = asyncio.run(cancel_waiter())
+    assert delay < 0.15
+    stats = limiter.stats()
+    assert (stats.refunded, stats.waiting) == (1, 0)
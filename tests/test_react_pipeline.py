@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from amojowrapper.actions import ReactPipeline
+
+
+def react(pipeline, msgid, emoji, type="react"):
+    return pipeline.set(
+        conversation_id="conv", id=msgid, user_id="bot", emoji=emoji, type=type
+    )
+
+
+def test_reactions_are_deduplicated_and_cancelled(amojo_stub, stub_client, capsys):
+    amojo_stub.add_fault(status=400, times=None, body_contains='"broken"')
+    with ReactPipeline(stub_client, window=0.2) as pipeline:
+        liked = react(pipeline, "m1", "👍")
+        assert react(pipeline, "m1", "👍") is liked
+        # The state of ❤️ is unknown, so only the latest reaction is sent
+        toggled = react(pipeline, "m1", "❤️")
+        untoggled = react(pipeline, "m1", "❤️", type="unreact")
+        broken = react(pipeline, "broken", "👍")
+        assert pipeline.flush(timeout=5)
+
+        repeated = react(pipeline, "m1", "👍").result()
+        # 👍 is known to be set, so unsetting and setting it again cancel out
+        unliked = react(pipeline, "m1", "👍", type="unreact")
+        reliked = react(pipeline, "m1", "👍")
+        assert pipeline.flush(timeout=5)
+        stats = pipeline.stats()
+
+        with pytest.raises(ValueError):
+            pipeline.set(emoji="👍")
+
+    reactions = [
+        (request.body["id"], request.body["type"], request.body["emoji"])
+        for request in amojo_stub.requests
+    ]
+    assert sorted(reactions) == [
+        ("broken", "react", "👍"),
+        ("m1", "react", "👍"),
+        ("m1", "unreact", "❤️"),
+    ]
+    assert liked.result().status == "sent"
+    assert liked.result().status_code == 200
+    assert toggled.result().status == "cancelled"
+    assert untoggled.result().status == "sent"
+    assert unliked.result().status == reliked.result().status == "cancelled"
+    assert broken.result().status == "failed"
+    assert broken.result().error
+    assert capsys.readouterr().out == ""
+    assert repeated.status == "deduplicated"
+    assert (stats.requested, stats.sent, stats.failed) == (8, 2, 1)
+    assert (stats.deduplicated, stats.cancelled, stats.pending) == (2, 3, 0)
+
+
+def test_close_timeout_fails_unsent_reactions(amojo_stub, stub_client):
+    amojo_stub.add_fault(latency=0.5, times=None)
+    pipeline = ReactPipeline(stub_client, window=0, concurrency=1)
+    reactions = [react(pipeline, f"m{i}", "👍") for i in range(3)]
+
+    started = time.monotonic()
+    pipeline.close(timeout=0.2)
+
+    assert time.monotonic() - started < 0.4
+    unsent = reactions[-1].result()
+    assert (unsent.status, unsent.error) == (
+        "failed",
+        "the react pipeline closed before sending",
+    )
+    assert reactions[0].result(timeout=5).status == "sent"
+    assert pipeline.stats().failed == 2
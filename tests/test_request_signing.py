@@ -0,0 +1,38 @@
+from amojowrapper.actions import TypingAction
+from amojowrapper.client import AmojoClient
+from amojowrapper.helpers.headers import AmojoHeaderBuilder, AmojoSigner
+from amojowrapper.helpers.serializer import stdlib_json_encoder
+
+CHANNEL_SECRET = "secret"
+
+
+def test_signed_body_is_sent_verbatim(amojo_stub, stub_client_kwargs):
+    # The stub answers 403 unless Content-MD5 and X-Signature match the body
+    for encoder in (None, stdlib_json_encoder):
+        with AmojoClient(**stub_client_kwargs, json_encoder=encoder) as client:
+            typing = TypingAction(client)
+            assert typing.send(conversation_id="conversation", sender_id="sender")
+
+    assert [request.status for request in amojo_stub.requests] == [204, 204]
+
+
+def test_signer_matches_header_builder():
+    signer = AmojoSigner(CHANNEL_SECRET)
+    endpoint = "/v2/origin/custom/channel_account/typing"
+
+    for payload in (b'{"conversation_id": "c"}', '{"conversation_id": "c"}', b""):
+        headers = signer.sign("POST", endpoint, payload)
+
+        builder = AmojoHeaderBuilder()
+        builder.headers["Date"] = headers["Date"]
+        expected = (
+            builder.add_content_type()
+            .add_content_md5(payload)
+            .add_signature(CHANNEL_SECRET, "POST", endpoint, payload)
+            .build()
+        )
+        assert headers == expected
+
+    reference = AmojoHeaderBuilder().add_date().build()["Date"]
+    assert len(signer.get_date()) == len(reference)
+    assert signer.get_date()[-4:] == reference[-4:] == " GMT"
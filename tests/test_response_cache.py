@@ -0,0 +1,111 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests import Response
+
+from amojowrapper.client import AmojoClient, AsyncAmojoClient
+from amojowrapper.request import RequestError, ResponseCache
+
+ENDPOINT = "/v2/origin/custom/channel_account/chats/ref/history"
+
+
+@pytest.fixture
+def slow_stub(amojo_stub):
+    amojo_stub.add_fault(latency=0.2, times=None, family="history")
+    return amojo_stub
+
+
+def make_response(size: int) -> Response:
+    response = Response()
+    response._content = b"x" * size
+    response.status_code = 200
+    return response
+
+
+def test_concurrent_gets_share_one_request(slow_stub, stub_client_kwargs):
+    cache = ResponseCache(family_ttls={"history": 60})
+
+    with AmojoClient(**stub_client_kwargs, response_cache=cache) as client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(
+                executor.map(lambda _: client.custom_request("GET", ENDPOINT), range(8))
+            )
+        client.custom_request("GET", ENDPOINT)
+
+    assert len(slow_stub.requests) == 1
+    assert all(r.json() == {"messages": []} for r in responses)
+    stats = cache.stats()
+    assert stats.misses == 1
+    assert stats.coalesced + stats.hits == 8
+    assert stats.entries == 1
+
+
+def test_async_gets_share_one_request(slow_stub, stub_client_kwargs):
+    cache = ResponseCache()
+
+    async def fetch_all():
+        async with AsyncAmojoClient(
+            **stub_client_kwargs, response_cache=cache
+        ) as client:
+            return await asyncio.gather(
+                *(client.custom_request("GET", ENDPOINT) for _ in range(5))
+            )
+
+    responses = asyncio.run(fetch_all())
+
+    assert len(slow_stub.requests) == 1
+    assert len(responses) == 5
+    assert cache.stats().coalesced == 4
+
+
+def test_ttl_eviction_and_errors():
+    cache = ResponseCache(max_bytes=100, default_ttl=0.05, family_ttls={"chats": 0})
+
+    cache.get_or_fetch("a", "history", lambda: make_response(60))
+    cache.get_or_fetch("b", "history", lambda: make_response(60))
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.entries == 1
+    assert stats.size_bytes == 60
+
+    time.sleep(0.06)
+    cache.get_or_fetch("b", "history", lambda: make_response(60))
+    assert cache.stats().expirations == 1
+
+    cache.get_or_fetch("c", "chats", lambda: make_response(10))
+    assert cache.invalidate() == 1
+    assert cache.stats().entries == 0
+
+    def fail():
+        raise RequestError("boom", status_code=500)
+
+    with pytest.raises(RequestError):
+        cache.get_or_fetch("d", "history", fail)
+    assert cache.stats().entries == 0
+
+
+def test_async_leader_cancellation_hands_over_the_fetch():
+    cache = ResponseCache()
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        await asyncio.sleep(0.05)
+        return make_response(10)
+
+    async def run():
+        leader = asyncio.create_task(cache.get_or_fetch_async("a", "history", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_or_fetch_async("a", "history", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    response = asyncio.run(run())
+
+    assert response.content == b"x" * 10
+    assert len(calls) == 2
@@ -0,0 +1,72 @@
+import pytest
+
+from amojowrapper.actions import ChatAction, MessageAction
+from amojowrapper.client import AmojoClient
+from amojowrapper.request import RequestError, RetryPolicy
+
+
+def test_retry_policy_resends_same_msgid(amojo_stub, stub_client_kwargs):
+    amojo_stub.add_fault(status=429, times=2, family="messages", retry_after=0)
+    policy = RetryPolicy(max_attempts=3, backoff_base=0.01)
+
+    with AmojoClient(**stub_client_kwargs, retry_policy=policy) as client:
+        message = MessageAction(client)
+
+        result = message.send(
+            message_type="text",
+            message_text="retry",
+            conversation_id="conversation",
+            sender_id="sender",
+        )
+        attempts = [request.body["payload"]["msgid"] for request in amojo_stub.requests]
+        assert len(attempts) == 3
+        assert set(attempts) == {result.new_message.ref_id}
+
+        # Client errors are not retried
+        amojo_stub.add_fault(status=400)
+        with pytest.raises(RuntimeError):
+            message.send(
+                message_type="text",
+                message_text="retry",
+                conversation_id="invalid",
+                sender_id="sender",
+            )
+        assert len(amojo_stub.requests) == 4
+
+    assert policy.stats().retries == {"messages": 2}
+
+
+def test_retry_policy_does_not_resend_chat_creation(amojo_stub, stub_client_kwargs):
+    policy = RetryPolicy(max_attempts=3, backoff_base=0)
+    chat = dict(conversation_id="conversation", user_id="user", user_name="Ann")
+
+    with AmojoClient(**stub_client_kwargs, retry_policy=policy) as client:
+        # A 5xx may come after the chat was created, so it is not resent
+        amojo_stub.add_fault(status=503, family="chats")
+        with pytest.raises(RequestError):
+            ChatAction(client).create(**chat)
+        assert len(amojo_stub.requests) == 1
+
+        # A 429 shows the request was not processed, so it is resent
+        amojo_stub.add_fault(status=429, family="chats", retry_after=0)
+        assert ChatAction(client).create(**chat).id
+        assert len(amojo_stub.requests) == 3
+
+    assert policy.stats().retries == {"chats": 1}
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+
+    assert [policy.get_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert 0 <= RetryPolicy(backoff_base=1).get_delay(3) <= 4
+
+    # A huge Retry-After is capped like the backoff
+    error = RequestError("throttled", status_code=429, headers={"Retry-After": "3600"})
+    assert policy.get_delay(1, error) == 5
+
+    # Non-finite values fall back to the backoff
+    for value in ("nan", "inf", "-inf"):
+        headers = {"Retry-After": value}
+        error = RequestError("throttled", status_code=429, headers=headers)
+        assert policy.get_delay(2, error) == 2
@@ -0,0 +1,44 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from amojowrapper.request import AmojoSession
+
+
+def test_session_pool_reuses_connections(amojo_stub):
+    # The raw session sends unsigned requests
+    amojo_stub.verify_signature = False
+    url = f"{amojo_stub.base_url}/v2/origin/custom/channel_account/chats/ref/history"
+
+    with AmojoSession(pool_maxsize=2) as session:
+        for _ in range(3):
+            assert session.request("GET", url).status_code == 200
+
+        stats = session.stats()
+        assert stats.requests == 3
+        assert stats.new_connections == 1
+        assert stats.reused_connections == 2
+
+
+def test_session_recycles_only_when_idle_and_refuses_after_close(amojo_stub):
+    amojo_stub.verify_signature = False
+    url = f"{amojo_stub.base_url}/v2/origin/custom/channel_account/chats/ref/history"
+    amojo_stub.add_fault(latency=0.3, times=1)
+
+    session = AmojoSession(keepalive_timeout=0.1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow = executor.submit(session.request, "GET", url)
+        time.sleep(0.2)
+        # The slow request is still in flight, so its session is kept
+        assert session.request("GET", url).status_code == 200
+        assert slow.result().status_code == 200
+    assert session.stats().recycled_sessions == 0
+
+    time.sleep(0.15)
+    session.request("GET", url)
+    assert session.stats().recycled_sessions == 1
+
+    session.close()
+    with pytest.raises(RuntimeError):
+        session.request("GET", url)
@@ -0,0 +1,64 @@
+import pytest
+
+from amojowrapper.actions import ChatAction, HistoryAction, MessageAction
+from amojowrapper.client import AmojoClient
+from amojowrapper.request import RequestError, RetryPolicy
+from amojowrapper.testing import StubAmojoServer
+
+
+def create_client(stub, secret="secret", **kwargs):
+    return AmojoClient(
+        channel_secret=secret,
+        channel_id="channel",
+        referer="test.amocrm.ru",
+        amojo_account_token="account",
+        base_url=stub.base_url,
+        **kwargs,
+    )
+
+
+def test_stub_keeps_chats_and_history():
+    with StubAmojoServer(channel_secret="secret") as stub:
+        with create_client(stub) as client:
+            chat = ChatAction(client).create(
+                conversation_id="conv", user_id="user", user_name="Ann"
+            )
+            message = MessageAction(client)
+            for text in ("one", "two"):
+                response = message.send(
+                    conversation_id="conv",
+                    sender_id="user",
+                    sender_name="Ann",
+                    message_type="text",
+                    message_text=text,
+                )
+            assert response.new_message.conversation_id == chat.id
+
+            history = HistoryAction(client).get(conversation_ref_id=chat.id)
+
+    assert [item.message.text for item in history.messages] == ["two", "one"]
+    assert [request.status for request in stub.requests] == [200] * 4
+
+
+def test_stub_rejects_bad_signatures():
+    with StubAmojoServer(channel_secret="secret") as stub:
+        with create_client(stub, secret="wrong") as client:
+            with pytest.raises(RuntimeError, match="403"):
+                HistoryAction(client).get(conversation_ref_id="ref")
+
+
+def test_stub_injects_faults():
+    with StubAmojoServer(channel_secret="secret") as stub:
+        stub.add_fault(status=429, times=2, family="typing", retry_after=0)
+        stub.add_fault(status=503, times=None, path_contains="broken")
+        policy = RetryPolicy(max_attempts=3, backoff_base=0)
+        with create_client(stub, retry_policy=policy) as client:
+            client.custom_request(
+                "POST", "/v2/origin/custom/channel_account/typing", {}
+            )
+            with pytest.raises(RequestError):
+                client.custom_request(
+                    "POST", "/v2/origin/custom/channel_account/broken/react", {}
+                )
+
+    assert [r.status for r in stub.requests] == [429, 429, 204, 503, 503, 503]
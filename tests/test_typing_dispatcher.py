@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+from amojowrapper.actions import AsyncTypingDispatcher, TypingDispatcher
+from amojowrapper.client import AsyncAmojoClient
+
+
+def typing_seen(stub) -> list:
+    return [request.body["conversation_id"] for request in stub.requests]
+
+
+def test_typing_events_are_coalesced_per_window(amojo_stub, stub_client):
+    with TypingDispatcher(stub_client, window=0.2) as typing:
+        for _ in range(50):
+            typing.send(conversation_id="conv-1", sender_id="bot")
+            typing.send(conversation_id="conv-2", sender_id="bot")
+        typing.flush()
+        time.sleep(0.25)
+        assert typing.send(conversation_id="conv-1", sender_id="bot")
+        typing.flush()
+        stats = typing.stats()
+
+    assert sorted(typing_seen(amojo_stub)) == ["conv-1", "conv-1", "conv-2"]
+    assert stats.requested == 101
+    assert stats.sent == 3
+    assert stats.suppressed == 98
+    assert stats.pending == 0
+
+
+def test_async_typing_events_are_coalesced(amojo_stub, stub_client_kwargs):
+    async def scenario():
+        async with AsyncAmojoClient(**stub_client_kwargs) as client:
+            async with AsyncTypingDispatcher(client, window=60) as typing:
+                for _ in range(20):
+                    typing.send(conversation_id="conv-3", sender_id="bot")
+                await typing.flush()
+                return typing.stats()
+
+    stats = asyncio.run(scenario())
+
+    assert typing_seen(amojo_stub) == ["conv-3"]
+    assert (stats.sent, stats.suppressed) == (1, 19)
@@ -0,0 +1,130 @@
+import asyncio
+import hashlib
+import hmac
+import json
+
+import aiohttp
+from loguru import logger
+
+from amojowrapper.webhook import WebhookDispatcher, WebhookEvent, WebhookServer
+
+SECRET = "secret"
+
+PAYLOAD = json.dumps(
+    {
+        "account_id": "account",
+        "time": 1700000000,
+        "message": {
+            "receiver": {"id": "receiver", "client_id": "client"},
+            "sender": {"id": "sender"},
+            "conversation": {"id": "conversation", "client_id": "ref"},
+            "timestamp": 1700000000,
+            "msec_timestamp": 1700000000000,
+            "message": {"id": "message", "type": "text", "text": "hello"},
+        },
+    }
+).encode()
+
+
+def sign(body: bytes) -> str:
+    return hmac.new(SECRET.encode(), body, hashlib.sha1).hexdigest()
+
+
+def test_webhook_server_dispatches_events():
+    received = []
+
+    async def scenario():
+        gate = asyncio.Event()
+        dispatcher = WebhookDispatcher(workers=2, queue_size=10)
+
+        @dispatcher.on("message")
+        async def on_message(event: WebhookEvent):
+            await gate.wait()
+            received.append(event.message.message.text)
+
+        server = WebhookServer(SECRET, dispatcher, host="127.0.0.1", port=0)
+        async with server:
+            url = f"http://127.0.0.1:{server.bound_port}/"
+            async with aiohttp.ClientSession() as session:
+                statuses = []
+                for _ in range(3):
+                    async with session.post(
+                        url, data=PAYLOAD, headers={"X-Signature": sign(PAYLOAD)}
+                    ) as response:
+                        statuses.append(response.status)
+                async with session.post(
+                    url, data=PAYLOAD, headers={"X-Signature": "bad"}
+                ) as response:
+                    statuses.append(response.status)
+                async with session.get(url + "metrics") as response:
+                    metrics = await response.json()
+            # Handlers were still blocked while every webhook was answered.
+            gate.set()
+        return statuses, metrics, dispatcher.stats()
+
+    statuses, metrics, stats = asyncio.run(scenario())
+
+    assert statuses == [200, 200, 200, 401]
+    assert metrics["received"] == 3
+    assert received == ["hello"] * 3
+    assert stats.processed == 3
+    assert stats.queued == 0
+
+
+def test_webhook_dispatcher_rejects_when_full():
+    async def scenario():
+        dispatcher = WebhookDispatcher(workers=1, queue_size=1)
+        gate = asyncio.Event()
+        dispatcher.add_handler("*", lambda event: None)
+
+        @dispatcher.on("message")
+        async def blocked(event):
+            await gate.wait()
+
+        await dispatcher.start()
+        event = WebhookEvent.model_validate_json(PAYLOAD)
+        results = [await dispatcher.dispatch(event) for _ in range(3)]
+        await asyncio.sleep(0)
+        results.append(await dispatcher.dispatch(event))
+        gate.set()
+        await dispatcher.stop()
+        return results, dispatcher.stats()
+
+    results, stats = asyncio.run(scenario())
+
+    assert results[0] is True
+    assert False in results
+    assert stats.rejected == results.count(False)
+    assert stats.processed == results.count(True)
+
+
+def test_webhook_handler_errors_are_logged():
+    async def scenario():
+        dispatcher = WebhookDispatcher(workers=1)
+
+        @dispatcher.on("message")
+        def broken(event):
+            raise KeyError("missing field")
+
+        await dispatcher.start()
+        await dispatcher.dispatch(WebhookEvent.model_validate_json(PAYLOAD))
+        await dispatcher.stop()
+        return dispatcher.stats()
+
+    logged = []
+    sink = logger.add(logged.append, level="ERROR")
+    try:
+        stats = asyncio.run(scenario())
+    finally:
+        logger.remove(sink)
+
+    assert stats.failed == 1
+    (record,) = logged
+    assert "broken" in record
+    assert "KeyError: 'missing field'" in record
+
+
+def test_webhook_event_type():
+    assert WebhookEvent.model_validate_json(PAYLOAD).event_type == "message"
+    event = WebhookEvent.model_validate({"account_id": "a", "typing": {"x": 1}})
+    assert event.event_type == "typing"
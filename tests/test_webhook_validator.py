@@ -0,0 +1,35 @@
+import hashlib
+import hmac
+from types import SimpleNamespace
+
+from amojowrapper.validators.webhook import WebhookValidator
+
+BODY = b'{"account_id": "account", "time": 1700000000}'
+
+
+def sign(body: bytes, secret: str = "secret") -> str:
+    return hmac.new(secret.encode(), body, hashlib.sha1).hexdigest()
+
+
+def test_validate_bytes_matches_validate():
+    validator = WebhookValidator(SimpleNamespace(channel_secret="secret"))
+    signature = sign(BODY)
+
+    for payload in (BODY, b"\r\n" + BODY + b"\n", bytearray(BODY), memoryview(BODY)):
+        assert validator.validate_bytes(payload, signature)
+        assert validator.validate_bytes(payload, signature.encode())
+    assert validator.validate(BODY.decode() + "\r\n", signature)
+
+    assert not validator.validate_bytes(BODY, sign(BODY, "other"))
+    assert not validator.validate_bytes(BODY, "")
+    assert not validator.validate_bytes(BODY, "не подпись")
+
+
+def test_validate_bytes_follows_secret_change():
+    client = SimpleNamespace(channel_secret="secret")
+    validator = WebhookValidator(client)
+    assert validator.validate_bytes(BODY, sign(BODY))
+
+    client.channel_secret = "rotated"
+    assert not validator.validate_bytes(BODY, sign(BODY))
+    assert validator.validate_bytes(BODY, sign(BODY, "rotated"))